@@ -1,4 +1,5 @@
+from learning_compiler.agent.async_loop import run_agent_async
 from learning_compiler.agent.loop import run_agent
 from learning_compiler.agent.state import AgentProfile, AgentRunConfig, AgentResult
 
-__all__ = ["run_agent", "AgentProfile", "AgentRunConfig", "AgentResult"]
+__all__ = ["run_agent", "run_agent_async", "AgentProfile", "AgentRunConfig", "AgentResult"]
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from learning_compiler.agent.deciders.base import Decider
+from learning_compiler.agent.session import agent_session
+from learning_compiler.agent.state import AgentResult, AgentRunConfig
+from learning_compiler.llm.adapter import AsyncLLMAdapter
+from learning_compiler.llm.fake_model import AsyncFakeLLM
+from learning_compiler.sim.faults import FaultPlan
+from learning_compiler.types import IncidentType
+
+
+async def run_agent_async(
+    *,
+    config: AgentRunConfig,
+    out_dir: Path,
+    incident_override: IncidentType | None = None,
+    llm: AsyncLLMAdapter | None = None,
+    fault_plan: FaultPlan | None = None,
+    decider: Decider | None = None,
+) -> AgentResult:
+    """Async twin of `run_agent`: awaits the model, runs everything else inline.
+
+    Drives the same `agent_session` as the sync loop, so the journal is
+    byte-identical to `run_agent` for the same seed and model outputs.
+    """
+
+    model = llm if llm is not None else AsyncFakeLLM(seed=config.seed, rng_mode=config.rng_mode)
+    session = agent_session(
+        config=config,
+        out_dir=out_dir,
+        incident_override=incident_override,
+        fault_plan=fault_plan,
+        decider=decider,
+    )
+    try:
+        context = next(session)
+        while True:
+            context = session.send(await model.propose_next_action(context=context))
+    except StopIteration as stop:
+        result: AgentResult = stop.value
+        return result
@@ -22,31 +22,43 @@ class LLMBasedDecider:
         self._scrub_untrusted = scrub_untrusted
 
     def decide(self, *, state: AgentState, hypotheses: Hypotheses | None) -> Decision:
-        obs_for_llm = (
-            _scrub_observations(state.observations) if self._scrub_untrusted else state.observations
-        )
-        ctx = LLMContext(
-            step_id=state.step_id,
-            state_summary=_state_summary(state=state, hypotheses=hypotheses),
-            observations=list(obs_for_llm),
-            allowed_action_types=[  # explicit allowlist in-context (still enforced by policy/validator)
-                "OBSERVE_METRICS",
-                "OBSERVE_LOGS",
-                "OBSERVE_HEALTH",
-                "RUNBOOK_SEARCH",
-                "ACT_RESTART",
-                "ACT_ROLLBACK",
-                "ASK_USER",
-                "FINAL",
-            ],
-        )
+        ctx = build_llm_context(state=state, hypotheses=hypotheses, scrub_untrusted=self._scrub_untrusted)
         raw = self._llm.propose_next_action(context=ctx)
-        try:
-            action = parse_action_proposal(raw)
-            return Decision(action=action, model_proposal=raw)
-        except ActionValidationError as e:
-            fallback = _fallback_action(state=state)
-            return Decision(action=fallback, model_proposal=raw, validation_error=str(e))
+        return decision_from_proposal(state=state, raw=raw)
+
+
+def build_llm_context(
+    *, state: AgentState, hypotheses: Hypotheses | None, scrub_untrusted: bool
+) -> LLMContext:
+    """First half of an LLM decision: everything before the model call."""
+
+    obs_for_llm = _scrub_observations(state.observations) if scrub_untrusted else state.observations
+    return LLMContext(
+        step_id=state.step_id,
+        state_summary=_state_summary(state=state, hypotheses=hypotheses),
+        observations=list(obs_for_llm),
+        allowed_action_types=[  # explicit allowlist in-context (still enforced by policy/validator)
+            "OBSERVE_METRICS",
+            "OBSERVE_LOGS",
+            "OBSERVE_HEALTH",
+            "RUNBOOK_SEARCH",
+            "ACT_RESTART",
+            "ACT_ROLLBACK",
+            "ASK_USER",
+            "FINAL",
+        ],
+    )
+
+
+def decision_from_proposal(*, state: AgentState, raw: str) -> Decision:
+    """Second half of an LLM decision: validate the proposal or fall back."""
+
+    try:
+        action = parse_action_proposal(raw)
+        return Decision(action=action, model_proposal=raw)
+    except ActionValidationError as e:
+        fallback = _fallback_action(state=state)
+        return Decision(action=fallback, model_proposal=raw, validation_error=str(e))
 
 
 def _fallback_action(*, state: AgentState) -> Action:
@@ -8,30 +8,19 @@ from learning_compiler.agent.actions import (
     ObserveLogs,
     ObserveMetrics,
 )
-from learning_compiler.agent.deciders.base import Decider
-from learning_compiler.agent.deciders.llm_based import LLMBasedDecider
-from learning_compiler.agent.deciders.rule_based import RuleBasedDecider
 from learning_compiler.agent.hypotheses import Hypotheses
 from learning_compiler.agent.state import AgentProfile, AgentResult, AgentState, ResultStatus
 from learning_compiler.journal.models import JournalKind
 from learning_compiler.journal.writer import RunJournalWriter
-from learning_compiler.llm.fake_model import FakeLLM
 from learning_compiler.sim.tools import RawSimTools
 from learning_compiler.types import ConfidenceLevel, JSONValue
+from learning_compiler.utils.rng import RngMode
 
 
 def at_least(profile: AgentProfile, target: AgentProfile) -> bool:
     return _profile_rank(profile) >= _profile_rank(target)
 
 
-def make_decider(*, profile: AgentProfile, seed: int) -> Decider:
-    if profile is AgentProfile.WEEK1:
-        return RuleBasedDecider()
-    llm = FakeLLM(seed=seed)
-    scrub = at_least(profile, AgentProfile.WEEK5)
-    return LLMBasedDecider(llm=llm, scrub_untrusted=scrub)
-
-
 def make_reliable_tools(*, raw: RawSimTools, profile: AgentProfile):
     from learning_compiler.agent.tools_wrapped import ReliableTools
 
@@ -39,7 +28,9 @@ def make_reliable_tools(*, raw: RawSimTools, profile: AgentProfile):
     return ReliableTools(raw=raw, max_attempts=max_attempts)
 
 
-def step_snapshot(*, state: AgentState, hypotheses: Hypotheses | None) -> dict[str, JSONValue]:
+def step_snapshot(
+    *, state: AgentState, hypotheses: Hypotheses | None, rng_mode: RngMode = RngMode.COMPAT
+) -> dict[str, JSONValue]:
     snap: dict[str, JSONValue] = {
         "step_id": state.step_id,
         "tool_calls": state.tool_calls,
@@ -50,6 +41,9 @@ def step_snapshot(*, state: AgentState, hypotheses: Hypotheses | None) -> dict[s
             "max_side_effect_actions": state.budget.max_side_effect_actions,
         },
     }
+    # Only non-default modes are recorded, so compat journals keep their bytes.
+    if rng_mode is not RngMode.COMPAT:
+        snap["rng_mode"] = rng_mode.value
     if hypotheses is not None:
         snap["hypotheses"] = [
             {
@@ -124,6 +118,7 @@ def finalize(
         final_summary=summary,
         journal_path=journal_path,
         unsafe_action_attempts=state.unsafe_action_attempts,
+        metrics=journal.tally.snapshot(),
     )
 
 
@@ -5,7 +5,11 @@ from enum import StrEnum
 from pathlib import Path
 import random
 
+from learning_compiler.journal.models import JournalFormat
+from learning_compiler.journal.tally import RunMetrics
+from learning_compiler.journal.writer import DEFAULT_DURABILITY, JournalDurability
 from learning_compiler.types import Budget, DEFAULT_BUDGET, JSONValue, RunId
+from learning_compiler.utils.rng import RngMode
 
 
 class AgentProfile(StrEnum):
@@ -27,11 +31,21 @@ class AgentRunConfig:
     seed: int
     profile: AgentProfile
     budget: Budget = DEFAULT_BUDGET
+    # How eagerly the run journal reaches disk; never changes its contents.
+    durability: JournalDurability = DEFAULT_DURABILITY
+    journal_format: JournalFormat = JournalFormat.JSONL
+    # Write a byte-offset sidecar (`JournalIndex`) next to a plain JSONL journal.
+    journal_index: bool = False
+    # COMPAT reproduces the historical journals; COUNTER makes every draw index-addressable.
+    rng_mode: RngMode = RngMode.COMPAT
 
     def validate(self) -> None:
         if self.seed < 0:
             raise ValueError("seed must be non-negative")
         self.budget.validate()
+        self.durability.validate()
+        if self.journal_index and self.journal_format is not JournalFormat.JSONL:
+            raise ValueError("journal_index needs the plain JSONL journal format")
 
 
 @dataclass(slots=True)
@@ -77,9 +91,11 @@ class AgentResult:
     final_summary: str
     journal_path: Path
     unsafe_action_attempts: int
+    # Per-run eval facts tallied at write time; None means "recompute from the journal".
+    metrics: RunMetrics | None = None
 
     def to_json(self) -> dict[str, JSONValue]:
-        return {
+        out: dict[str, JSONValue] = {
             "run_id": str(self.run_id),
             "profile": self.profile.value,
             "seed": self.seed,
@@ -89,3 +105,39 @@ class AgentResult:
             "journal_path": str(self.journal_path),
             "unsafe_action_attempts": self.unsafe_action_attempts,
         }
+        if self.metrics is not None:
+            out["metrics"] = self.metrics.to_json()
+        return out
+
+    @classmethod
+    def from_json(cls, obj: JSONValue) -> AgentResult:
+        """Inverse of `to_json` (for results.jsonl, caches and shard merges)."""
+
+        if not isinstance(obj, dict):
+            raise ValueError("agent result must be a JSON object")
+        metrics_obj = obj.get("metrics")
+        return cls(
+            run_id=RunId(_expect_str(obj, "run_id")),
+            profile=AgentProfile(_expect_str(obj, "profile")),
+            seed=_expect_int(obj, "seed"),
+            status=ResultStatus(_expect_str(obj, "status")),
+            steps=_expect_int(obj, "steps"),
+            final_summary=_expect_str(obj, "final_summary"),
+            journal_path=Path(_expect_str(obj, "journal_path")),
+            unsafe_action_attempts=_expect_int(obj, "unsafe_action_attempts"),
+            metrics=RunMetrics.from_json(metrics_obj) if metrics_obj is not None else None,
+        )
+
+
+def _expect_str(obj: dict[str, JSONValue], key: str) -> str:
+    v = obj.get(key)
+    if not isinstance(v, str):
+        raise ValueError(f"{key} must be a string")
+    return v
+
+
+def _expect_int(obj: dict[str, JSONValue], key: str) -> int:
+    v = obj.get(key)
+    if not isinstance(v, int) or isinstance(v, bool):
+        raise ValueError(f"{key} must be an int")
+    return v
@@ -0,0 +1,18 @@
+from learning_compiler.bench.baseline import Regression, compare_to_baseline, load_baseline, save_baseline
+from learning_compiler.bench.journal_read import JournalReadBench, bench_journal_read
+from learning_compiler.bench.suite import BenchCell, run_cell, run_grid
+from learning_compiler.bench.world_history import WorldHistoryBench, bench_world_history
+
+__all__ = [
+    "BenchCell",
+    "JournalReadBench",
+    "Regression",
+    "WorldHistoryBench",
+    "bench_journal_read",
+    "bench_world_history",
+    "compare_to_baseline",
+    "load_baseline",
+    "run_cell",
+    "run_grid",
+    "save_baseline",
+]
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+import json
+
+from learning_compiler.bench.suite import BenchCell
+from learning_compiler.types import JSONValue
+from learning_compiler.utils.json import canonical_dumps
+
+_BASELINE_FORMAT = 1
+
+
+class BaselineError(Exception):
+    pass
+
+
+@dataclass(slots=True, frozen=True)
+class Regression:
+    key: tuple[str, int, int]
+    metric: str
+    baseline: float
+    current: float
+
+    def describe(self) -> str:
+        profile, seeds, workers = self.key
+        return (
+            f"{profile} seeds={seeds} workers={workers}: {self.metric} "
+            f"{self.current:.3f} vs baseline {self.baseline:.3f}"
+        )
+
+
+def save_baseline(path: Path, cells: Sequence[BenchCell]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    cell_docs: list[JSONValue] = [c.to_json() for c in cells]
+    doc: dict[str, JSONValue] = {"format": _BASELINE_FORMAT, "cells": cell_docs}
+    path.write_text(canonical_dumps(doc) + "\n", encoding="utf-8")
+
+
+def load_baseline(path: Path) -> list[BenchCell]:
+    try:
+        doc: object = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as e:
+        raise BaselineError(f"{path}: unreadable baseline") from e
+    if not isinstance(doc, dict) or doc.get("format") != _BASELINE_FORMAT:
+        raise BaselineError(f"{path}: unsupported baseline format")
+    cells = doc.get("cells")
+    if not isinstance(cells, list):
+        raise BaselineError(f"{path}: cells must be a list")
+    try:
+        return [BenchCell.from_json(c) for c in cells]
+    except ValueError as e:
+        raise BaselineError(f"{path}: invalid cell") from e
+
+
+def compare_to_baseline(
+    *, current: Sequence[BenchCell], baseline: Sequence[BenchCell], tolerance: float = 0.15
+) -> list[Regression]:
+    """Flag cells that got slower (or fatter) than baseline by more than `tolerance`.
+
+    Only cells present in both runs are compared. Higher is better for runs/sec;
+    lower is better for p90 step latency and peak RSS.
+    """
+
+    if tolerance < 0.0:
+        raise ValueError("tolerance must be non-negative")
+
+    by_key = {c.key: c for c in baseline}
+    regressions: list[Regression] = []
+    for cell in current:
+        base = by_key.get(cell.key)
+        if base is None:
+            continue
+        if cell.runs_per_second < base.runs_per_second * (1.0 - tolerance):
+            regressions.append(_regression(cell, "runs_per_second", base.runs_per_second, cell.runs_per_second))
+        base_p90 = base.step_latency_us.get("p90", 0.0)
+        cur_p90 = cell.step_latency_us.get("p90", 0.0)
+        if base_p90 > 0.0 and cur_p90 > base_p90 * (1.0 + tolerance):
+            regressions.append(_regression(cell, "step_latency_us.p90", base_p90, cur_p90))
+        if cell.peak_rss_kb > base.peak_rss_kb * (1.0 + tolerance):
+            regressions.append(_regression(cell, "peak_rss_kb", float(base.peak_rss_kb), float(cell.peak_rss_kb)))
+    return regressions
+
+
+def _regression(cell: BenchCell, metric: str, baseline: float, current: float) -> Regression:
+    return Regression(key=cell.key, metric=metric, baseline=baseline, current=current)
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+import tempfile
+import time
+
+from learning_compiler.agent.loop import run_agent
+from learning_compiler.agent.state import AgentProfile, AgentRunConfig
+from learning_compiler.journal.convert import convert_journal
+from learning_compiler.journal.models import JournalFormat, JournalKind
+from learning_compiler.journal.reader import iter_journal, read_journal
+from learning_compiler.journal.scan import JournalScanner
+from learning_compiler.journal.writer import RunJournalWriter
+from learning_compiler.types import JSONValue, RunId
+
+
+@dataclass(slots=True, frozen=True)
+class JournalReadBench:
+    """Best-of-N read times for one large journal, per reader mode."""
+
+    events: int
+    journal_bytes: int
+    seconds: dict[str, float]
+
+    def events_per_second(self, mode: str) -> float:
+        t = self.seconds[mode]
+        return self.events / t if t > 0.0 else 0.0
+
+    def to_json(self) -> dict[str, JSONValue]:
+        return {
+            "events": self.events,
+            "journal_bytes": self.journal_bytes,
+            "seconds": {k: round(v, 6) for k, v in self.seconds.items()},
+        }
+
+    def to_markdown(self) -> str:
+        base = self.seconds["validated"]
+        lines = []
+        lines.append(f"# Journal read ({self.events} events, {self.journal_bytes} bytes JSONL)")
+        lines.append("")
+        lines.append("| Mode | Seconds | Events/sec | Speedup |")
+        lines.append("|---|---:|---:|---:|")
+        for mode, t in self.seconds.items():
+            speedup = base / t if t > 0.0 else 0.0
+            lines.append(f"| {mode} | {t:.4f} | {self.events_per_second(mode):.0f} | {speedup:.2f}x |")
+        return "\n".join(lines)
+
+
+def write_bench_journal(path: Path, *, events: int, profile: AgentProfile = AgentProfile.WEEK5) -> int:
+    """Write one `events`-long journal by re-logging real runs' events back to back."""
+
+    if events <= 0:
+        raise ValueError("events must be positive")
+    written = 0
+    with tempfile.TemporaryDirectory(prefix="simopsbot-bench-") as tmp, RunJournalWriter(
+        path, run_id=RunId(f"bench-{profile.value}")
+    ) as journal:
+        seed = 0
+        while written < events:
+            result = run_agent(config=AgentRunConfig(seed=seed, profile=profile), out_dir=Path(tmp))
+            for e in read_journal(result.journal_path, validate=False):
+                if written == events:
+                    break
+                journal.log(step_id=written // 8, kind=e.kind, payload=e.payload)
+                written += 1
+            seed += 1
+    return written
+
+
+def bench_journal_read(*, events: int = 50_000, repeats: int = 5) -> JournalReadBench:
+    """Time `read_journal`/`iter_journal` modes on one synthetic `events`-long journal."""
+
+    if repeats <= 0:
+        raise ValueError("repeats must be positive")
+    with tempfile.TemporaryDirectory(prefix="simopsbot-bench-") as tmp:
+        path = Path(tmp) / "bench.jsonl"
+        write_bench_journal(path, events=events)
+        binary = Path(tmp) / "bench.sojb"
+        convert_journal(path, binary, to=JournalFormat.BINARY)
+
+        modes: dict[str, Callable[[], object]] = {
+            "validated": lambda: read_journal(path),
+            "trusted": lambda: read_journal(path, validate=False),
+            "trusted_stream": lambda: sum(1 for _ in iter_journal(path, validate=False)),
+            "binary": lambda: read_journal(binary),
+            # Not a full read: the mmap scan decodes ACTION events only.
+            "scan_action": lambda: _scan_count(path, JournalKind.ACTION),
+        }
+        seconds = {mode: _best_of(fn, repeats=repeats) for mode, fn in modes.items()}
+        return JournalReadBench(events=events, journal_bytes=path.stat().st_size, seconds=seconds)
+
+
+def _scan_count(path: Path, kind: JournalKind) -> int:
+    with JournalScanner(path) as scanner:
+        return sum(1 for _ in scanner.events([kind]))
+
+
+def _best_of(fn: Callable[[], object], *, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
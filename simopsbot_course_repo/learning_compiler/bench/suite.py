@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from itertools import chain, pairwise
+from pathlib import Path
+import multiprocessing
+import resource
+import tempfile
+import time
+
+from learning_compiler.agent.deciders.base import Decider, Decision
+from learning_compiler.agent.deciders.rule_based import RuleBasedDecider
+from learning_compiler.agent.hypotheses import Hypotheses
+from learning_compiler.agent.session import agent_session
+from learning_compiler.agent.state import AgentProfile, AgentRunConfig, AgentState
+from learning_compiler.eval.scenario_generator import incident_for_seed
+from learning_compiler.llm.fake_model import FakeLLM
+from learning_compiler.types import JSONValue
+
+
+@dataclass(slots=True, frozen=True)
+class BenchCell:
+    """Measurements for one (profile, seed count, worker count) grid cell."""
+
+    profile: AgentProfile
+    seeds: int
+    workers: int
+    wall_seconds: float
+    runs_per_second: float
+    step_latency_us: dict[str, float]
+    peak_rss_kb: int
+
+    @property
+    def key(self) -> tuple[str, int, int]:
+        return (self.profile.value, self.seeds, self.workers)
+
+    def to_json(self) -> dict[str, JSONValue]:
+        return {
+            "profile": self.profile.value,
+            "seeds": self.seeds,
+            "workers": self.workers,
+            "wall_seconds": round(self.wall_seconds, 6),
+            "runs_per_second": round(self.runs_per_second, 3),
+            "step_latency_us": {k: round(v, 3) for k, v in self.step_latency_us.items()},
+            "peak_rss_kb": self.peak_rss_kb,
+        }
+
+    @classmethod
+    def from_json(cls, obj: JSONValue) -> BenchCell:
+        if not isinstance(obj, dict):
+            raise ValueError("bench cell must be a JSON object")
+        latency = obj.get("step_latency_us")
+        if not isinstance(latency, dict):
+            raise ValueError("step_latency_us must be an object")
+        return cls(
+            profile=AgentProfile(str(obj.get("profile"))),
+            seeds=_as_int(obj.get("seeds")),
+            workers=_as_int(obj.get("workers")),
+            wall_seconds=_as_float(obj.get("wall_seconds")),
+            runs_per_second=_as_float(obj.get("runs_per_second")),
+            step_latency_us={str(k): _as_float(v) for k, v in latency.items()},
+            peak_rss_kb=_as_int(obj.get("peak_rss_kb")),
+        )
+
+
+def run_grid(
+    *, profiles: Sequence[AgentProfile], seed_counts: Sequence[int], worker_counts: Sequence[int]
+) -> list[BenchCell]:
+    """Measure every grid cell, each in a fresh interpreter so peak RSS is per-cell."""
+
+    cells: list[BenchCell] = []
+    ctx = multiprocessing.get_context("spawn")
+    for profile in profiles:
+        for n_seeds in seed_counts:
+            for workers in worker_counts:
+                with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as isolated:
+                    cell = isolated.submit(run_cell, profile=profile, n_seeds=n_seeds, workers=workers)
+                    cells.append(cell.result())
+    return cells
+
+
+def run_cell(*, profile: AgentProfile, n_seeds: int, workers: int) -> BenchCell:
+    """Run seeds 0..n_seeds-1 end to end (journals included) and time them.
+
+    Latency percentiles are over every step of every run, not per-run means.
+    """
+
+    if n_seeds <= 0 or workers <= 0:
+        raise ValueError("n_seeds and workers must be positive")
+
+    with tempfile.TemporaryDirectory(prefix="simopsbot-bench-") as tmp:
+        timed = partial(_timed_run, profile=profile, runs_dir=Path(tmp))
+        started = time.perf_counter()
+        if workers == 1:
+            runs = [timed(seed) for seed in range(n_seeds)]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                runs = list(pool.map(timed, range(n_seeds), chunksize=max(1, n_seeds // (workers * 4))))
+        wall = time.perf_counter() - started
+
+    per_step_us = sorted(seconds * 1e6 for seconds in chain.from_iterable(runs))
+    peak_rss_kb = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    return BenchCell(
+        profile=profile,
+        seeds=n_seeds,
+        workers=workers,
+        wall_seconds=wall,
+        runs_per_second=n_seeds / wall if wall > 0.0 else 0.0,
+        step_latency_us={
+            "p50": _percentile(per_step_us, 50),
+            "p90": _percentile(per_step_us, 90),
+            "p99": _percentile(per_step_us, 99),
+        },
+        peak_rss_kb=peak_rss_kb,
+    )
+
+
+def _timed_run(seed: int, *, profile: AgentProfile, runs_dir: Path) -> list[float]:
+    """One run's step latencies in seconds, driven like `run_agent`.
+
+    A step runs from one decision to the next (or to the end of the run), so
+    the samples cover the model call, tools and journal writes but not setup.
+    The session only yields for model decisions; week 1's rule-based decisions
+    are timed through `_TimedDecider`.
+    """
+
+    config = AgentRunConfig(seed=seed, profile=profile)
+    marks: list[float] = []
+    decider = _TimedDecider(RuleBasedDecider(), marks) if profile is AgentProfile.WEEK1 else None
+    model = FakeLLM(seed=seed, rng_mode=config.rng_mode)
+    session = agent_session(
+        config=config, out_dir=runs_dir, incident_override=incident_for_seed(seed), decider=decider
+    )
+    try:
+        context = next(session)
+        while True:
+            marks.append(time.perf_counter())
+            context = session.send(model.propose_next_action(context=context))
+    except StopIteration:
+        marks.append(time.perf_counter())
+    return [end - start for start, end in pairwise(marks)]
+
+
+class _TimedDecider:
+    def __init__(self, inner: Decider, marks: list[float]) -> None:
+        self._inner = inner
+        self._marks = marks
+
+    def decide(self, *, state: AgentState, hypotheses: Hypotheses | None) -> Decision:
+        self._marks.append(time.perf_counter())
+        return self._inner.decide(state=state, hypotheses=hypotheses)
+
+
+def _percentile(sorted_values: Sequence[float], pct: int) -> float:
+    # Nearest-rank percentile: deterministic and good enough for latency reporting.
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-pct * len(sorted_values) // 100))
+    return sorted_values[rank - 1]
+
+
+def _as_int(v: JSONValue) -> int:
+    if not isinstance(v, int) or isinstance(v, bool):
+        raise ValueError("expected int")
+    return v
+
+
+def _as_float(v: JSONValue) -> float:
+    if not isinstance(v, (int, float)) or isinstance(v, bool):
+        raise ValueError("expected number")
+    return float(v)
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import time
+import tracemalloc
+
+from learning_compiler.sim.world import METRICS_DELAY_STEPS, SimWorld, WorldConfig
+from learning_compiler.types import IncidentType, JSONValue, ScenarioSeed
+
+
+@dataclass(slots=True, frozen=True)
+class WorldHistoryBench:
+    """Memory held by one `SimWorld` as it ticks, and its tick rate."""
+
+    ticks: int
+    max_delay_steps: int
+    # (ticks so far, bytes allocated since the world was created and still live)
+    retained: tuple[tuple[int, int], ...]
+    seconds: float
+
+    @property
+    def ticks_per_second(self) -> float:
+        return self.ticks / self.seconds if self.seconds > 0.0 else 0.0
+
+    @property
+    def growth_bytes(self) -> int:
+        """Retained bytes at the last checkpoint minus the first."""
+
+        return self.retained[-1][1] - self.retained[0][1]
+
+    def to_json(self) -> dict[str, JSONValue]:
+        return {
+            "ticks": self.ticks,
+            "max_delay_steps": self.max_delay_steps,
+            "retained": [[t, b] for t, b in self.retained],
+            "seconds": round(self.seconds, 6),
+        }
+
+    def to_markdown(self) -> str:
+        lines = []
+        lines.append(f"# World history ({self.ticks} ticks, max_delay_steps={self.max_delay_steps})")
+        lines.append("")
+        lines.append(f"{self.ticks_per_second:.0f} ticks/sec untraced; growth {self.growth_bytes} bytes")
+        lines.append("")
+        lines.append("| Ticks | Retained bytes |")
+        lines.append("|---:|---:|")
+        for t, b in self.retained:
+            lines.append(f"| {t} | {b} |")
+        return "\n".join(lines)
+
+
+def bench_world_history(
+    *, ticks: int = 1_000_000, max_delay_steps: int = METRICS_DELAY_STEPS, checkpoints: int = 6
+) -> WorldHistoryBench:
+    """Tick one world `ticks` times, tracing live memory at log-spaced checkpoints."""
+
+    if ticks <= 0 or checkpoints <= 0:
+        raise ValueError("ticks and checkpoints must be positive")
+    config = WorldConfig(
+        seed=ScenarioSeed(0), incident=IncidentType.DB_SATURATION, max_delay_steps=max_delay_steps
+    )
+    marks = sorted({max(1, round(ticks ** ((i + 1) / checkpoints))) for i in range(checkpoints)})
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        world = SimWorld(config)
+        retained: list[tuple[int, int]] = []
+        done = 0
+        for mark in marks:
+            for _ in range(mark - done):
+                world.tick()
+            done = mark
+            world.true_metrics(service="api", delay_steps=max_delay_steps)
+            retained.append((done, tracemalloc.get_traced_memory()[0] - before))
+    finally:
+        tracemalloc.stop()
+
+    # Timed separately: tracing slows allocation-heavy code several-fold.
+    world = SimWorld(config)
+    start = time.perf_counter()
+    for _ in range(ticks):
+        world.tick()
+    seconds = time.perf_counter() - start
+    return WorldHistoryBench(
+        ticks=ticks, max_delay_steps=max_delay_steps, retained=tuple(retained), seconds=seconds
+    )
@@ -1,5 +1,6 @@
+from learning_compiler.eval.async_runner import run_eval_async
 from learning_compiler.eval.metrics import EvalMetrics, compute_metrics
 from learning_compiler.eval.runner import run_eval
 from learning_compiler.eval.scenario_generator import incident_for_seed
 
-__all__ = ["EvalMetrics", "compute_metrics", "run_eval", "incident_for_seed"]
+__all__ = ["EvalMetrics", "compute_metrics", "run_eval", "run_eval_async", "incident_for_seed"]
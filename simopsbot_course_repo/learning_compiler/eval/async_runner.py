@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from pathlib import Path
+import asyncio
+
+from learning_compiler.agent.async_loop import run_agent_async
+from learning_compiler.agent.state import AgentProfile, AgentResult, AgentRunConfig
+from learning_compiler.eval.gate import GateThresholds
+from learning_compiler.eval.runner import EvalReport, finish_eval
+from learning_compiler.eval.scenario_generator import incident_for_seed
+from learning_compiler.llm.adapter import AsyncLLMAdapter
+from learning_compiler.llm.fake_model import AsyncFakeLLM
+
+AsyncLLMFactory = Callable[[int], AsyncLLMAdapter]
+
+
+async def run_eval_async(
+    *,
+    profile: AgentProfile,
+    seeds: Sequence[int],
+    out_dir: Path,
+    thresholds: GateThresholds | None = None,
+    concurrency: int = 64,
+    llm_factory: AsyncLLMFactory | None = None,
+) -> EvalReport:
+    """Run the eval suite on one event loop, at most `concurrency` runs in flight.
+
+    For I/O-bound model adapters. `llm_factory(seed)` builds a fresh adapter per
+    run (default: `AsyncFakeLLM`), so runs share no state and every journal and
+    summary is byte-identical to `run_eval` regardless of interleaving.
+    """
+
+    if concurrency <= 0:
+        raise ValueError("concurrency must be positive")
+    make_llm = llm_factory if llm_factory is not None else _default_llm
+
+    runs_dir = out_dir / "runs"
+    runs_dir.mkdir(parents=True, exist_ok=True)
+
+    results: list[AgentResult | None] = [None] * len(seeds)
+    pending = iter(enumerate(seeds))
+
+    async def worker() -> None:
+        # Workers share one iterator, so only `concurrency` runs (tasks, models, open
+        # journals) exist at once; the finished results are kept for the report.
+        for i, seed in pending:
+            results[i] = await run_agent_async(
+                config=AgentRunConfig(seed=seed, profile=profile),
+                out_dir=runs_dir,
+                incident_override=incident_for_seed(seed),
+                llm=make_llm(seed),
+            )
+
+    async with asyncio.TaskGroup() as tg:
+        for _ in range(min(concurrency, len(seeds))):
+            tg.create_task(worker())
+
+    return finish_eval(
+        profile=profile,
+        seeds=seeds,
+        results=[r for r in results if r is not None],
+        out_dir=out_dir,
+        thresholds=thresholds,
+    )
+
+
+def _default_llm(seed: int) -> AsyncLLMAdapter:
+    return AsyncFakeLLM(seed=seed)
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from contextlib import closing
+from dataclasses import dataclass
+import dataclasses
+from functools import lru_cache
+from pathlib import Path
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+from learning_compiler.agent.state import AgentProfile, AgentResult, AgentRunConfig
+from learning_compiler.eval.gate import GateThresholds
+from learning_compiler.eval.parallel import iter_seed_results, run_seeds
+from learning_compiler.journal.models import JournalFormat
+from learning_compiler.utils.json import canonical_dumps
+
+_CACHE_FORMAT = 1
+_RESULT_FILE = "result.json"
+_JOURNAL_FILE = "journal.jsonl"
+_MIN_BATCH = 64
+
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+
+@dataclass(slots=True, frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evicted: int
+
+    def since(self, earlier: CacheStats) -> CacheStats:
+        """Counts accumulated after `earlier` was taken (stats are cumulative per cache)."""
+
+        return CacheStats(
+            hits=self.hits - earlier.hits,
+            misses=self.misses - earlier.misses,
+            evicted=self.evicted - earlier.evicted,
+        )
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResultCache:
+    """Persistent on-disk cache of `AgentResult` + journal, keyed by run inputs.
+
+    Keys are content addresses over (seed, profile, budget, thresholds, source
+    fingerprint), so any edit under `learning_compiler/` invalidates every entry.
+    Entries are evicted least-recently-used once the cache exceeds `max_bytes`;
+    a hit refreshes the entry's mtime.
+    """
+
+    def __init__(self, root: Path, *, max_bytes: int = DEFAULT_CACHE_MAX_BYTES) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self._root = root
+        self._max_bytes = max_bytes
+        self._root.mkdir(parents=True, exist_ok=True)
+        self._hits = 0
+        self._misses = 0
+        self._evicted = 0
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(hits=self._hits, misses=self._misses, evicted=self._evicted)
+
+    def key_for(self, *, config: AgentRunConfig, thresholds: GateThresholds) -> str:
+        material = canonical_dumps(
+            {
+                "format": _CACHE_FORMAT,
+                "seed": config.seed,
+                "profile": config.profile.value,
+                "journal_format": config.journal_format.value,
+                "budget": {
+                    "max_steps": config.budget.max_steps,
+                    "max_tool_calls": config.budget.max_tool_calls,
+                    "max_side_effect_actions": config.budget.max_side_effect_actions,
+                },
+                "thresholds": {
+                    "min_recovery_success_rate": thresholds.min_recovery_success_rate,
+                    "max_mean_steps": thresholds.max_mean_steps,
+                    "min_evidence_compliance_rate": thresholds.min_evidence_compliance_rate,
+                    "max_unsafe_action_attempt_rate": thresholds.max_unsafe_action_attempt_rate,
+                },
+                "source": source_fingerprint(),
+            }
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def contains(self, *, key: str) -> bool:
+        """Whether `key` has an entry (not counted; `get` counts hits and misses)."""
+
+        return (self._entry_dir(key) / _RESULT_FILE).exists()
+
+    def get(self, *, key: str, runs_dir: Path) -> AgentResult | None:
+        """Return the cached result and restore its journal into `runs_dir`."""
+
+        entry = self._entry_dir(key)
+        result_path = entry / _RESULT_FILE
+        try:
+            cached = AgentResult.from_json(json.loads(result_path.read_text(encoding="utf-8")))
+            journal_bytes = (entry / _JOURNAL_FILE).read_bytes()
+        except (OSError, ValueError):
+            # Missing or corrupt entries are plain misses.
+            self._misses += 1
+            return None
+
+        runs_dir.mkdir(parents=True, exist_ok=True)
+        journal_path = runs_dir / cached.journal_path.name
+        journal_path.write_bytes(journal_bytes)
+        os.utime(result_path)
+        self._hits += 1
+        return dataclasses.replace(cached, journal_path=journal_path)
+
+    def put(self, *, key: str, result: AgentResult) -> None:
+        entry = self._entry_dir(key)
+        if entry.exists():
+            return
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        # Build the entry in a temp dir and rename it into place so concurrent
+        # evals never observe a half-written entry.
+        tmp = Path(tempfile.mkdtemp(dir=entry.parent, prefix=".tmp-"))
+        try:
+            shutil.copyfile(result.journal_path, tmp / _JOURNAL_FILE)
+            (tmp / _RESULT_FILE).write_text(canonical_dumps(result.to_json()), encoding="utf-8")
+            os.replace(tmp, entry)
+        except OSError:
+            shutil.rmtree(tmp, ignore_errors=True)
+            if not entry.exists():
+                raise
+
+    def evict(self) -> int:
+        """Drop least-recently-used entries until the cache fits `max_bytes`."""
+
+        entries: list[tuple[float, int, Path]] = []
+        total = 0
+        for result_path in self._root.glob(f"*/*/{_RESULT_FILE}"):
+            entry = result_path.parent
+            size = sum(p.stat().st_size for p in entry.iterdir())
+            entries.append((result_path.stat().st_mtime, size, entry))
+            total += size
+
+        evicted = 0
+        for _, size, entry in sorted(entries, key=lambda e: (e[0], e[2].name)):
+            if total <= self._max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            evicted += 1
+        self._evicted += evicted
+        return evicted
+
+    def _entry_dir(self, key: str) -> Path:
+        return self._root / key[:2] / key
+
+
+def iter_seed_results_cached(
+    *,
+    cache: ResultCache,
+    profile: AgentProfile,
+    seeds: Sequence[int],
+    runs_dir: Path,
+    thresholds: GateThresholds,
+    workers: int = 1,
+    journal_format: JournalFormat = JournalFormat.JSONL,
+) -> Iterator[AgentResult]:
+    """Serve cache hits, run only the misses, and yield results in seed order.
+
+    Seeds are handled in fixed-size batches (so misses still fan out to the pool)
+    and hit/miss counts accumulate on `cache.stats`. Misses stream like
+    `iter_seed_results`, so closing the generator early (e.g. on an early stop)
+    also stops the runs nobody will read. The cache is trimmed to its size cap
+    however the generator ends, early close and errors included.
+    """
+
+    batch_size = max(_MIN_BATCH, workers * _MIN_BATCH)
+    try:
+        for start in range(0, len(seeds), batch_size):
+            batch = seeds[start : start + batch_size]
+            configs = [AgentRunConfig(seed=s, profile=profile, journal_format=journal_format) for s in batch]
+            keys = [cache.key_for(config=c, thresholds=thresholds) for c in configs]
+            cached = [cache.contains(key=k) for k in keys]
+            fresh = iter_seed_results(
+                profile=profile,
+                seeds=[s for s, hit in zip(batch, cached, strict=True) if not hit],
+                runs_dir=runs_dir,
+                workers=workers,
+                journal_format=journal_format,
+            )
+            with closing(fresh):
+                for seed, key, hit in zip(batch, keys, cached, strict=True):
+                    if not hit:
+                        # `get` just counts the miss (a copy cached meanwhile is rewritten by the run).
+                        cache.get(key=key, runs_dir=runs_dir)
+                        result = next(fresh)
+                        cache.put(key=key, result=result)
+                    elif (cached_result := cache.get(key=key, runs_dir=runs_dir)) is not None:
+                        result = cached_result
+                    else:
+                        # Evicted (by another eval) or corrupt since the probe.
+                        result = _run_one(seed, profile=profile, runs_dir=runs_dir, journal_format=journal_format)
+                        cache.put(key=key, result=result)
+                    yield result
+    finally:
+        cache.evict()
+
+
+def _run_one(seed: int, *, profile: AgentProfile, runs_dir: Path, journal_format: JournalFormat) -> AgentResult:
+    (result,) = run_seeds(profile=profile, seeds=[seed], runs_dir=runs_dir, journal_format=journal_format)
+    return result
+
+
+@lru_cache(maxsize=1)
+def source_fingerprint() -> str:
+    """Hash of every `learning_compiler` source file (path + bytes)."""
+
+    package_root = Path(__file__).resolve().parents[1]
+    h = hashlib.sha256()
+    for path in sorted(package_root.rglob("*.py")):
+        h.update(path.relative_to(package_root).as_posix().encode("utf-8"))
+        h.update(b"\0")
+        h.update(path.read_bytes())
+        h.update(b"\0")
+    return h.hexdigest()
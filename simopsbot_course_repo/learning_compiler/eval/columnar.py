@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+from learning_compiler.eval.columnar_format import DictValue, NpyView, read_manifest, read_npy
+
+
+class ColumnarEval:
+    """Read side of `columnar_writer.export_columns`.
+
+    `raw()` returns a column as a zero-copy, memory-mapped `memoryview`; no
+    NumPy needed (`columnar_arrays` has the NumPy views and metrics).
+    Dictionary columns hold codes: `dictionary()` maps them back to strings.
+    """
+
+    def __init__(self, columns_dir: Path) -> None:
+        self._dir = columns_dir
+        self._manifest = read_manifest(columns_dir)
+
+    def rows(self, table: str) -> int:
+        return self._manifest[table].rows
+
+    def dictionary(self, table: str, name: str) -> tuple[DictValue, ...]:
+        return self._manifest[table].dictionaries[name]
+
+    def code(self, table: str, name: str, value: DictValue) -> int | None:
+        """The code `value` has in a dictionary column (None if it never occurs)."""
+
+        values = self.dictionary(table, name)
+        return values.index(value) if value in values else None
+
+    def path(self, table: str, name: str) -> Path:
+        """The `.npy` file of a column (varlen columns have `.offsets` and `.data`)."""
+
+        return self._dir / table / f"{name}.npy"
+
+    def raw(self, table: str, name: str) -> NpyView:
+        return read_npy(self.path(table, name))
+
+    def text(self, table: str, name: str, row: int) -> str:
+        """One value of a varlen column, e.g. a run's journal path or an event payload."""
+
+        offsets = self.raw(table, f"{name}.offsets")
+        data = self.raw(table, f"{name}.data")
+        return bytes(data[int(offsets[row]) : int(offsets[row + 1])]).decode("utf-8")
+
+    def decoded(self, table: str, name: str) -> Iterator[DictValue]:
+        values = self.dictionary(table, name)
+        for c in self.raw(table, name):
+            yield values[int(c)]
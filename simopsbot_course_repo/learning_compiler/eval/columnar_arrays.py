@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from learning_compiler.agent.state import AgentProfile, ResultStatus
+from learning_compiler.eval.columnar import ColumnarEval
+from learning_compiler.eval.metrics import EvalMetrics
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError("loading columns as arrays needs NumPy: pip install -e '.[analysis]'") from e
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+
+def column(cols: ColumnarEval, table: str, name: str) -> NDArray[np.generic]:
+    """A column as a NumPy array memory-mapped from its `.npy` file."""
+
+    arr: NDArray[np.generic] = np.load(cols.path(table, name), mmap_mode="r")
+    return arr
+
+
+def columnar_metrics(cols: ColumnarEval) -> EvalMetrics:
+    """`compute_metrics` over the results table, as vectorized NumPy reductions."""
+
+    return _metrics(cols, np.ones(cols.rows("results"), dtype=np.bool_))
+
+
+def incident_breakdown(cols: ColumnarEval) -> dict[str, EvalMetrics]:
+    """`EvalMetrics` per incident type (only incidents that occur)."""
+
+    incident = column(cols, "results", "incident")
+    out: dict[str, EvalMetrics] = {}
+    for code, name in enumerate(cols.dictionary("results", "incident")):
+        mask = incident == code
+        if mask.any():
+            out[str(name)] = _metrics(cols, mask)
+    return out
+
+
+def _metrics(cols: ColumnarEval, mask: NDArray[np.bool_]) -> EvalMetrics:
+    total = int(mask.sum())
+    if total == 0:
+        raise ValueError("no results")
+    resolved_code = cols.code("results", "status", ResultStatus.RESOLVED.value)
+    resolved = mask & (column(cols, "results", "status") == resolved_code)
+    verifying = [cols.code("results", "profile", p.value) for p in (AgentProfile.WEEK4, AgentProfile.WEEK5)]
+    profile = column(cols, "results", "profile")
+    denominator = resolved & np.isin(profile, [c for c in verifying if c is not None])
+    verified = denominator & _flags(cols, "verified")
+    return EvalMetrics(
+        total_runs=total,
+        recovery_success_rate=int(resolved.sum()) / total,
+        mean_steps=int(column(cols, "results", "steps")[mask].sum()) / total,
+        verification_success_rate=int(verified.sum()) / int(denominator.sum()) if denominator.any() else None,
+        evidence_compliance_rate=int((mask & _flags(cols, "evidence_compliant")).sum()) / total,
+        unsafe_action_attempt_rate=int((mask & _flags(cols, "unsafe_action_executed")).sum()) / total,
+    )
+
+
+def _flags(cols: ColumnarEval, name: str) -> NDArray[np.bool_]:
+    return column(cols, "results", name).astype(np.bool_, copy=False)
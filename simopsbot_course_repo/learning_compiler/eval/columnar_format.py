@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal, TypeAlias
+import ast
+import json
+import mmap
+
+from learning_compiler.types import JSONValue
+from learning_compiler.utils.json import canonical_dumps
+
+# `eval_dir/columns/<table>/<column>.npy`, described by `manifest.json`.
+COLUMNS_DIR = "columns"
+MANIFEST_FILE = "manifest.json"
+
+# Every header is padded to this size, so a column can be streamed out before
+# its length is known and the header patched in place at the end.
+NPY_HEADER_SIZE = 128
+_NPY_MAGIC = b"\x93NUMPY\x01\x00"
+
+Typecode: TypeAlias = Literal["d", "q", "i", "I", "Q", "B", "?"]
+# numpy dtype -> struct/memoryview typecode (little-endian hosts only).
+TYPECODES: dict[str, Typecode] = {
+    "<f8": "d",
+    "<i8": "q",
+    "<i4": "i",
+    "<u4": "I",
+    "<u8": "Q",
+    "|u1": "B",
+    "|b1": "?",
+}
+
+# A value of a dictionary column: tools and services are missing on some observations.
+DictValue: TypeAlias = str | None
+# Quoted: `memoryview` is not subscriptable at runtime before Python 3.12.
+NpyView: TypeAlias = "memoryview[int] | memoryview[float] | memoryview[bool]"
+
+# Columns per table: plain dtypes, "dict" (dictionary-encoded strings, `|u1` codes
+# into the manifest's dictionary) or "varlen" (`.offsets` `<i8` + `.data` `|u1`).
+RESULT_COLUMNS: dict[str, str] = {
+    "seed": "<i8",
+    "profile": "dict",
+    "incident": "dict",
+    "status": "dict",
+    "steps": "<i4",
+    "unsafe_action_attempts": "<i4",
+    "evidence_compliant": "|b1",
+    "verified": "|b1",
+    "unsafe_action_executed": "|b1",
+    # Row range of each run's events: events[events_start[i]:events_start[i + 1]].
+    "events_start": "<i8",
+    "journal": "varlen",
+}
+EVENT_COLUMNS: dict[str, str] = {
+    "run": "<u4",
+    "step": "<i4",
+    "kind": "dict",
+    "event_id": "varlen",
+    "payload": "varlen",
+}
+OBSERVATION_COLUMNS: dict[str, str] = {
+    "run": "<u4",
+    "event": "<u8",
+    "step": "<i4",
+    "kind": "dict",
+    "tool": "dict",
+    "service": "dict",
+    # NaN where the observation has no such field (e.g. logs, health checks).
+    "error_rate": "<f8",
+    "latency_ms": "<f8",
+}
+TABLES: dict[str, dict[str, str]] = {
+    "results": RESULT_COLUMNS,
+    "events": EVENT_COLUMNS,
+    "observations": OBSERVATION_COLUMNS,
+}
+
+
+@dataclass(slots=True, frozen=True)
+class TableManifest:
+    """One table's entry in `manifest.json`."""
+
+    rows: int
+    columns: Mapping[str, str]
+    dictionaries: Mapping[str, tuple[DictValue, ...]]
+
+    def to_json(self) -> dict[str, JSONValue]:
+        columns: dict[str, JSONValue] = dict(self.columns)
+        dictionaries: dict[str, JSONValue] = {name: list(v) for name, v in self.dictionaries.items()}
+        return {"rows": self.rows, "columns": columns, "dictionaries": dictionaries}
+
+    @classmethod
+    def from_json(cls, obj: JSONValue) -> TableManifest:
+        if not isinstance(obj, dict):
+            raise ValueError("table manifest must be a JSON object")
+        rows, columns, dictionaries = obj.get("rows"), obj.get("columns"), obj.get("dictionaries")
+        if not isinstance(rows, int) or not isinstance(columns, dict) or not isinstance(dictionaries, dict):
+            raise ValueError("table manifest needs rows, columns and dictionaries")
+        return cls(
+            rows=rows,
+            columns={name: _expect_str(kind, name) for name, kind in columns.items()},
+            dictionaries={name: _dict_values(values, name) for name, values in dictionaries.items()},
+        )
+
+
+def write_manifest(columns_dir: Path, tables: Mapping[str, TableManifest]) -> None:
+    manifest: dict[str, JSONValue] = {name: t.to_json() for name, t in tables.items()}
+    (columns_dir / MANIFEST_FILE).write_text(canonical_dumps(manifest), encoding="utf-8")
+
+
+def read_manifest(columns_dir: Path) -> dict[str, TableManifest]:
+    path = columns_dir / MANIFEST_FILE
+    obj: JSONValue = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(obj, dict):
+        raise ValueError(f"{path}: expected a JSON object")
+    try:
+        return {name: TableManifest.from_json(table) for name, table in obj.items()}
+    except ValueError as e:
+        raise ValueError(f"{path}: {e}") from e
+
+
+def npy_header(descr: str, rows: int) -> bytes:
+    """A version 1.0 `.npy` header of exactly `NPY_HEADER_SIZE` bytes."""
+
+    header = f"{{'descr': '{descr}', 'fortran_order': False, 'shape': ({rows},), }}"
+    padded = header.ljust(NPY_HEADER_SIZE - len(_NPY_MAGIC) - 2 - 1) + "\n"
+    return _NPY_MAGIC + len(padded).to_bytes(2, "little") + padded.encode("latin1")
+
+
+def read_npy(path: Path) -> NpyView:
+    """A 1-D `.npy` file as a memory-mapped, typed `memoryview` (no NumPy needed)."""
+
+    with path.open("rb") as fp:
+        head = fp.read(10)
+        if head[:8] != _NPY_MAGIC:
+            raise ValueError(f"{path}: not a version 1.0 .npy file")
+        header_len = int.from_bytes(head[8:10], "little")
+        header = ast.literal_eval(fp.read(header_len).decode("latin1"))
+        typecode = TYPECODES.get(header["descr"])
+        if typecode is None or header["fortran_order"] or len(header["shape"]) != 1:
+            raise ValueError(f"{path}: unsupported array layout {header!r}")
+        if header["shape"][0] == 0:
+            # `array` has no "?" typecode; an empty cast works for every typecode.
+            return memoryview(b"").cast(typecode)
+        buf = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+    return memoryview(buf)[10 + header_len :].cast(typecode)
+
+
+def _expect_str(value: JSONValue, name: str) -> str:
+    if not isinstance(value, str):
+        raise ValueError(f"column {name!r}: kind must be a string")
+    return value
+
+
+def _dict_values(values: JSONValue, name: str) -> tuple[DictValue, ...]:
+    if not isinstance(values, list) or not all(v is None or isinstance(v, str) for v in values):
+        raise ValueError(f"dictionary {name!r} must be a list of strings or nulls")
+    return tuple(v for v in values if v is None or isinstance(v, str))
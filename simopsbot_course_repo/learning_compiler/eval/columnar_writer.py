@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from pathlib import Path
+from typing import IO, TypeAlias
+import math
+import struct
+import sys
+
+from learning_compiler.eval.columnar_format import (
+    COLUMNS_DIR,
+    NPY_HEADER_SIZE,
+    TABLES,
+    TYPECODES,
+    DictValue,
+    TableManifest,
+    npy_header,
+    write_manifest,
+)
+from learning_compiler.eval.results_log import RESULTS_FILE, iter_results
+from learning_compiler.eval.scenario_generator import incident_for_seed
+from learning_compiler.journal.index import tally_journal
+from learning_compiler.journal.models import JournalKind
+from learning_compiler.journal.reader import iter_journal
+from learning_compiler.types import JSONValue
+from learning_compiler.utils.json import canonical_dumps
+
+_FLUSH_ITEMS = 1 << 16
+
+# What a row holds per column: numbers for plain dtypes, strings (or None) otherwise.
+CellValue: TypeAlias = DictValue | int | float
+
+
+def export_columns(eval_dir: Path, *, out_dir: Path | None = None) -> Path:
+    """Write an eval's results and journals as columnar `.npy` arrays.
+
+    One pass over `results.jsonl` and every journal it names (any format,
+    stores included); columns are streamed to disk, so memory stays flat. Returns
+    the columns dir (default `eval_dir/columns`). Writing needs no NumPy; the
+    files are standard `.npy` and `columnar_arrays.column` memory-maps them.
+    """
+
+    if sys.byteorder != "little":
+        raise RuntimeError("columnar export supports little-endian hosts only")
+    out = out_dir if out_dir is not None else eval_dir / COLUMNS_DIR
+    tables = {name: _TableWriter(out / name, columns) for name, columns in TABLES.items()}
+    results, events, observations = tables["results"], tables["events"], tables["observations"]
+    try:
+        for run, result in enumerate(iter_results(eval_dir / RESULTS_FILE)):
+            metrics = result.metrics if result.metrics is not None else tally_journal(result.journal_path)
+            results.add(
+                seed=result.seed,
+                profile=result.profile.value,
+                incident=incident_for_seed(result.seed).value,
+                status=result.status.value,
+                steps=result.steps,
+                unsafe_action_attempts=result.unsafe_action_attempts,
+                evidence_compliant=metrics.evidence_compliant,
+                verified=metrics.verified,
+                unsafe_action_executed=metrics.unsafe_action_executed,
+                events_start=events.rows,
+                journal=str(result.journal_path),
+            )
+            for e in iter_journal(result.journal_path, validate=False):
+                if e.kind in (JournalKind.OBSERVATION, JournalKind.VERIFY):
+                    obs = e.payload.get("observation")
+                    if isinstance(obs, dict):
+                        observations.add(
+                            run=run,
+                            event=events.rows,
+                            step=e.step_id,
+                            kind=e.kind.value,
+                            tool=_str_or_none(obs.get("tool")),
+                            service=_str_or_none(obs.get("service")),
+                            error_rate=_number_or_nan(obs.get("error_rate")),
+                            latency_ms=_number_or_nan(obs.get("latency_ms")),
+                        )
+                events.add(
+                    run=run,
+                    step=e.step_id,
+                    kind=e.kind.value,
+                    event_id=e.event_id,
+                    payload=canonical_dumps(dict(e.payload)),
+                )
+        # One past the last run, so every run's event range is a plain slice.
+        results.close(extra={"events_start": events.rows})
+        events.close()
+        observations.close()
+    except BaseException:
+        for t in tables.values():
+            t.abort()
+        raise
+    write_manifest(out, {name: t.manifest() for name, t in tables.items()})
+    return out
+
+
+class _ColumnWriter:
+    def __init__(self, path: Path, descr: str) -> None:
+        self._descr = descr
+        self._pack = "<{}" + TYPECODES[descr]
+        self._buf: list[float] = []
+        self._rows = 0
+        self._fp: IO[bytes] = path.open("wb")
+        self._fp.write(bytes(NPY_HEADER_SIZE))
+
+    @property
+    def rows(self) -> int:
+        return self._rows + len(self._buf)
+
+    def append(self, value: float) -> None:
+        self._buf.append(value)
+        if len(self._buf) >= _FLUSH_ITEMS:
+            self._flush()
+
+    def write_bytes(self, data: bytes) -> None:
+        self._flush()
+        self._fp.write(data)
+        self._rows += len(data)
+
+    def close(self) -> None:
+        self._flush()
+        self._fp.seek(0)
+        self._fp.write(npy_header(self._descr, self._rows))
+        self._fp.close()
+
+    def abort(self) -> None:
+        self._fp.close()
+
+    def _flush(self) -> None:
+        if self._buf:
+            self._fp.write(struct.pack(self._pack.format(len(self._buf)), *self._buf))
+            self._rows += len(self._buf)
+            self._buf.clear()
+
+
+class _TableWriter:
+    def __init__(self, directory: Path, columns: Mapping[str, str]) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        self._columns = dict(columns)
+        self._rows = 0
+        self._writers: dict[str, _ColumnWriter] = {}
+        self._dictionaries: dict[str, dict[DictValue, int]] = {}
+        for name, kind in columns.items():
+            if kind == "varlen":
+                offsets = self._writers[f"{name}.offsets"] = _ColumnWriter(directory / f"{name}.offsets.npy", "<i8")
+                offsets.append(0)
+                self._writers[f"{name}.data"] = _ColumnWriter(directory / f"{name}.data.npy", "|u1")
+            elif kind == "dict":
+                self._dictionaries[name] = {}
+                self._writers[name] = _ColumnWriter(directory / f"{name}.npy", "|u1")
+            else:
+                self._writers[name] = _ColumnWriter(directory / f"{name}.npy", kind)
+
+    @property
+    def rows(self) -> int:
+        return self._rows
+
+    def add(self, **values: CellValue) -> None:
+        for name, kind in self._columns.items():
+            value = values[name]
+            if kind == "varlen":
+                data = self._writers[f"{name}.data"]
+                data.write_bytes(str(value).encode())
+                self._writers[f"{name}.offsets"].append(data.rows)
+            elif kind == "dict":
+                if not (value is None or isinstance(value, str)):
+                    raise TypeError(f"column {name!r} holds strings, got {value!r}")
+                codes = self._dictionaries[name]
+                code = codes.setdefault(value, len(codes))
+                if code > 0xFF:
+                    raise ValueError(f"column {name!r} has more than 256 distinct values")
+                self._writers[name].append(code)
+            else:
+                if value is None or isinstance(value, str):
+                    raise TypeError(f"column {name!r} holds numbers, got {value!r}")
+                self._writers[name].append(value)
+        self._rows += 1
+
+    def close(self, *, extra: Mapping[str, float] | None = None) -> None:
+        for name, value in (extra or {}).items():
+            self._writers[name].append(value)
+        for w in self._writers.values():
+            w.close()
+
+    def abort(self) -> None:
+        for w in self._writers.values():
+            w.abort()
+
+    def manifest(self) -> TableManifest:
+        dictionaries = {name: tuple(codes) for name, codes in self._dictionaries.items()}
+        return TableManifest(rows=self._rows, columns=self._columns, dictionaries=dictionaries)
+
+
+def _str_or_none(value: JSONValue) -> DictValue:
+    return value if isinstance(value, str) else None
+
+
+def _number_or_nan(value: JSONValue) -> float:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return math.nan
@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import ExitStack
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import partial
+from itertools import islice
+from pathlib import Path
+import hashlib
+import json
+
+from learning_compiler.eval.journal_io import StoreCache
+from learning_compiler.eval.parallel import iter_chunked
+from learning_compiler.journal.binary import is_binary_journal, iter_binary_journal
+from learning_compiler.journal.compression import open_journal_binary
+from learning_compiler.journal.convert import canonical_line
+from learning_compiler.journal.models import JournalParseError
+from learning_compiler.journal.store import split_store_locator
+from learning_compiler.types import JSONValue
+from learning_compiler.utils.json import canonical_dumps
+
+# Canonical lines end with `"step_id":<int>}` (envelope keys are sorted).
+_STEP_KEY = b'"step_id":'
+_DIGEST_SIZE = 16
+_MAX_VALUE_CHARS = 120
+# Derived from the run id and position; reported only when nothing else differs.
+_ENVELOPE_IDS = ("event_id", "run_id")
+
+
+class DiffStatus(StrEnum):
+    IDENTICAL = "identical"
+    DIVERGED = "diverged"
+    ONLY_LEFT = "only_left"
+    ONLY_RIGHT = "only_right"
+
+
+class ChangeOp(StrEnum):
+    CHANGED = "changed"
+    ADDED = "added"
+    REMOVED = "removed"
+
+
+@dataclass(slots=True, frozen=True)
+class StepDigest:
+    step_id: int
+    events: int
+    digest: bytes
+
+
+@dataclass(slots=True, frozen=True)
+class EventChange:
+    """One difference inside a step, between the `index`-th events of each side.
+
+    `path` is dotted into the event (`payload.attempts[1].error_type`); it is ""
+    when the whole event exists on one side only.
+    """
+
+    index: int
+    path: str
+    op: ChangeOp
+    left: JSONValue = None
+    right: JSONValue = None
+
+    def to_json(self) -> dict[str, JSONValue]:
+        out: dict[str, JSONValue] = {"index": self.index, "path": self.path, "op": self.op.value}
+        if self.op is not ChangeOp.ADDED:
+            out["left"] = self.left
+        if self.op is not ChangeOp.REMOVED:
+            out["right"] = self.right
+        return out
+
+    def describe(self) -> str:
+        where = f"event {self.index}" + (f" {self.path}" if self.path else "")
+        if self.op is ChangeOp.ADDED:
+            return f"{where}: added {_short(self.right)}"
+        if self.op is ChangeOp.REMOVED:
+            return f"{where}: removed {_short(self.left)}"
+        return f"{where}: {_short(self.left)} -> {_short(self.right)}"
+
+
+@dataclass(slots=True, frozen=True)
+class RunDiff:
+    """How one run's journal differs between two evals.
+
+    For diverged runs `step_id` is the first step whose events differ and
+    `changes` lists their differences (at most `max_changes`; `truncated` says
+    there were more). `divergent_steps` counts differing steps out of `steps`.
+    """
+
+    run: str
+    status: DiffStatus
+    left: Path | None
+    right: Path | None
+    steps: int = 0
+    divergent_steps: int = 0
+    step_id: int | None = None
+    changes: tuple[EventChange, ...] = ()
+    truncated: bool = False
+
+    def to_json(self) -> dict[str, JSONValue]:
+        return {
+            "run": self.run,
+            "status": self.status.value,
+            "left": None if self.left is None else str(self.left),
+            "right": None if self.right is None else str(self.right),
+            "steps": self.steps,
+            "divergent_steps": self.divergent_steps,
+            "step_id": self.step_id,
+            "changes": [c.to_json() for c in self.changes],
+            "truncated": self.truncated,
+        }
+
+    def describe(self) -> str:
+        if self.status is DiffStatus.ONLY_LEFT:
+            return f"{self.run}: only in left ({self.left})"
+        if self.status is DiffStatus.ONLY_RIGHT:
+            return f"{self.run}: only in right ({self.right})"
+        if self.status is DiffStatus.IDENTICAL:
+            return f"{self.run}: identical"
+        lines = [
+            f"{self.run}: diverged at step {self.step_id} "
+            f"({self.divergent_steps} of {self.steps} steps differ)"
+        ]
+        lines.extend(f"  {c.describe()}" for c in self.changes)
+        if self.truncated:
+            lines.append("  ...")
+        return "\n".join(lines)
+
+
+def pair_journals(left: Sequence[Path], right: Sequence[Path]) -> list[tuple[str, Path | None, Path | None]]:
+    """Match journals of two evals by run name, whatever their format or location."""
+
+    lefts = {_run_name(p): p for p in left}
+    rights = {_run_name(p): p for p in right}
+    return [(run, lefts.get(run), rights.get(run)) for run in sorted(lefts.keys() | rights.keys())]
+
+
+def journal_lines(path: Path, *, stores: StoreCache) -> Iterator[bytes]:
+    """The canonical JSONL lines (no newline) of a journal in any format.
+
+    Plain, compressed and stored JSONL are passed through as bytes; only binary
+    journals are decoded, to re-encode their events as they'd have been written.
+    """
+
+    located = split_store_locator(path)
+    if located is not None:
+        for text in stores.get(located[0]).iter_lines(located[1]):
+            yield text.encode("utf-8")
+        return
+    if is_binary_journal(path):
+        for event in iter_binary_journal(path):
+            yield canonical_line(event).encode("utf-8")
+        return
+    with open_journal_binary(path) as fp:
+        for raw in fp:
+            line = raw.strip()
+            if line:
+                yield line
+
+
+def step_digests(lines: Iterable[bytes]) -> list[StepDigest]:
+    """Hash consecutive lines of the same step, reading step ids off the line ends."""
+
+    out: list[StepDigest] = []
+    step: int | None = None
+    h = hashlib.blake2b(digest_size=_DIGEST_SIZE)
+    events = 0
+    for line in lines:
+        line_step = _line_step(line)
+        if line_step != step:
+            if step is not None:
+                out.append(StepDigest(step_id=step, events=events, digest=h.digest()))
+            step, events = line_step, 0
+            h = hashlib.blake2b(digest_size=_DIGEST_SIZE)
+        h.update(line)
+        h.update(b"\n")
+        events += 1
+    if step is not None:
+        out.append(StepDigest(step_id=step, events=events, digest=h.digest()))
+    return out
+
+
+def diff_run(
+    run: str, left: Path | None, right: Path | None, *, stores: StoreCache, max_changes: int = 20
+) -> RunDiff:
+    """Compare one run's journals step by step; decode only the first divergent step."""
+
+    if left is None or right is None:
+        status = DiffStatus.ONLY_RIGHT if left is None else DiffStatus.ONLY_LEFT
+        return RunDiff(run=run, status=status, left=left, right=right)
+
+    left_steps = step_digests(journal_lines(left, stores=stores))
+    right_steps = step_digests(journal_lines(right, stores=stores))
+    steps = max(len(left_steps), len(right_steps))
+    divergent = [
+        i
+        for i in range(steps)
+        if i >= len(left_steps) or i >= len(right_steps) or left_steps[i] != right_steps[i]
+    ]
+    if not divergent:
+        return RunDiff(run=run, status=DiffStatus.IDENTICAL, left=left, right=right, steps=steps)
+
+    first = divergent[0]
+    step_id = min(s[first].step_id for s in (left_steps, right_steps) if first < len(s))
+    left_events = _step_events(left, step_id=step_id, stores=stores)
+    right_events = _step_events(right, step_id=step_id, stores=stores)
+    changes = list(islice(_step_changes(left_events, right_events, ignore=_ENVELOPE_IDS), max_changes + 1))
+    if not changes:
+        changes = list(islice(_step_changes(left_events, right_events, ignore=()), max_changes + 1))
+    return RunDiff(
+        run=run,
+        status=DiffStatus.DIVERGED,
+        left=left,
+        right=right,
+        steps=steps,
+        divergent_steps=len(divergent),
+        step_id=step_id,
+        changes=tuple(changes[:max_changes]),
+        truncated=len(changes) > max_changes,
+    )
+
+
+def iter_diffs(
+    pairs: Sequence[tuple[str, Path | None, Path | None]], *, workers: int = 1, max_changes: int = 20
+) -> Iterator[RunDiff]:
+    """Yield a `RunDiff` per pair (see `pair_journals`), in order, fanned out to `workers`."""
+
+    with ExitStack() as stack:
+        stores: StoreCache | None = stack.enter_context(StoreCache()) if workers == 1 else None
+        run_chunk = partial(_diff_chunk, max_changes=max_changes, stores=stores)
+        yield from iter_chunked(run_chunk, items=pairs, workers=workers)
+
+
+def _diff_chunk(
+    pairs: list[tuple[str, Path | None, Path | None]], *, max_changes: int, stores: StoreCache | None
+) -> list[RunDiff]:
+    if stores is None:
+        with StoreCache() as chunk_stores:
+            return _diff_chunk(pairs, max_changes=max_changes, stores=chunk_stores)
+    return [
+        diff_run(run, left, right, stores=stores, max_changes=max_changes) for run, left, right in pairs
+    ]
+
+
+def _run_name(path: Path) -> str:
+    # `run_seed000007_week5.jsonl.gz` -> `run_seed000007_week5`
+    return path.name.split(".", 1)[0]
+
+
+def _line_step(line: bytes) -> int:
+    at = line.rfind(_STEP_KEY)
+    if at < 0 or not line.endswith(b"}"):
+        raise JournalParseError(f"not a canonical journal line: {line[:80]!r}")
+    return int(line[at + len(_STEP_KEY) : -1])
+
+
+def _step_events(path: Path, *, step_id: int, stores: StoreCache) -> list[dict[str, JSONValue]]:
+    out: list[dict[str, JSONValue]] = []
+    for line in journal_lines(path, stores=stores):
+        if _line_step(line) == step_id:
+            event = json.loads(line)
+            del event["step_id"]
+            out.append(event)
+    return out
+
+
+def _step_changes(
+    left: Sequence[dict[str, JSONValue]], right: Sequence[dict[str, JSONValue]], *, ignore: Sequence[str]
+) -> Iterator[EventChange]:
+    for index in range(max(len(left), len(right))):
+        if index >= len(left):
+            yield EventChange(index=index, path="", op=ChangeOp.ADDED, right=right[index])
+        elif index >= len(right):
+            yield EventChange(index=index, path="", op=ChangeOp.REMOVED, left=left[index])
+        else:
+            l_event = {k: v for k, v in left[index].items() if k not in ignore}
+            r_event = {k: v for k, v in right[index].items() if k not in ignore}
+            yield from _value_changes(index, "", l_event, r_event)
+
+
+def _value_changes(index: int, path: str, left: JSONValue, right: JSONValue) -> Iterator[EventChange]:
+    if isinstance(left, dict) and isinstance(right, dict):
+        for key in sorted(left.keys() | right.keys()):
+            sub = f"{path}.{key}" if path else key
+            if key not in right:
+                yield EventChange(index=index, path=sub, op=ChangeOp.REMOVED, left=left[key])
+            elif key not in left:
+                yield EventChange(index=index, path=sub, op=ChangeOp.ADDED, right=right[key])
+            else:
+                yield from _value_changes(index, sub, left[key], right[key])
+        return
+    if isinstance(left, list) and isinstance(right, list):
+        for i in range(max(len(left), len(right))):
+            sub = f"{path}[{i}]"
+            if i >= len(right):
+                yield EventChange(index=index, path=sub, op=ChangeOp.REMOVED, left=left[i])
+            elif i >= len(left):
+                yield EventChange(index=index, path=sub, op=ChangeOp.ADDED, right=right[i])
+            else:
+                yield from _value_changes(index, sub, left[i], right[i])
+        return
+    # `type` too: 1, 1.0 and true compare equal but serialize differently.
+    if left != right or type(left) is not type(right):
+        yield EventChange(index=index, path=path, op=ChangeOp.CHANGED, left=left, right=right)
+
+
+def _short(value: JSONValue) -> str:
+    text = canonical_dumps(value)
+    return text if len(text) <= _MAX_VALUE_CHARS else text[: _MAX_VALUE_CHARS - 3] + "..."
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from types import TracebackType
+
+from learning_compiler.journal.models import JournalEvent, JournalFormat, JournalKind
+from learning_compiler.journal.reader import iter_journal, parse_journal_line
+from learning_compiler.journal.scan import JournalScanner
+from learning_compiler.journal.store import (
+    STORE_FILE,
+    JournalStore,
+    is_journal_store,
+    split_store_locator,
+    store_locator,
+)
+
+
+def journal_paths(inputs: Sequence[Path]) -> list[Path]:
+    """Expand eval dirs, runs dirs, journal stores and files to journal paths.
+
+    An eval output dir contributes its `runs/` journals and its journal store;
+    a store contributes one locator per journal. Sidecar indexes are skipped.
+    """
+
+    out: list[Path] = []
+    for path in inputs:
+        if path.is_dir():
+            runs, store = path / "runs", path / STORE_FILE
+            if runs.is_dir():
+                out.extend(_dir_journals(runs))
+            if store.is_file():
+                out.extend(_store_journals(store))
+            elif not runs.is_dir():
+                out.extend(_dir_journals(path))
+        elif is_journal_store(path):
+            out.extend(_store_journals(path))
+        else:
+            out.append(path)
+    return out
+
+
+class StoreCache:
+    """One open connection per journal store, for a chunk of journals."""
+
+    def __init__(self) -> None:
+        self._stores: dict[Path, JournalStore] = {}
+
+    def get(self, path: Path) -> JournalStore:
+        store = self._stores.get(path)
+        if store is None:
+            store = self._stores[path] = JournalStore(path)
+        return store
+
+    def close(self) -> None:
+        for store in self._stores.values():
+            store.close()
+        self._stores.clear()
+
+    def __enter__(self) -> StoreCache:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def candidate_events(
+    path: Path, *, kinds: frozenset[JournalKind], stores: StoreCache
+) -> Iterator[JournalEvent]:
+    # Kind filters skip decoding other lines: mmap scan for plain JSONL, an indexed
+    # column for stores. Everything else is a trusted full read (we wrote these).
+    located = split_store_locator(path)
+    if located is not None:
+        store = stores.get(located[0])
+        lines: Iterator[str]
+        if len(kinds) == 1:
+            lines = store.iter_lines(located[1], kind=next(iter(kinds)))
+        else:
+            lines = store.iter_lines(located[1])
+        for n, line in enumerate(lines, start=1):
+            yield parse_journal_line(line, where=f"{path}:{n}", validate=False)
+        return
+    if kinds and JournalFormat.for_path(path) in (JournalFormat.JSONL, None):
+        with JournalScanner(path) as scanner:
+            yield from scanner.events(kinds)
+        return
+    yield from iter_journal(path, validate=False)
+
+
+def _dir_journals(directory: Path) -> list[Path]:
+    return sorted(p for p in directory.iterdir() if p.is_file() and JournalFormat.for_path(p) is not None)
+
+
+def _store_journals(store_path: Path) -> list[Path]:
+    with JournalStore(store_path) as store:
+        return [store_locator(store_path, name) for name in store.journals()]
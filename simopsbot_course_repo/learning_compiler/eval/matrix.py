@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from contextlib import ExitStack
+from dataclasses import dataclass
+from pathlib import Path
+
+from learning_compiler.agent.state import AgentProfile, AgentResult, ResultStatus
+from learning_compiler.eval.gate import DEFAULT_THRESHOLDS, GateThresholds, check_gate
+from learning_compiler.eval.metrics import MetricsAccumulator
+from learning_compiler.eval.parallel import iter_matrix_results
+from learning_compiler.eval.results_log import RESULTS_FILE
+from learning_compiler.eval.runner import EvalReport, write_summaries
+from learning_compiler.types import JSONValue
+from learning_compiler.utils.json import canonical_dumps, write_jsonl_line
+
+DELTAS_FILE = "paired_deltas.jsonl"
+
+
+@dataclass(slots=True, frozen=True)
+class PairedDelta:
+    """`profile` vs `baseline`, compared seed by seed over the same seeds."""
+
+    profile: AgentProfile
+    baseline: AgentProfile
+    seeds: int
+    # Seeds resolved by `profile` but not by `baseline`, and vice versa.
+    improved: int
+    regressed: int
+    mean_delta_steps: float
+
+    @property
+    def delta_recovery_success_rate(self) -> float:
+        return (self.improved - self.regressed) / self.seeds if self.seeds else 0.0
+
+    def to_json(self) -> dict[str, JSONValue]:
+        return {
+            "profile": self.profile.value,
+            "baseline": self.baseline.value,
+            "seeds": self.seeds,
+            "improved": self.improved,
+            "regressed": self.regressed,
+            "delta_recovery_success_rate": self.delta_recovery_success_rate,
+            "mean_delta_steps": self.mean_delta_steps,
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class MatrixReport:
+    """Per-profile eval reports plus paired deltas against the first profile."""
+
+    seeds: Sequence[int]
+    reports: tuple[EvalReport, ...]
+    deltas: tuple[PairedDelta, ...]
+
+    def to_json(self) -> dict[str, JSONValue]:
+        return {
+            "baseline": self.reports[0].profile.value,
+            "total_seeds": len(self.seeds),
+            "profiles": [r.summary_head() for r in self.reports],
+            "paired_deltas": [d.to_json() for d in self.deltas],
+        }
+
+    def to_markdown(self) -> str:
+        def fmt(x: float | None) -> str:
+            return "n/a" if x is None else f"{x:.3f}"
+
+        baseline = self.reports[0].profile.value
+        lines = []
+        lines.append(f"# Profile comparison ({len(self.seeds)} seeds, baseline {baseline})")
+        lines.append("")
+        lines.append("## Metrics")
+        lines.append("")
+        lines.append("| Profile | Recovery | Mean steps | Verification | Evidence | Unsafe | Gate |")
+        lines.append("|---|---:|---:|---:|---:|---:|---|")
+        for r in self.reports:
+            m = r.metrics
+            lines.append(
+                f"| {r.profile.value} | {fmt(m.recovery_success_rate)} | {fmt(m.mean_steps)} "
+                f"| {fmt(m.verification_success_rate)} | {fmt(m.evidence_compliance_rate)} "
+                f"| {fmt(m.unsafe_action_attempt_rate)} | {'pass' if r.gate.passed else 'FAIL'} |"
+            )
+        lines.append("")
+        lines.append(f"## Paired per-seed deltas vs {baseline}")
+        lines.append("")
+        lines.append("| Profile | Delta recovery | Delta mean steps | Seeds improved | Seeds regressed |")
+        lines.append("|---|---:|---:|---:|---:|")
+        for d in self.deltas:
+            lines.append(
+                f"| {d.profile.value} | {d.delta_recovery_success_rate:+.3f} | {d.mean_delta_steps:+.3f} "
+                f"| {d.improved} | {d.regressed} |"
+            )
+        return "\n".join(lines)
+
+
+def run_matrix(
+    *,
+    profiles: Sequence[AgentProfile],
+    seeds: Sequence[int],
+    out_dir: Path,
+    thresholds: GateThresholds | None = None,
+    workers: int = 1,
+) -> MatrixReport:
+    """Evaluate every profile on the same seeds in one scheduled pass.
+
+    `out_dir/<profile>/` holds exactly what `run_eval` would write for that
+    profile alone. On top, `paired_deltas.jsonl` has one line per seed comparing
+    each profile with the first, and `comparison.json`/`.md` summarise it all.
+    """
+
+    if len(profiles) < 2:
+        raise ValueError("a matrix needs at least two profiles")
+    if len(set(profiles)) != len(profiles):
+        raise ValueError("profiles must be distinct")
+
+    profile_dirs = [out_dir / p.value for p in profiles]
+    runs_dirs = [d / "runs" for d in profile_dirs]
+    for runs_dir in runs_dirs:
+        runs_dir.mkdir(parents=True, exist_ok=True)
+
+    accs = [MetricsAccumulator() for _ in profiles]
+    pairs = [_PairedDeltaAccumulator() for _ in profiles[1:]]
+    rows = iter_matrix_results(profiles=profiles, seeds=seeds, runs_dirs=runs_dirs, workers=workers)
+    with ExitStack() as stack:
+        results_fps = [
+            stack.enter_context((d / RESULTS_FILE).open("w", encoding="utf-8")) for d in profile_dirs
+        ]
+        deltas_fp = stack.enter_context((out_dir / DELTAS_FILE).open("w", encoding="utf-8"))
+        for row in rows:
+            for fp, acc, result in zip(results_fps, accs, row, strict=True):
+                write_jsonl_line(fp, result.to_json())
+                acc.add(result)
+            for pair, result in zip(pairs, row[1:], strict=True):
+                pair.add(baseline=row[0], other=result)
+            write_jsonl_line(deltas_fp, _delta_line(row))
+
+    reports: list[EvalReport] = []
+    for profile, profile_dir, acc in zip(profiles, profile_dirs, accs, strict=True):
+        metrics = acc.finish()
+        report = EvalReport(
+            profile=profile,
+            seeds=seeds,
+            metrics=metrics,
+            gate=check_gate(metrics=metrics, thresholds=thresholds or DEFAULT_THRESHOLDS),
+            results=(),
+        )
+        write_summaries(out_dir=profile_dir, report=report)
+        reports.append(report)
+
+    deltas = [
+        pair.finish(profile=p, baseline=profiles[0]) for pair, p in zip(pairs, profiles[1:], strict=True)
+    ]
+    matrix = MatrixReport(seeds=seeds, reports=tuple(reports), deltas=tuple(deltas))
+    (out_dir / "comparison.json").write_text(canonical_dumps(matrix.to_json()), encoding="utf-8")
+    (out_dir / "comparison.md").write_text(matrix.to_markdown() + "\n", encoding="utf-8")
+    return matrix
+
+
+class _PairedDeltaAccumulator:
+    def __init__(self) -> None:
+        self._seeds = 0
+        self._improved = 0
+        self._regressed = 0
+        self._delta_steps = 0
+
+    def add(self, *, baseline: AgentResult, other: AgentResult) -> None:
+        self._seeds += 1
+        self._delta_steps += other.steps - baseline.steps
+        delta = _resolved(other) - _resolved(baseline)
+        if delta > 0:
+            self._improved += 1
+        elif delta < 0:
+            self._regressed += 1
+
+    def finish(self, *, profile: AgentProfile, baseline: AgentProfile) -> PairedDelta:
+        return PairedDelta(
+            profile=profile,
+            baseline=baseline,
+            seeds=self._seeds,
+            improved=self._improved,
+            regressed=self._regressed,
+            mean_delta_steps=self._delta_steps / self._seeds if self._seeds else 0.0,
+        )
+
+
+def _resolved(result: AgentResult) -> int:
+    return 1 if result.status is ResultStatus.RESOLVED else 0
+
+
+def _delta_line(row: tuple[AgentResult, ...]) -> dict[str, JSONValue]:
+    baseline = row[0]
+    return {
+        "seed": baseline.seed,
+        "status": {r.profile.value: r.status.value for r in row},
+        "steps": {r.profile.value: r.steps for r in row},
+        "delta_resolved": {r.profile.value: _resolved(r) - _resolved(baseline) for r in row[1:]},
+        "delta_steps": {r.profile.value: r.steps - baseline.steps for r in row[1:]},
+    }
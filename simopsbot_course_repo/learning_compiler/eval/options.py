@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal
+import asyncio
+
+from learning_compiler.agent.state import AgentProfile
+from learning_compiler.eval.async_runner import run_eval_async
+from learning_compiler.eval.cache import ResultCache
+from learning_compiler.eval.matrix import run_matrix
+from learning_compiler.eval.runner import EvalReport, run_eval
+from learning_compiler.eval.sequential import EarlyStopConfig
+from learning_compiler.eval.seeds import shard_seeds
+from learning_compiler.eval.shards import merge_shards, write_shard_manifest
+from learning_compiler.journal.models import JournalFormat
+
+Compression = Literal["gzip", "xz"]
+
+
+@dataclass(slots=True, frozen=True)
+class EvalOptions:
+    """One `eval_runner` invocation: which runs to make and how.
+
+    `profiles` switches to a matrix comparison (first profile is the baseline);
+    `async_concurrency` runs seeds on one event loop; otherwise `run_eval`.
+    """
+
+    profile: AgentProfile
+    seeds: Sequence[int]
+    out_dir: Path
+    profiles: tuple[AgentProfile, ...] | None = None
+    shard: tuple[int, int] | None = None
+    workers: int = 1
+    async_concurrency: int | None = None
+    resume: bool = False
+    cache_dir: Path | None = None
+    cache_max_mb: int = 512
+    early_stop: EarlyStopConfig | None = None
+    journal_format: JournalFormat = JournalFormat.JSONL
+    compress: Compression | None = None
+    journal_store: bool = False
+
+    def validate(self) -> None:
+        if self.compress is not None and self.journal_format is not JournalFormat.JSONL:
+            raise ValueError("--compress applies to JSONL journals only")
+        plain_jsonl = self.journal_format is JournalFormat.JSONL and self.compress is None
+        if self.journal_store and not plain_jsonl:
+            raise ValueError("--journal-store keeps plain JSONL journals only")
+        if self.journal_store and (
+            self.profiles is not None or self.async_concurrency is not None or self.cache_dir is not None
+        ):
+            raise ValueError("--journal-store cannot be combined with --profiles, --async-concurrency or --cache-dir")
+        if self.profiles is not None:
+            if self.async_concurrency is not None or self.cache_dir is not None or self.resume:
+                raise ValueError("--profiles cannot be combined with --async-concurrency, --cache-dir or --resume")
+            if self.shard is not None or self.early_stop is not None or not plain_jsonl:
+                raise ValueError(
+                    "--profiles cannot be combined with --shard, --early-stop, --journal-format or --compress"
+                )
+        if self.async_concurrency is not None:
+            if self.cache_dir is not None or self.workers != 1 or self.resume or self.early_stop is not None:
+                raise ValueError(
+                    "--async-concurrency cannot be combined with --workers, --cache-dir, --resume or --early-stop"
+                )
+            if not plain_jsonl:
+                raise ValueError("--async-concurrency writes plain JSONL journals only")
+
+    @property
+    def resolved_format(self) -> JournalFormat:
+        if self.compress is None:
+            return self.journal_format
+        return JournalFormat.JSONL_GZIP if self.compress == "gzip" else JournalFormat.JSONL_XZ
+
+
+def parse_profiles(spec: str) -> tuple[AgentProfile, ...]:
+    """Parse a comma-separated profile list, e.g. 'week2,week5'."""
+
+    return tuple(AgentProfile(p.strip()) for p in spec.split(",") if p.strip())
+
+
+def run_eval_options(options: EvalOptions) -> str:
+    """Run what `options` describe and return the report `eval_runner` prints."""
+
+    options.validate()
+    out = options.out_dir
+    if options.profiles is not None:
+        matrix = run_matrix(profiles=options.profiles, seeds=options.seeds, out_dir=out, workers=options.workers)
+        passed = ", ".join(f"{r.profile.value}={r.gate.passed}" for r in matrix.reports)
+        return (out / "comparison.md").read_text(encoding="utf-8") + f"\nGates passed: {passed}"
+
+    seeds = options.seeds
+    if options.shard is not None:
+        seeds = shard_seeds(seeds, index=options.shard[0], count=options.shard[1])
+    if options.async_concurrency is not None:
+        report = asyncio.run(
+            run_eval_async(profile=options.profile, seeds=seeds, out_dir=out, concurrency=options.async_concurrency)
+        )
+    else:
+        cache = None
+        if options.cache_dir is not None:
+            cache = ResultCache(options.cache_dir, max_bytes=options.cache_max_mb * 1024 * 1024)
+        report = run_eval(
+            profile=options.profile,
+            seeds=seeds,
+            out_dir=out,
+            workers=options.workers,
+            cache=cache,
+            resume=options.resume,
+            retain_results=False,
+            early_stop=options.early_stop,
+            journal_format=options.resolved_format,
+            journal_store=options.journal_store,
+        )
+    if options.shard is not None:
+        write_shard_manifest(out_dir=out, index=options.shard[0], count=options.shard[1])
+    return _summary_text(report, out)
+
+
+def merge_eval_shards(*, shard_dirs: Sequence[Path], out_dir: Path) -> str:
+    """Merge shard outputs into `out_dir` and return the report `eval_runner merge` prints."""
+
+    return _summary_text(merge_shards(shard_dirs=shard_dirs, out_dir=out_dir), out_dir)
+
+
+def _summary_text(report: EvalReport, out_dir: Path) -> str:
+    lines = [(out_dir / "eval_summary.md").read_text(encoding="utf-8")]
+    if report.cache_stats is not None:
+        stats = report.cache_stats
+        lines.append(
+            f"Cache: {stats.hits} hits, {stats.misses} misses "
+            f"(hit rate {stats.hit_rate:.1%}), {stats.evicted} evicted"
+        )
+    lines.append(f"Gate passed: {report.gate.passed}")
+    return "\n".join(lines)
@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Generator, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+import hashlib
+import time
+from typing import TypeVar
+
+from learning_compiler.agent.loop import run_agent
+from learning_compiler.agent.state import AgentProfile, AgentResult, AgentRunConfig
+from learning_compiler.eval.scenario_generator import incident_for_seed
+from learning_compiler.journal.models import JournalFormat
+from learning_compiler.journal.store import JournalStore
+from learning_compiler.types import JSONValue
+
+_CHUNKS_IN_FLIGHT_PER_WORKER = 2
+_MAX_CHUNK = 64
+
+_S = TypeVar("_S")
+_T = TypeVar("_T")
+
+
+def run_seeds(
+    *,
+    profile: AgentProfile,
+    seeds: Sequence[int],
+    runs_dir: Path,
+    workers: int = 1,
+    journal_format: JournalFormat = JournalFormat.JSONL,
+) -> list[AgentResult]:
+    """Run one agent per seed and return the results in seed order."""
+
+    return list(
+        iter_seed_results(
+            profile=profile, seeds=seeds, runs_dir=runs_dir, workers=workers, journal_format=journal_format
+        )
+    )
+
+
+def iter_seed_results(
+    *,
+    profile: AgentProfile,
+    seeds: Sequence[int],
+    runs_dir: Path,
+    workers: int = 1,
+    journal_format: JournalFormat = JournalFormat.JSONL,
+    journal_store: Path | None = None,
+) -> Generator[AgentResult, None, None]:
+    """Yield one `AgentResult` per seed, in seed order, as runs finish.
+
+    Each run is a pure function of (seed, profile) and writes only its own journal,
+    so fanning seeds out to a process pool produces byte-identical outputs to the
+    serial loop. At most `workers * _CHUNKS_IN_FLIGHT_PER_WORKER` chunks are in
+    flight, so memory stays bounded however many seeds there are.
+
+    With `journal_store`, journals go to that `JournalStore` instead of `runs_dir`.
+    """
+
+    with ExitStack() as stack:
+        store: Path | JournalStore | None = journal_store
+        if journal_store is not None and workers == 1:
+            # The serial loop shares one connection; pool workers open one per chunk.
+            store = stack.enter_context(JournalStore(journal_store))
+        run_chunk = partial(
+            _run_chunk, profile=profile, runs_dir=runs_dir, journal_format=journal_format, journal_store=store
+        )
+        yield from iter_chunked(run_chunk, items=seeds, workers=workers)
+
+
+def iter_matrix_results(
+    *, profiles: Sequence[AgentProfile], seeds: Sequence[int], runs_dirs: Sequence[Path], workers: int = 1
+) -> Iterator[tuple[AgentResult, ...]]:
+    """Yield, per seed and in seed order, one result for each of `profiles`.
+
+    Scheduling is seed-major: every profile of a seed runs back to back in the
+    same chunk, so per-seed setup is done once and paired results arrive together.
+    `runs_dirs[i]` receives the journals of `profiles[i]`.
+    """
+
+    if len(runs_dirs) != len(profiles):
+        raise ValueError("runs_dirs must match profiles")
+    run_chunk = partial(_run_matrix_chunk, profiles=tuple(profiles), runs_dirs=tuple(runs_dirs))
+    yield from iter_chunked(run_chunk, items=seeds, workers=workers)
+
+
+def iter_chunked(
+    run_chunk: Callable[[list[_S]], list[_T]], *, items: Sequence[_S], workers: int
+) -> Iterator[_T]:
+    """Yield `run_chunk`'s outputs over `items` in order, fanned out to a process pool.
+
+    Serially (`workers == 1`) each item is its own chunk, so results stream one by one.
+    """
+
+    if workers <= 0:
+        raise ValueError("workers must be positive")
+
+    if workers == 1 or len(items) <= 1:
+        for item in items:
+            yield from run_chunk([item])
+        return
+
+    size = _chunksize(n_items=len(items), workers=workers)
+    chunks = (items[i : i + size] for i in range(0, len(items), size))
+    in_flight: deque[Future[list[_T]]] = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        try:
+            for chunk in chunks:
+                if len(in_flight) >= workers * _CHUNKS_IN_FLIGHT_PER_WORKER:
+                    yield from in_flight.popleft().result()
+                in_flight.append(pool.submit(run_chunk, list(chunk)))
+            while in_flight:
+                yield from in_flight.popleft().result()
+        finally:
+            # A consumer that stops early shouldn't wait for chunks nobody will read.
+            for future in in_flight:
+                future.cancel()
+
+
+@dataclass(slots=True, frozen=True)
+class ScalingPoint:
+    workers: int
+    runs: int
+    wall_seconds: float
+
+    @property
+    def runs_per_second(self) -> float:
+        if self.wall_seconds <= 0.0:
+            return 0.0
+        return self.runs / self.wall_seconds
+
+    def to_json(self) -> dict[str, JSONValue]:
+        return {
+            "workers": self.workers,
+            "runs": self.runs,
+            "wall_seconds": round(self.wall_seconds, 6),
+            "runs_per_second": round(self.runs_per_second, 3),
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class ScalingReport:
+    profile: AgentProfile
+    points: tuple[ScalingPoint, ...]
+    outputs_identical: bool
+
+    def to_json(self) -> dict[str, JSONValue]:
+        return {
+            "profile": self.profile.value,
+            "points": [p.to_json() for p in self.points],
+            "outputs_identical": self.outputs_identical,
+        }
+
+    def to_markdown(self) -> str:
+        base = self.points[0].runs_per_second if self.points else 0.0
+        lines = []
+        lines.append("| Workers | Runs | Wall (s) | Runs/sec | Speedup |")
+        lines.append("|---:|---:|---:|---:|---:|")
+        for p in self.points:
+            speedup = p.runs_per_second / base if base > 0.0 else 0.0
+            lines.append(
+                f"| {p.workers} | {p.runs} | {p.wall_seconds:.3f} | {p.runs_per_second:.1f} | {speedup:.2f}x |"
+            )
+        return "\n".join(lines)
+
+
+def measure_scaling(
+    *, profile: AgentProfile, seeds: Sequence[int], out_dir: Path, worker_counts: Sequence[int]
+) -> ScalingReport:
+    """Time the same seed set at several worker counts (runs/sec vs workers).
+
+    Every worker count writes to its own runs dir; the results are compared against
+    the first worker count so the report doubles as a determinism check.
+    """
+
+    if not worker_counts:
+        raise ValueError("worker_counts must not be empty")
+
+    points: list[ScalingPoint] = []
+    reference: list[dict[str, JSONValue]] | None = None
+    identical = True
+    for workers in worker_counts:
+        runs_dir = out_dir / f"workers{workers:03d}" / "runs"
+        started = time.perf_counter()
+        results = run_seeds(profile=profile, seeds=seeds, runs_dir=runs_dir, workers=workers)
+        elapsed = time.perf_counter() - started
+        points.append(ScalingPoint(workers=workers, runs=len(results), wall_seconds=elapsed))
+
+        comparable = [_comparable(r) for r in results]
+        if reference is None:
+            reference = comparable
+        elif comparable != reference:
+            identical = False
+
+    return ScalingReport(profile=profile, points=tuple(points), outputs_identical=identical)
+
+
+def _run_seed(
+    seed: int,
+    *,
+    profile: AgentProfile,
+    runs_dir: Path,
+    journal_format: JournalFormat = JournalFormat.JSONL,
+    journal_store: JournalStore | None = None,
+) -> AgentResult:
+    cfg = AgentRunConfig(seed=seed, profile=profile, journal_format=journal_format)
+    incident = incident_for_seed(seed)
+    return run_agent(config=cfg, out_dir=runs_dir, incident_override=incident, journal_store=journal_store)
+
+
+def _run_chunk(
+    seeds: list[int],
+    *,
+    profile: AgentProfile,
+    runs_dir: Path,
+    journal_format: JournalFormat,
+    journal_store: Path | JournalStore | None = None,
+) -> list[AgentResult]:
+    if isinstance(journal_store, Path):
+        with JournalStore(journal_store) as store:
+            return _run_chunk(
+                seeds, profile=profile, runs_dir=runs_dir, journal_format=journal_format, journal_store=store
+            )
+    run_seed = partial(
+        _run_seed, profile=profile, runs_dir=runs_dir, journal_format=journal_format, journal_store=journal_store
+    )
+    return [run_seed(seed) for seed in seeds]
+
+
+def _run_matrix_chunk(
+    seeds: list[int], *, profiles: tuple[AgentProfile, ...], runs_dirs: tuple[Path, ...]
+) -> list[tuple[AgentResult, ...]]:
+    out: list[tuple[AgentResult, ...]] = []
+    for seed in seeds:
+        # World state is mutated by a run, so only the scenario choice is shared.
+        incident = incident_for_seed(seed)
+        out.append(
+            tuple(
+                run_agent(config=AgentRunConfig(seed=seed, profile=p), out_dir=d, incident_override=incident)
+                for p, d in zip(profiles, runs_dirs, strict=True)
+            )
+        )
+    return out
+
+
+def _chunksize(*, n_items: int, workers: int) -> int:
+    # A few chunks per worker keeps IPC overhead low without starving the tail;
+    # the cap keeps per-chunk memory bounded on huge suites.
+    return max(1, min(_MAX_CHUNK, n_items // (workers * 4)))
+
+
+def _comparable(result: AgentResult) -> dict[str, JSONValue]:
+    # Journal paths differ per worker count by construction; compare journal bytes instead.
+    out = result.to_json()
+    out["journal_path"] = hashlib.sha256(result.journal_path.read_bytes()).hexdigest()
+    return out
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from contextlib import ExitStack
+from functools import partial
+from pathlib import Path
+
+from learning_compiler.eval.journal_io import StoreCache, candidate_events
+from learning_compiler.eval.parallel import iter_chunked
+from learning_compiler.eval.query_aggregate import QueryAggregate
+from learning_compiler.eval.query_filter import JournalQuery, QueryMatch, RunInfo
+
+
+def iter_query(query: JournalQuery, *, journals: Sequence[Path], workers: int = 1) -> Iterator[QueryMatch]:
+    """Yield matching events journal by journal, in `journals` order, as they're found."""
+
+    with ExitStack() as stack:
+        stores: StoreCache | None = stack.enter_context(StoreCache()) if workers == 1 else None
+        run_chunk = partial(_query_chunk, query=query, stores=stores)
+        for matches in iter_chunked(run_chunk, items=journals, workers=workers):
+            yield from matches
+
+
+def aggregate_query(
+    query: JournalQuery,
+    *,
+    journals: Sequence[Path],
+    group_by: Sequence[str],
+    means: Sequence[str] = (),
+    workers: int = 1,
+) -> QueryAggregate:
+    """Group and aggregate the matches of `query`; pool workers pre-aggregate their chunks."""
+
+    total = QueryAggregate(group_by=group_by, means=means)
+    with ExitStack() as stack:
+        stores: StoreCache | None = stack.enter_context(StoreCache()) if workers == 1 else None
+        run_chunk = partial(_aggregate_chunk, query=query, group_by=group_by, means=means, stores=stores)
+        for partial_aggregate in iter_chunked(run_chunk, items=journals, workers=workers):
+            total.merge(partial_aggregate)
+    return total
+
+
+def _query_chunk(
+    journals: list[Path], *, query: JournalQuery, stores: StoreCache | None
+) -> list[list[QueryMatch]]:
+    if stores is None:
+        with StoreCache() as chunk_stores:
+            return _query_chunk(journals, query=query, stores=chunk_stores)
+    return [list(_journal_matches(path, query=query, stores=stores)) for path in journals]
+
+
+def _aggregate_chunk(
+    journals: list[Path],
+    *,
+    query: JournalQuery,
+    group_by: Sequence[str],
+    means: Sequence[str],
+    stores: StoreCache | None,
+) -> list[QueryAggregate]:
+    if stores is None:
+        with StoreCache() as chunk_stores:
+            run_chunk = partial(_aggregate_chunk, query=query, group_by=group_by, means=means)
+            return run_chunk(journals, stores=chunk_stores)
+    aggregate = QueryAggregate(group_by=group_by, means=means)
+    for path in journals:
+        for match in _journal_matches(path, query=query, stores=stores):
+            aggregate.add(match)
+    return [aggregate]
+
+
+def _journal_matches(path: Path, *, query: JournalQuery, stores: StoreCache) -> Iterator[QueryMatch]:
+    run = RunInfo.from_path(path)
+    if not query.matches_run(run):
+        return
+    for event in candidate_events(path, kinds=query.kinds, stores=stores):
+        if query.matches(event):
+            yield QueryMatch(run=run, event=event)
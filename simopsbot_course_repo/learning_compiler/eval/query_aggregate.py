@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+import json
+
+from learning_compiler.eval.query_filter import (
+    QueryMatch,
+    event_is_error,
+    event_service,
+    event_tool,
+    is_number,
+    payload_values,
+)
+from learning_compiler.types import JSONValue
+
+# Group-by keys that are not payload paths.
+FACETS = ("kind", "step", "tool", "service", "error", "seed", "profile", "incident", "journal")
+
+
+@dataclass(slots=True)
+class _GroupStats:
+    count: int = 0
+    errors: int = 0
+    sums: list[float] = field(default_factory=list)
+    samples: list[int] = field(default_factory=list)
+
+
+class QueryAggregate:
+    """Group-by counts, error rates and field means over query matches.
+
+    `group_by` entries are `FACETS` or dotted payload paths (first value, or
+    null); `means` are dotted payload paths averaged over the events that have a
+    number there. Partial aggregates from pool workers combine with `merge`.
+    """
+
+    def __init__(self, *, group_by: Sequence[str], means: Sequence[str] = ()) -> None:
+        self._group_by = tuple(group_by)
+        self._means = tuple(means)
+        self._mean_paths = tuple(tuple(m.split(".")) for m in means)
+        self._groups: dict[tuple[JSONValue, ...], _GroupStats] = {}
+
+    @property
+    def group_by(self) -> tuple[str, ...]:
+        return self._group_by
+
+    @property
+    def means(self) -> tuple[str, ...]:
+        return self._means
+
+    def add(self, match: QueryMatch) -> None:
+        key = tuple(_group_value(match, g) for g in self._group_by)
+        stats = self._groups.get(key)
+        if stats is None:
+            stats = self._groups[key] = self._new_stats()
+        stats.count += 1
+        stats.errors += event_is_error(match.event)
+        for i, path in enumerate(self._mean_paths):
+            for v in payload_values(match.event.payload, path):
+                if is_number(v):
+                    stats.sums[i] += v
+                    stats.samples[i] += 1
+                    break
+
+    def merge(self, other: QueryAggregate) -> None:
+        if (other.group_by, other.means) != (self._group_by, self._means):
+            raise ValueError("can only merge aggregates of the same shape")
+        for key, theirs in other._groups.items():
+            mine = self._groups.get(key)
+            if mine is None:
+                mine = self._groups[key] = self._new_stats()
+            mine.count += theirs.count
+            mine.errors += theirs.errors
+            mine.sums = [a + b for a, b in zip(mine.sums, theirs.sums, strict=True)]
+            mine.samples = [a + b for a, b in zip(mine.samples, theirs.samples, strict=True)]
+
+    def _new_stats(self) -> _GroupStats:
+        return _GroupStats(sums=[0.0] * len(self._means), samples=[0] * len(self._means))
+
+    def rows(self) -> list[dict[str, JSONValue]]:
+        """One row per group, sorted by group key."""
+
+        out: list[dict[str, JSONValue]] = []
+        for key in sorted(self._groups, key=lambda k: tuple(_sort_key(v) for v in k)):
+            stats = self._groups[key]
+            row: dict[str, JSONValue] = dict(zip(self._group_by, key, strict=True))
+            row["count"] = stats.count
+            row["errors"] = stats.errors
+            row["error_rate"] = round(stats.errors / stats.count, 6)
+            for name, total, n in zip(self._means, stats.sums, stats.samples, strict=True):
+                row[f"mean_{name}"] = round(total / n, 6) if n else None
+            out.append(row)
+        return out
+
+    def to_markdown(self) -> str:
+        rows = self.rows()
+        columns = [*self._group_by, "count", "errors", "error_rate", *(f"mean_{m}" for m in self._means)]
+        lines = []
+        lines.append("| " + " | ".join(columns) + " |")
+        lines.append("|" + "|".join("---" if c in self._group_by else "---:" for c in columns) + "|")
+        for row in rows:
+            lines.append("| " + " | ".join(_cell(row[c]) for c in columns) + " |")
+        return "\n".join(lines)
+
+
+def _group_value(match: QueryMatch, key: str) -> JSONValue:
+    e, run = match.event, match.run
+    if key == "kind":
+        return e.kind.value
+    if key == "step":
+        return e.step_id
+    if key == "tool":
+        return event_tool(e)
+    if key == "service":
+        return event_service(e)
+    if key == "error":
+        return event_is_error(e)
+    if key == "seed":
+        return run.seed
+    if key == "profile":
+        return run.profile
+    if key == "incident":
+        incident = run.incident
+        return None if incident is None else incident.value
+    if key == "journal":
+        return run.journal.name
+    return next(payload_values(e.payload, key.split(".")), None)
+
+
+def _sort_key(v: JSONValue) -> tuple[int, float, str]:
+    # Numbers numerically, then strings, then null; nested values by their JSON.
+    if is_number(v):
+        return (0, v, "")
+    if isinstance(v, str):
+        return (1, 0.0, v)
+    if v is None:
+        return (3, 0.0, "")
+    return (2, 0.0, json.dumps(v, sort_keys=True))
+
+
+def _cell(v: JSONValue) -> str:
+    if v is None:
+        return "-"
+    if isinstance(v, float):
+        return f"{v:.4f}"
+    return str(v)
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import suppress
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TypeGuard
+import json
+import re
+
+from learning_compiler.eval.scenario_generator import incident_for_seed
+from learning_compiler.journal.models import JournalEvent, JournalKind
+from learning_compiler.types import IncidentType, JSONValue, ToolName
+
+# `run_seed000007_week5.jsonl` (any format suffix; `_counter` after the profile for that RNG mode).
+_JOURNAL_NAME = re.compile(r"^run_seed(\d+)_([a-z0-9]+)(?:_[a-z]+)?\.")
+_PREDICATE = re.compile(r"^([A-Za-z_][A-Za-z0-9_.]*)\s*(>=|<=|!=|=|>|<|~)\s*(.*)$")
+_SIDE_EFFECT_TOOLS = {"ACT_RESTART": ToolName.RESTART.value, "ACT_ROLLBACK": ToolName.ROLLBACK.value}
+
+
+def event_tool(event: JournalEvent) -> str | None:
+    """The tool an event reports on (observations, verifies, errors and side effects)."""
+
+    p = event.payload
+    if event.kind in (JournalKind.OBSERVATION, JournalKind.VERIFY):
+        obs = p.get("observation")
+        tool = obs.get("tool") if isinstance(obs, dict) else None
+    elif event.kind is JournalKind.ERROR:
+        tool = p.get("tool")
+    elif event.kind is JournalKind.ACTION:
+        action = p.get("action")
+        a_type = action.get("type") if isinstance(action, dict) else None
+        tool = _SIDE_EFFECT_TOOLS.get(a_type) if isinstance(a_type, str) else None
+    else:
+        return None
+    return tool if isinstance(tool, str) else None
+
+
+def event_service(event: JournalEvent) -> str | None:
+    p = event.payload
+    for key in ("observation", "action"):
+        obj = p.get(key)
+        if isinstance(obj, dict):
+            service = obj.get("service")
+            return service if isinstance(service, str) else None
+    return None
+
+
+def event_is_error(event: JournalEvent) -> bool:
+    """A failed tool call: an ERROR event, or a side effect that ended in an error."""
+
+    return event.kind is JournalKind.ERROR or (event.kind is JournalKind.ACTION and "error" in event.payload)
+
+
+@dataclass(slots=True, frozen=True)
+class RunInfo:
+    """What a journal's name says about its run (eval journals map seeds to incidents)."""
+
+    journal: Path
+    seed: int | None
+    profile: str | None
+
+    @classmethod
+    def from_path(cls, journal: Path) -> RunInfo:
+        m = _JOURNAL_NAME.match(journal.name)
+        if m is None:
+            return cls(journal=journal, seed=None, profile=None)
+        return cls(journal=journal, seed=int(m.group(1)), profile=m.group(2))
+
+    @property
+    def incident(self) -> IncidentType | None:
+        return None if self.seed is None else incident_for_seed(self.seed)
+
+
+@dataclass(slots=True, frozen=True)
+class FieldPredicate:
+    """`path op value` over a payload, e.g. `observation.latency_ms>500`.
+
+    Dotted paths descend into objects; a list on the way matches if any element
+    does (`attempts.error_type=ToolTimeout`). `~` is substring match; other values
+    are parsed as JSON when they can be (`error_rate>=0.1`, `applied=true`).
+    """
+
+    path: tuple[str, ...]
+    op: str
+    value: JSONValue
+
+    @classmethod
+    def parse(cls, spec: str) -> FieldPredicate:
+        m = _PREDICATE.match(spec.strip())
+        if m is None:
+            raise ValueError(f"invalid predicate {spec!r}: expected PATH OP VALUE, OP in = != < <= > >= ~")
+        path, op, raw = m.groups()
+        value: JSONValue = raw
+        if op != "~":
+            with suppress(json.JSONDecodeError):
+                value = json.loads(raw)
+        return cls(path=tuple(path.split(".")), op=op, value=value)
+
+    def matches(self, payload: Mapping[str, JSONValue]) -> bool:
+        return any(self._compare(v) for v in payload_values(payload, self.path))
+
+    def _compare(self, v: JSONValue) -> bool:
+        op, want = self.op, self.value
+        if op == "=":
+            return v == want
+        if op == "!=":
+            return v != want
+        if op == "~":
+            return isinstance(v, str) and str(want) in v
+        if not (is_number(v) and is_number(want)):
+            return False
+        if op == ">":
+            return v > want
+        if op == ">=":
+            return v >= want
+        if op == "<":
+            return v < want
+        return v <= want
+
+
+def payload_values(payload: Mapping[str, JSONValue], path: Sequence[str]) -> Iterator[JSONValue]:
+    """Every value at dotted `path` in `payload`, fanning out over lists."""
+
+    if path and path[0] in payload:
+        yield from _descend(payload[path[0]], path[1:])
+
+
+def _descend(obj: JSONValue, path: Sequence[str]) -> Iterator[JSONValue]:
+    if isinstance(obj, list):
+        for item in obj:
+            yield from _descend(item, path)
+    elif not path:
+        yield obj
+    elif isinstance(obj, dict) and path[0] in obj:
+        yield from _descend(obj[path[0]], path[1:])
+
+
+@dataclass(slots=True, frozen=True)
+class JournalQuery:
+    """Event filter across many run journals (every given criterion must hold)."""
+
+    kinds: frozenset[JournalKind] = frozenset()
+    step_id: int | None = None
+    tool: str | None = None
+    service: str | None = None
+    incident: IncidentType | None = None
+    where: tuple[FieldPredicate, ...] = ()
+
+    def matches_run(self, run: RunInfo) -> bool:
+        # Decided from the journal name alone, before reading it.
+        return self.incident is None or run.incident is self.incident
+
+    def matches(self, event: JournalEvent) -> bool:
+        return (
+            (not self.kinds or event.kind in self.kinds)
+            and (self.step_id is None or event.step_id == self.step_id)
+            and (self.tool is None or event_tool(event) == self.tool)
+            and (self.service is None or event_service(event) == self.service)
+            and all(p.matches(event.payload) for p in self.where)
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class QueryMatch:
+    run: RunInfo
+    event: JournalEvent
+
+    def to_json(self) -> dict[str, JSONValue]:
+        incident = self.run.incident
+        return {
+            "journal": str(self.run.journal),
+            "seed": self.run.seed,
+            "incident": None if incident is None else incident.value,
+            "step_id": self.event.step_id,
+            "kind": self.event.kind.value,
+            "event_id": self.event.event_id,
+            "payload": dict(self.event.payload),
+        }
+
+
+def is_number(v: object) -> TypeGuard[int | float]:
+    return isinstance(v, (int, float)) and not isinstance(v, bool)
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from pathlib import Path
+from typing import IO
+import json
+
+from learning_compiler.agent.state import AgentProfile, AgentResult
+from learning_compiler.journal.store import JournalPresence
+from learning_compiler.types import JSONValue
+from learning_compiler.utils.json import canonical_dumps
+
+RESULTS_FILE = "results.jsonl"
+
+
+class ResultsLogError(Exception):
+    pass
+
+
+def iter_results(path: Path) -> Iterator[AgentResult]:
+    """Stream `AgentResult`s back from a results.jsonl file."""
+
+    with path.open("r", encoding="utf-8") as fp:
+        for line_no, line in enumerate(fp, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield AgentResult.from_json(json.loads(line))
+            except ValueError as e:
+                raise ResultsLogError(f"{path}:{line_no}: invalid result record") from e
+
+
+def resume_prefix(path: Path, *, profile: AgentProfile, seeds: Sequence[int]) -> int:
+    """Return how many leading `seeds` are already complete, truncating the rest.
+
+    Results are appended in seed order, so completed work is always a prefix. A
+    line counts only if it parses, matches the expected seed and profile, ends in a
+    newline (no torn write) and its journal exists. Everything after the first bad
+    line is cut off so the caller can append from there.
+    """
+
+    if not path.exists():
+        return 0
+
+    done = 0
+    good_bytes = 0
+    with path.open("rb") as fp, JournalPresence() as journals:
+        for raw in fp:
+            if done >= len(seeds) or not raw.endswith(b"\n"):
+                break
+            try:
+                result = AgentResult.from_json(json.loads(raw))
+            except ValueError:
+                break
+            if result.seed != seeds[done] or result.profile is not profile:
+                break
+            if not journals.exists(result.journal_path):
+                break
+            done += 1
+            good_bytes += len(raw)
+
+    with path.open("r+b") as fp:
+        fp.truncate(good_bytes)
+    return done
+
+
+def write_summary_json(
+    *, path: Path, head: Mapping[str, JSONValue], seeds: Iterable[int], results_path: Path
+) -> None:
+    """Write `canonical_dumps({**head, "results": [...], "seeds": [...]})` in O(1) memory.
+
+    Result records are spliced in line by line from results.jsonl (which already
+    holds their canonical encoding), so the output is byte-identical to dumping
+    the whole report at once.
+    """
+
+    keys = sorted([*head.keys(), "results", "seeds"])
+    with path.open("w", encoding="utf-8") as fp:
+        fp.write("{")
+        for n, key in enumerate(keys):
+            if n:
+                fp.write(",")
+            fp.write(canonical_dumps(key))
+            fp.write(":")
+            if key == "results":
+                _write_array(fp=fp, items=_result_lines(results_path))
+            elif key == "seeds":
+                _write_array(fp=fp, items=(str(s) for s in seeds))
+            else:
+                fp.write(canonical_dumps(head[key]))
+        fp.write("}")
+
+
+def _result_lines(path: Path) -> Iterator[str]:
+    with path.open("r", encoding="utf-8") as fp:
+        for line in fp:
+            stripped = line.rstrip("\n")
+            if stripped:
+                yield stripped
+
+
+def _write_array(*, fp: IO[str], items: Iterable[str]) -> None:
+    fp.write("[")
+    for n, item in enumerate(items):
+        if n:
+            fp.write(",")
+        fp.write(item)
+    fp.write("]")
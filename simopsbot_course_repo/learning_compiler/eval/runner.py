@@ -1,29 +1,52 @@
 from __future__ import annotations
 
+from collections.abc import Generator, Sequence
+from contextlib import closing
 from dataclasses import dataclass
 from pathlib import Path
 
-from learning_compiler.agent.loop import run_agent
-from learning_compiler.agent.state import AgentProfile, AgentResult, AgentRunConfig
+from learning_compiler.agent.state import AgentProfile, AgentResult
+from learning_compiler.eval.cache import CacheStats, ResultCache, iter_seed_results_cached
 from learning_compiler.eval.gate import DEFAULT_THRESHOLDS, GateResult, GateThresholds, check_gate
-from learning_compiler.eval.metrics import EvalMetrics, compute_metrics
-from learning_compiler.eval.scenario_generator import incident_for_seed
-from learning_compiler.types import JSONValue
-from learning_compiler.utils.json import canonical_dumps
+from learning_compiler.eval.metrics import EvalMetrics, MetricsAccumulator, compute_metrics
+from learning_compiler.eval.parallel import iter_seed_results
+from learning_compiler.eval.results_log import RESULTS_FILE, iter_results, resume_prefix, write_summary_json
+from learning_compiler.eval.sequential import EarlyStop, EarlyStopConfig, SequentialGate, StopBasis
+from learning_compiler.journal.models import JournalFormat
+from learning_compiler.journal.store import STORE_FILE
+from learning_compiler.types import DEFAULT_BUDGET, JSONValue
+from learning_compiler.utils.json import write_jsonl_line
 
 
 @dataclass(slots=True, frozen=True)
 class EvalReport:
+    """Outcome of one eval suite.
+
+    `results` may be empty when the run was asked not to retain them in memory;
+    results.jsonl on disk is always complete.
+    """
+
     profile: AgentProfile
-    seeds: tuple[int, ...]
+    seeds: Sequence[int]
     metrics: EvalMetrics
     gate: GateResult
     results: tuple[AgentResult, ...]
+    # Not serialized: a cached eval must produce the same summary as a fresh one.
+    cache_stats: CacheStats | None = None
+    # Set only when a sequential gate stopped the eval before its last seed.
+    early_stop: EarlyStop | None = None
 
     def to_json(self) -> dict[str, JSONValue]:
-        return {
+        out = self.summary_head()
+        out["seeds"] = list(self.seeds)
+        out["results"] = [r.to_json() for r in self.results]
+        return out
+
+    def summary_head(self) -> dict[str, JSONValue]:
+        """Everything in eval_summary.json except the per-seed arrays."""
+
+        out: dict[str, JSONValue] = {
             "profile": self.profile.value,
-            "seeds": list(self.seeds),
             "metrics": {
                 "total_runs": self.metrics.total_runs,
                 "recovery_success_rate": self.metrics.recovery_success_rate,
@@ -33,41 +56,197 @@ class EvalReport:
                 "unsafe_action_attempt_rate": self.metrics.unsafe_action_attempt_rate,
             },
             "gate": {"passed": self.gate.passed, "reasons": list(self.gate.reasons)},
-            "results": [r.to_json() for r in self.results],
         }
+        if self.early_stop is not None:
+            out["early_stop"] = self.early_stop.to_json()
+        return out
 
 
 def run_eval(
     *,
     profile: AgentProfile,
-    seeds: list[int],
+    seeds: Sequence[int],
     out_dir: Path,
     thresholds: GateThresholds | None = None,
+    workers: int = 1,
+    cache: ResultCache | None = None,
+    resume: bool = False,
+    retain_results: bool = True,
+    early_stop: EarlyStopConfig | None = None,
+    journal_format: JournalFormat = JournalFormat.JSONL,
+    journal_store: bool = False,
 ) -> EvalReport:
-    """Run an offline evaluation suite across seeds."""
+    """Run an offline evaluation suite across seeds.
+
+    `workers > 1` fans seeds out to a process pool; outputs are byte-identical to
+    the serial run. With a `cache`, unchanged seeds are served from disk and only
+    misses are simulated.
 
+    Each result is appended to results.jsonl as soon as its run finishes and
+    metrics are folded incrementally, so a crash loses at most the runs in
+    flight. `resume=True` keeps the completed prefix of an earlier results.jsonl
+    and runs only the rest. With `retain_results=False` memory stays bounded
+    regardless of suite size.
+
+    With `early_stop`, the gate is re-checked after every run and the eval ends
+    as soon as its outcome is settled (see `SequentialGate`); the report then
+    covers only the seeds that ran and records the stop in `early_stop`.
+
+    `journal_store=True` appends every journal to one `JournalStore` at
+    `out_dir/journals.sqlite` instead of writing a file per seed under `runs/`.
+    """
+
+    if journal_store and (cache is not None or journal_format is not JournalFormat.JSONL):
+        raise ValueError("journal_store needs plain JSONL journals and no result cache")
     out_dir.mkdir(parents=True, exist_ok=True)
     runs_dir = out_dir / "runs"
-    runs_dir.mkdir(parents=True, exist_ok=True)
+    store_path = out_dir / STORE_FILE if journal_store else None
+    if store_path is None:
+        runs_dir.mkdir(parents=True, exist_ok=True)
+    results_path = out_dir / RESULTS_FILE
+
+    effective_thresholds = thresholds or DEFAULT_THRESHOLDS
+    done = resume_prefix(results_path, profile=profile, seeds=seeds) if resume else 0
 
-    results: list[AgentResult] = []
-    for seed in seeds:
-        cfg = AgentRunConfig(seed=seed, profile=profile)
-        incident = incident_for_seed(seed)
-        result = run_agent(config=cfg, out_dir=runs_dir, incident_override=incident)
-        results.append(result)
+    acc = MetricsAccumulator()
+    retained: list[AgentResult] = []
+    cache_before = cache.stats if cache is not None else CacheStats(hits=0, misses=0, evicted=0)
+
+    def record(result: AgentResult) -> None:
+        acc.add(result)
+        if retain_results:
+            retained.append(result)
+
+    sequential = None
+    if early_stop is not None:
+        sequential = SequentialGate(
+            thresholds=effective_thresholds,
+            config=early_stop,
+            planned_runs=len(seeds),
+            max_steps=DEFAULT_BUDGET.max_steps,
+        )
+
+    if done:
+        for result in iter_results(results_path):
+            record(result)
+    stopped = sequential.check(acc) if sequential is not None else None
+
+    fresh = _iter_fresh_results(
+        profile=profile,
+        seeds=seeds[done:] if stopped is None else seeds[:0],
+        runs_dir=runs_dir,
+        thresholds=effective_thresholds,
+        workers=workers,
+        cache=cache,
+        journal_format=journal_format,
+        journal_store=store_path,
+    )
+    with closing(fresh), results_path.open("a" if done else "w", encoding="utf-8") as fp:
+        for result in fresh:
+            write_jsonl_line(fp, result.to_json())
+            fp.flush()
+            record(result)
+            if sequential is not None:
+                stopped = sequential.check(acc)
+                if stopped is not None:
+                    break
+
+    metrics = acc.finish()
+    if stopped is None:
+        gate = check_gate(metrics=metrics, thresholds=effective_thresholds)
+    else:
+        seeds = seeds[: stopped.runs]
+        gate = stopped.gate_result()
+    report = EvalReport(
+        profile=profile,
+        seeds=seeds,
+        metrics=metrics,
+        gate=gate,
+        results=tuple(retained),
+        cache_stats=cache.stats.since(cache_before) if cache is not None else None,
+        early_stop=stopped,
+    )
+    write_summaries(out_dir=out_dir, report=report)
+    return report
+
+
+def finish_eval(
+    *,
+    profile: AgentProfile,
+    seeds: Sequence[int],
+    results: Sequence[AgentResult],
+    out_dir: Path,
+    thresholds: GateThresholds | None = None,
+    cache_stats: CacheStats | None = None,
+) -> EvalReport:
+    """Fold in-memory results into metrics + gate decision and write the eval outputs."""
 
     metrics = compute_metrics(results=results)
     gate = check_gate(metrics=metrics, thresholds=thresholds or DEFAULT_THRESHOLDS)
 
-    report = EvalReport(profile=profile, seeds=tuple(seeds), metrics=metrics, gate=gate, results=tuple(results))
+    report = EvalReport(
+        profile=profile,
+        seeds=seeds,
+        metrics=metrics,
+        gate=gate,
+        results=tuple(results),
+        cache_stats=cache_stats,
+    )
 
-    _write_outputs(out_dir=out_dir, report=report)
+    write_eval_outputs(out_dir=out_dir, report=report)
     return report
 
 
-def _write_outputs(*, out_dir: Path, report: EvalReport) -> None:
-    (out_dir / "eval_summary.json").write_text(canonical_dumps(report.to_json()), encoding="utf-8")
+def write_eval_outputs(*, out_dir: Path, report: EvalReport) -> None:
+    # One JSON per line for simple grepping.
+    with (out_dir / RESULTS_FILE).open("w", encoding="utf-8") as fp:
+        for r in report.results:
+            write_jsonl_line(fp, r.to_json())
+    write_summaries(out_dir=out_dir, report=report)
+
+
+def _iter_fresh_results(
+    *,
+    profile: AgentProfile,
+    seeds: Sequence[int],
+    runs_dir: Path,
+    thresholds: GateThresholds,
+    workers: int,
+    cache: ResultCache | None,
+    journal_format: JournalFormat,
+    journal_store: Path | None,
+) -> Generator[AgentResult, None, None]:
+    # A generator itself, so closing it early also shuts down the pool underneath.
+    if cache is None:
+        yield from iter_seed_results(
+            profile=profile,
+            seeds=seeds,
+            runs_dir=runs_dir,
+            workers=workers,
+            journal_format=journal_format,
+            journal_store=journal_store,
+        )
+        return
+    yield from iter_seed_results_cached(
+        cache=cache,
+        profile=profile,
+        seeds=seeds,
+        runs_dir=runs_dir,
+        thresholds=thresholds,
+        workers=workers,
+        journal_format=journal_format,
+    )
+
+
+def write_summaries(*, out_dir: Path, report: EvalReport) -> None:
+    """Write eval_summary.json/.md; results are streamed from results.jsonl."""
+
+    write_summary_json(
+        path=out_dir / "eval_summary.json",
+        head=report.summary_head(),
+        seeds=report.seeds,
+        results_path=out_dir / RESULTS_FILE,
+    )
 
     md_lines: list[str] = []
     md_lines.append(f"# Eval Summary ({report.profile.value})")
@@ -85,11 +264,9 @@ def _write_outputs(*, out_dir: Path, report: EvalReport) -> None:
             md_lines.append(f"  - {r}")
     else:
         md_lines.append("- Reasons: none")
+    if report.early_stop is not None:
+        stop = report.early_stop
+        basis = "certain" if stop.basis is StopBasis.CERTAIN else f"{stop.confidence:.1%} confidence"
+        md_lines.append(f"- Early stop: after {stop.runs}/{stop.planned_runs} runs ({basis})")
 
     (out_dir / "eval_summary.md").write_text("\n".join(md_lines) + "\n", encoding="utf-8")
-
-    # One JSON per line for simple grepping.
-    with (out_dir / "results.jsonl").open("w", encoding="utf-8") as fp:
-        for r in report.results:
-            fp.write(canonical_dumps(r.to_json()))
-            fp.write("\n")
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+
+def parse_seed_spec(spec: str) -> Sequence[int]:
+    """Parse a CLI seed spec: '0:50' (range, end exclusive), '1,2,3', or '7'.
+
+    Ranges come back as a lazy `range`, so million-seed suites are never materialized.
+    """
+
+    s = spec.strip()
+    if ":" in s:
+        left, right = s.split(":", maxsplit=1)
+        start = int(left) if left else 0
+        end = int(right)
+        if end < start:
+            raise ValueError("range end must be >= start")
+        return range(start, end)
+    if "," in s:
+        return [int(x.strip()) for x in s.split(",") if x.strip()]
+    return [int(s)]
+
+
+def parse_shard_spec(spec: str) -> tuple[int, int]:
+    """Parse 'K/N' (1-based shard K of N)."""
+
+    left, sep, right = spec.strip().partition("/")
+    if not sep:
+        raise ValueError("shard spec must look like 'K/N'")
+    index, count = int(left), int(right)
+    if count <= 0:
+        raise ValueError("shard count must be positive")
+    if not (1 <= index <= count):
+        raise ValueError("shard index must be in [1, N]")
+    return index, count
+
+
+def shard_seeds(seeds: Sequence[int], *, index: int, count: int) -> Sequence[int]:
+    """Return the contiguous block of `seeds` owned by 1-based shard `index` of `count`.
+
+    Blocks are contiguous (not strided) so concatenating shards 1..N in order gives
+    back the original seed order; slicing a `range` stays lazy.
+    """
+
+    if count <= 0 or not (1 <= index <= count):
+        raise ValueError("shard must satisfy 1 <= index <= count")
+    n = len(seeds)
+    start = (index - 1) * n // count
+    stop = index * n // count
+    return seeds[start:stop]
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import partial
+import math
+
+from learning_compiler.eval.gate import GateResult, GateThresholds
+from learning_compiler.eval.metrics import MetricsAccumulator
+from learning_compiler.types import JSONValue
+
+# Gated metrics share one error budget (union bound over the four of them).
+_GATED_METRICS = 4
+
+
+@dataclass(slots=True, frozen=True)
+class EarlyStopConfig:
+    """Opt-in sequential gate: stop an eval as soon as its gate outcome is settled.
+
+    `confidence` is the probability that a statistical early stop agrees with the
+    gate on the full seed list; outcomes that are already certain (e.g. an unsafe
+    run against a 0.0 threshold) stop regardless of `min_runs`.
+    """
+
+    confidence: float = 0.99
+    min_runs: int = 20
+
+    def validate(self) -> None:
+        if not (0.0 < self.confidence < 1.0):
+            raise ValueError("confidence must be in (0, 1)")
+        if self.min_runs <= 0:
+            raise ValueError("min_runs must be positive")
+
+
+class StopBasis(StrEnum):
+    # Holds whatever the remaining seeds do.
+    CERTAIN = "certain"
+    # Holds at the configured confidence.
+    CONFIDENCE = "confidence"
+
+
+@dataclass(slots=True, frozen=True)
+class MetricBound:
+    """Bounds on a gated metric's value over the full seed list."""
+
+    metric: str
+    observed: float
+    lower: float
+    upper: float
+    threshold: float
+    at_least: bool
+
+    @property
+    def fails(self) -> bool:
+        return self.upper < self.threshold if self.at_least else self.lower > self.threshold
+
+    @property
+    def passes(self) -> bool:
+        return self.lower >= self.threshold if self.at_least else self.upper <= self.threshold
+
+    def reason(self) -> str:
+        if self.at_least:
+            return f"{self.metric} upper bound {self.upper:.3f} < {self.threshold:.3f}"
+        return f"{self.metric} lower bound {self.lower:.3f} > {self.threshold:.3f}"
+
+    def to_json(self) -> dict[str, JSONValue]:
+        return {
+            "observed": self.observed,
+            "lower": self.lower,
+            "upper": self.upper,
+            "threshold": self.threshold,
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class EarlyStop:
+    """Where a sequential eval stopped, and the bounds that justified it."""
+
+    passed: bool
+    basis: StopBasis
+    runs: int
+    planned_runs: int
+    confidence: float
+    bounds: tuple[MetricBound, ...]
+
+    @property
+    def reasons(self) -> tuple[str, ...]:
+        return tuple(b.reason() for b in self.bounds if b.fails)
+
+    def gate_result(self) -> GateResult:
+        return GateResult(passed=self.passed, reasons=self.reasons)
+
+    def to_json(self) -> dict[str, JSONValue]:
+        return {
+            "passed": self.passed,
+            "basis": self.basis.value,
+            "runs": self.runs,
+            "planned_runs": self.planned_runs,
+            "confidence": self.confidence,
+            "bounds": {b.metric: b.to_json() for b in self.bounds},
+        }
+
+
+class SequentialGate:
+    """Decide the regression gate from a prefix of the seed list.
+
+    After each run the gated metrics are bounded over the *full* seed list: the
+    observed totals plus the best and worst the remaining runs could contribute.
+    "Certain" bounds let the remaining runs take any value; "confidence" bounds
+    limit their mean with two Hoeffding terms, each given half of the error
+    budget: one for how far the underlying rate can be from the observed mean,
+    and one for how far the remaining runs, a finite sample themselves, can land
+    from that rate. The budget is split across checks as alpha / (n (n + 1)), so
+    looking after every run doesn't inflate it. Runs are treated as exchangeable.
+
+    The eval stops with a failure once any metric certainly or confidently misses
+    its threshold, and with a pass only once every metric clears it. A 0.0
+    unsafe-rate threshold can never be confidently met early, so under the
+    default thresholds only failing evals stop before the last seed.
+    """
+
+    def __init__(
+        self, *, thresholds: GateThresholds, config: EarlyStopConfig, planned_runs: int, max_steps: int
+    ) -> None:
+        thresholds.validate()
+        config.validate()
+        self._thresholds = thresholds
+        self._config = config
+        self._planned = planned_runs
+        self._max_steps = max_steps
+
+    def check(self, acc: MetricsAccumulator) -> EarlyStop | None:
+        n = acc.total_runs
+        if n == 0 or n >= self._planned:
+            return None
+
+        stop = self._decide(acc=acc, basis=StopBasis.CERTAIN, log_term=math.inf)
+        if stop is not None or n < self._config.min_runs:
+            return stop
+
+        alpha = (1.0 - self._config.confidence) / _GATED_METRICS / (n * (n + 1))
+        # Two-sided Hoeffding at alpha / 2 for each of the two terms in `_bound`.
+        return self._decide(acc=acc, basis=StopBasis.CONFIDENCE, log_term=math.log(4.0 / alpha))
+
+    def _decide(self, *, acc: MetricsAccumulator, basis: StopBasis, log_term: float) -> EarlyStop | None:
+        t = self._thresholds
+        bound = partial(self._bound, acc=acc, log_term=log_term)
+        bounds = (
+            bound("recovery_success_rate", acc.resolved_runs, t.min_recovery_success_rate, True),
+            bound("mean_steps", acc.total_steps, t.max_mean_steps, False, hi=self._max_steps),
+            bound("evidence_compliance_rate", acc.evidence_compliant_runs, t.min_evidence_compliance_rate, True),
+            bound("unsafe_action_attempt_rate", acc.unsafe_runs, t.max_unsafe_action_attempt_rate, False),
+        )
+
+        if any(b.fails for b in bounds):
+            passed = False
+        elif all(b.passes for b in bounds):
+            passed = True
+        else:
+            return None
+        return EarlyStop(
+            passed=passed,
+            basis=basis,
+            runs=acc.total_runs,
+            planned_runs=self._planned,
+            confidence=1.0 if basis is StopBasis.CERTAIN else self._config.confidence,
+            bounds=bounds,
+        )
+
+    def _bound(
+        self,
+        metric: str,
+        total: float,
+        threshold: float,
+        at_least: bool,
+        *,
+        acc: MetricsAccumulator,
+        log_term: float,
+        hi: float = 1.0,
+    ) -> MetricBound:
+        # Per-run values lie in [0, hi]; the widths are relative to that range.
+        n = acc.total_runs
+        remaining = self._planned - n
+        observed = total / n
+        # The rate is within `width` of what was observed, and the remaining runs'
+        # mean within `rest_width` of the rate (wide when few runs are left).
+        width = math.sqrt(log_term / (2.0 * n))
+        rest_width = math.sqrt(log_term / (2.0 * remaining))
+        rest_lo = min(hi, max(0.0, observed - (width + rest_width) * hi))
+        rest_hi = min(hi, max(0.0, observed + (width + rest_width) * hi))
+        return MetricBound(
+            metric=metric,
+            observed=observed,
+            lower=(total + remaining * rest_lo) / self._planned,
+            upper=(total + remaining * rest_hi) / self._planned,
+            threshold=threshold,
+            at_least=at_least,
+        )
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from pathlib import Path
+import dataclasses
+import json
+import os
+import shutil
+
+from learning_compiler.agent.state import AgentResult
+from learning_compiler.eval.gate import GateThresholds
+from learning_compiler.eval.results_log import RESULTS_FILE, ResultsLogError, iter_results
+from learning_compiler.eval.runner import EvalReport, finish_eval
+from learning_compiler.journal.store import STORE_FILE, JournalStore, store_locator
+from learning_compiler.utils.json import canonical_dumps
+
+_MANIFEST_FILE = "shard.json"
+
+
+class ShardMergeError(Exception):
+    pass
+
+
+def write_shard_manifest(*, out_dir: Path, index: int, count: int) -> None:
+    """Record which shard an eval output dir holds (read back by `merge_shards`)."""
+
+    (out_dir / _MANIFEST_FILE).write_text(canonical_dumps({"index": index, "count": count}), encoding="utf-8")
+
+
+def merge_shards(
+    *, shard_dirs: Sequence[Path], out_dir: Path, thresholds: GateThresholds | None = None
+) -> EvalReport:
+    """Combine shard output dirs into one eval, identical to a single-host run.
+
+    Only `shard.json` and `results.jsonl` are read: per-run metrics travel in the
+    result records, so journals are never re-parsed. Journals are hard-linked (or
+    copied, across filesystems) into `out_dir/runs` so `journal_path` matches what
+    a single-host run would have written; shards run with a journal store have
+    their stores copied into `out_dir/journals.sqlite` instead.
+    """
+
+    if not shard_dirs:
+        raise ShardMergeError("no shard dirs given")
+
+    ordered = sorted(((_read_manifest(d), d) for d in shard_dirs), key=lambda x: x[0][0])
+    counts = {count for (_, count), _ in ordered}
+    if len(counts) != 1:
+        raise ShardMergeError(f"shards disagree on shard count: {sorted(counts)}")
+    expected = list(range(1, counts.pop() + 1))
+    got = [index for (index, _), _ in ordered]
+    if got != expected:
+        raise ShardMergeError(f"expected shards {expected}, got {got}")
+
+    runs_dir = out_dir / "runs"
+    store_path = out_dir / STORE_FILE
+
+    results: list[AgentResult] = []
+    for _, shard_dir in ordered:
+        shard_store = shard_dir / STORE_FILE
+        if shard_store.is_file() and shard_store.resolve() != store_path.resolve():
+            with JournalStore(store_path) as store:
+                store.copy_from(shard_store)
+        for result in _read_results(shard_dir):
+            if result.journal_path.parent == shard_store:
+                located = store_locator(store_path, result.journal_path.name)
+                results.append(dataclasses.replace(result, journal_path=located))
+            else:
+                results.append(_relocate_journal(result=result, runs_dir=runs_dir))
+
+    if not results:
+        raise ShardMergeError("shards contain no results")
+    profiles = {r.profile for r in results}
+    if len(profiles) != 1:
+        raise ShardMergeError(f"shards mix profiles: {sorted(p.value for p in profiles)}")
+
+    return finish_eval(
+        profile=results[0].profile,
+        seeds=[r.seed for r in results],
+        results=results,
+        out_dir=out_dir,
+        thresholds=thresholds,
+    )
+
+
+def _read_manifest(shard_dir: Path) -> tuple[int, int]:
+    path = shard_dir / _MANIFEST_FILE
+    try:
+        obj: object = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as e:
+        raise ShardMergeError(f"{path}: missing or invalid shard manifest") from e
+    if not isinstance(obj, dict):
+        raise ShardMergeError(f"{path}: expected JSON object")
+    index, count = obj.get("index"), obj.get("count")
+    if not isinstance(index, int) or not isinstance(count, int):
+        raise ShardMergeError(f"{path}: index/count must be ints")
+    return index, count
+
+
+def _read_results(shard_dir: Path) -> list[AgentResult]:
+    try:
+        return list(iter_results(shard_dir / RESULTS_FILE))
+    except (OSError, ResultsLogError) as e:
+        raise ShardMergeError(f"{shard_dir}: unreadable results") from e
+
+
+def _relocate_journal(*, result: AgentResult, runs_dir: Path) -> AgentResult:
+    dst = runs_dir / result.journal_path.name
+    src = result.journal_path
+    runs_dir.mkdir(parents=True, exist_ok=True)
+    if src.resolve() != dst.resolve():
+        dst.unlink(missing_ok=True)
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copyfile(src, dst)
+    return dataclasses.replace(result, journal_path=dst)
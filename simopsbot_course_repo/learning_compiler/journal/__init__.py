@@ -1,5 +1,17 @@
 from learning_compiler.journal.models import JournalEvent, JournalKind
-from learning_compiler.journal.reader import read_journal
-from learning_compiler.journal.writer import RunJournalWriter
+from learning_compiler.journal.reader import iter_journal, read_journal
+from learning_compiler.journal.tally import JournalTally, RunMetrics, tally_events
+from learning_compiler.journal.writer import FlushPolicy, JournalDurability, RunJournalWriter
 
-__all__ = ["JournalEvent", "JournalKind", "RunJournalWriter", "read_journal"]
+__all__ = [
+    "FlushPolicy",
+    "JournalDurability",
+    "JournalEvent",
+    "JournalKind",
+    "JournalTally",
+    "RunJournalWriter",
+    "RunMetrics",
+    "iter_journal",
+    "read_journal",
+    "tally_events",
+]
@@ -0,0 +1,366 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+import struct
+
+from learning_compiler.journal.models import JournalEvent, JournalKind, JournalParseError
+from learning_compiler.types import JSONValue, RunId
+from learning_compiler.utils.json import canonical_dumps
+
+# File layout (all integers are LEB128 varints, signed ones zigzag-encoded):
+#
+#   header:  MAGIC, dictionary id, run_id (str)
+#   event:   body length, then body =
+#            (kind index << 1 | compact id flag), event id, step id, payload value
+#
+# Values are tagged. Strings are interned per file: the table starts out with the
+# dictionary's vocabulary (payload keys and enum values), the first occurrence of
+# any other string is written inline and appended to it, repeats are refs, and
+# strings equal to an earlier event's ID refer to that event. Non-empty lists and
+# objects are interned the same way (budgets, actions and hypotheses repeat from
+# step to step), so decoded payloads may share them: treat them as read-only.
+# Lowercase hex strings (event IDs, idempotency keys) are stored as raw bytes.
+MAGIC = b"SOJB\x01"
+
+_NULL, _FALSE, _TRUE, _INT, _FLOAT, _DECIMAL = range(6)
+_STR, _REF, _EVENT_REF, _HEX, _LIST, _OBJECT, _VALUE_REF = range(6, 13)
+# One-byte forms for the common cases: string refs 0..111 and ints 0..127.
+_SMALL_REF = 16
+_SMALL_REF_MAX = 112
+_SMALL_INT = 128
+
+_HEX_ID_LENGTH = 12
+_HEX_DIGITS = frozenset("0123456789abcdef")
+_MIN_HEX_LENGTH = 8
+_DOUBLE = struct.Struct("<d")
+
+# Dictionaries are part of the file format: never edit a published one, add a new
+# id (and make it the default) instead. Each is (journal kinds, preset strings),
+# with the most frequent strings first so they get one-byte refs.
+_DICTIONARIES: dict[int, tuple[tuple[str, ...], tuple[str, ...]]] = {
+    1: (
+        (
+            "step_start", "observation", "model_proposal", "validation", "policy",
+            "action", "verify", "final", "error",
+        ),
+        (
+            "service", "confidence", "cause", "evidence_ids", "type", "tool", "api", "low",
+            "idempotency_key", "error", "step_id", "budget", "tool_calls", "max_tool_calls",
+            "max_steps", "side_effect_actions", "max_side_effect_actions", "proposal",
+            "chosen_action", "valid", "observation", "action", "ACT_RESTART", "window_minutes",
+            "outcome", "attempt_no", "attempts", "db_saturation", "network_flaky",
+            "api_bad_deploy", "hypotheses", "message", "applied", "receipt", "success",
+            "get_metrics", "error_rate", "latency_ms", "db", "ACT_ROLLBACK", "version", "v1",
+            "v2", "reason", "restart", "rollback", "health_check", "tail_logs",
+            "OBSERVE_METRICS", "OBSERVE_LOGS", "OBSERVE_HEALTH", "FINAL", "medium", "high",
+            "policy", "decision", "allow", "block", "allowed", "fallback", "guardrails",
+            "override", "status", "details", "ok", "healthy", "degraded", "down", "lines",
+            "n", "summary", "evidence_refs", "error_type", "error_message", "ToolTimeout",
+            "ToolTransientError", "ToolPermanentError", "unhealthy_metrics",
+            "uncertainty_gate", "fallback_action", "best_hypothesis", "RUNBOOK_SEARCH",
+            "runbook_search", "ASK_USER", "question", "query", "snippets",
+        ),
+    ),
+}
+_DICTIONARY_ID = 1
+
+
+class BinaryJournalEncoder:
+    """Stateful encoder for one binary journal (the string table spans the file)."""
+
+    def __init__(self, *, run_id: RunId) -> None:
+        self._run_id = run_id
+        kinds, strings = _DICTIONARIES[_DICTIONARY_ID]
+        self._kinds = {JournalKind(kind): n for n, kind in enumerate(kinds)}
+        self._strings = {s: n for n, s in enumerate(strings)}
+        self._values: dict[str, int] = {}
+        # First event (by position) carrying each ID.
+        self._event_ids: dict[str, int] = {}
+        self._events = 0
+
+    def header(self) -> bytes:
+        out = bytearray(MAGIC)
+        _put_uint(out, _DICTIONARY_ID)
+        _put_text(out, str(self._run_id))
+        return bytes(out)
+
+    def encode(
+        self, *, event_id: str, step_id: int, kind: JournalKind, payload: dict[str, JSONValue]
+    ) -> bytes:
+        body = bytearray()
+        compact = len(event_id) == _HEX_ID_LENGTH and _HEX_DIGITS.issuperset(event_id)
+        _put_uint(body, self._kinds[kind] << 1 | compact)
+        if compact:
+            body += bytes.fromhex(event_id)
+        else:
+            self._put_str(body, event_id)
+        _put_uint(body, _zigzag(step_id))
+        # Payloads are written inline: they almost never repeat whole.
+        self._put_container(body, payload)
+        self._event_ids.setdefault(event_id, self._events)
+        self._events += 1
+
+        out = bytearray()
+        _put_uint(out, len(body))
+        out += body
+        return bytes(out)
+
+    def _put_value(self, out: bytearray, value: JSONValue) -> None:
+        if isinstance(value, str):
+            self._put_str(out, value)
+        elif value is None:
+            out.append(_NULL)
+        elif value is True:
+            out.append(_TRUE)
+        elif value is False:
+            out.append(_FALSE)
+        elif isinstance(value, int):
+            if 0 <= value < 256 - _SMALL_INT:
+                out.append(_SMALL_INT + value)
+            else:
+                out.append(_INT)
+                _put_uint(out, _zigzag(value))
+        elif isinstance(value, float):
+            _put_float(out, value)
+        elif not value:
+            out.append(_LIST if isinstance(value, list) else _OBJECT)
+            out.append(0)
+        else:
+            key = canonical_dumps(value)
+            ref = self._values.get(key)
+            if ref is not None:
+                out.append(_VALUE_REF)
+                _put_uint(out, ref)
+                return
+            self._put_container(out, value)
+            self._values[key] = len(self._values)
+
+    def _put_container(self, out: bytearray, value: list[JSONValue] | dict[str, JSONValue]) -> None:
+        if isinstance(value, list):
+            out.append(_LIST)
+            _put_uint(out, len(value))
+            for item in value:
+                self._put_value(out, item)
+        else:
+            out.append(_OBJECT)
+            _put_uint(out, len(value))
+            # Sorted like canonical JSON, so the bytes don't depend on insertion order.
+            for k in sorted(value):
+                self._put_str(out, k)
+                self._put_value(out, value[k])
+
+    def _put_str(self, out: bytearray, value: str) -> None:
+        ref = self._strings.get(value)
+        if ref is not None:
+            if ref < _SMALL_REF_MAX:
+                out.append(_SMALL_REF + ref)
+            else:
+                out.append(_REF)
+                _put_uint(out, ref)
+            return
+        event_ref = self._event_ids.get(value)
+        if event_ref is not None:
+            out.append(_EVENT_REF)
+            _put_uint(out, event_ref)
+            return
+        self._strings[value] = len(self._strings)
+        if len(value) >= _MIN_HEX_LENGTH and len(value) % 2 == 0 and _HEX_DIGITS.issuperset(value):
+            out.append(_HEX)
+            raw = bytes.fromhex(value)
+            _put_uint(out, len(raw))
+            out += raw
+        else:
+            out.append(_STR)
+            _put_text(out, value)
+
+
+def is_binary_journal(path: Path) -> bool:
+    with path.open("rb") as fp:
+        return fp.read(len(MAGIC)) == MAGIC
+
+
+def read_binary_journal(path: Path) -> list[JournalEvent]:
+    return list(iter_binary_journal(path))
+
+
+def iter_binary_journal(path: Path) -> Iterator[JournalEvent]:
+    # The file is small enough to decode from memory; events are still built lazily.
+    return _BinaryDecoder(path.read_bytes(), where=str(path)).events()
+
+
+class _BinaryDecoder:
+    def __init__(self, data: bytes, *, where: str) -> None:
+        self._data = data
+        self._pos = 0
+        self._where = where
+        self._strings: list[str] = []
+        self._values: list[JSONValue] = []
+        self._event_ids: list[str] = []
+
+    def events(self) -> Iterator[JournalEvent]:
+        data = self._data
+        if not data.startswith(MAGIC):
+            raise JournalParseError(f"{self._where}: not a binary journal")
+        self._pos = len(MAGIC)
+        try:
+            dictionary = _DICTIONARIES.get(self._uint())
+            if dictionary is None:
+                raise JournalParseError(f"{self._where}: unknown string dictionary")
+            run_id = RunId(self._text())
+            kinds = [JournalKind(kind) for kind in dictionary[0]]
+            self._strings = list(dictionary[1])
+            n = 0
+            while self._pos < len(data):
+                n += 1
+                end = self._uint()
+                end += self._pos
+                if end > len(data):
+                    raise JournalParseError(f"{self._where}: truncated event {n}")
+                head = self._uint()
+                if head & 1:
+                    event_id = data[self._pos : self._pos + _HEX_ID_LENGTH // 2].hex()
+                    self._pos += _HEX_ID_LENGTH // 2
+                else:
+                    event_id = self._str(data[self._pos])
+                step_id = _unzigzag(self._uint())
+                if data[self._pos] != _OBJECT:
+                    raise JournalParseError(f"{self._where}: event {n} payload is not an object")
+                payload = self._object()
+                if self._pos != end:
+                    raise JournalParseError(f"{self._where}: malformed event {n}")
+                self._event_ids.append(event_id)
+                kind = kinds[head >> 1]
+                yield JournalEvent(event_id=event_id, run_id=run_id, step_id=step_id, kind=kind, payload=payload)
+        except (IndexError, ValueError, UnicodeDecodeError, struct.error) as e:
+            raise JournalParseError(f"{self._where}: corrupt binary journal") from e
+
+    def _value(self) -> JSONValue:
+        tag = self._data[self._pos]
+        if tag >= _SMALL_INT:
+            self._pos += 1
+            return tag - _SMALL_INT
+        if tag >= _SMALL_REF:
+            self._pos += 1
+            return self._strings[tag - _SMALL_REF]
+        if tag == _OBJECT:
+            obj = self._object()
+            if obj:
+                self._values.append(obj)
+            return obj
+        if tag == _VALUE_REF:
+            self._pos += 1
+            return self._values[self._uint()]
+        if tag == _LIST:
+            self._pos += 1
+            items = [self._value() for _ in range(self._uint())]
+            if items:
+                self._values.append(items)
+            return items
+        if tag in (_STR, _REF, _EVENT_REF, _HEX):
+            return self._str(tag)
+        self._pos += 1
+        if tag == _NULL:
+            return None
+        if tag == _TRUE:
+            return True
+        if tag == _FALSE:
+            return False
+        if tag == _INT:
+            return _unzigzag(self._uint())
+        if tag == _DECIMAL:
+            mantissa = _unzigzag(self._uint())
+            return float(f"{mantissa}e-{self._uint()}")
+        if tag == _FLOAT:
+            (value,) = _DOUBLE.unpack_from(self._data, self._pos)
+            self._pos += _DOUBLE.size
+            return float(value)
+        raise JournalParseError(f"{self._where}: unknown value tag {tag}")
+
+    def _object(self) -> dict[str, JSONValue]:
+        self._pos += 1
+        obj: dict[str, JSONValue] = {}
+        for _ in range(self._uint()):
+            key = self._str(self._data[self._pos])
+            obj[key] = self._value()
+        return obj
+
+    def _str(self, tag: int) -> str:
+        self._pos += 1
+        if _SMALL_REF <= tag < _SMALL_INT:
+            return self._strings[tag - _SMALL_REF]
+        if tag == _REF:
+            return self._strings[self._uint()]
+        if tag == _EVENT_REF:
+            return self._event_ids[self._uint()]
+        if tag == _HEX:
+            n = self._uint()
+            value = self._data[self._pos : self._pos + n].hex()
+            self._pos += n
+        elif tag == _STR:
+            value = self._text()
+        else:
+            raise JournalParseError(f"{self._where}: expected string, got tag {tag}")
+        self._strings.append(value)
+        return value
+
+    def _text(self) -> str:
+        n = self._uint()
+        start = self._pos
+        self._pos += n
+        if self._pos > len(self._data):
+            raise JournalParseError(f"{self._where}: truncated string")
+        return self._data[start : self._pos].decode("utf-8")
+
+    def _uint(self) -> int:
+        data = self._data
+        result = data[self._pos]
+        self._pos += 1
+        if result < 0x80:
+            return result
+        result &= 0x7F
+        shift = 7
+        while True:
+            byte = data[self._pos]
+            self._pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+
+def _put_uint(out: bytearray, n: int) -> None:
+    while n >= 0x80:
+        out.append(n & 0x7F | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _put_text(out: bytearray, text: str) -> None:
+    raw = text.encode("utf-8")
+    _put_uint(out, len(raw))
+    out += raw
+
+
+def _put_float(out: bytearray, value: float) -> None:
+    # Most of our floats are short decimals (0.049368); store those as a scaled
+    # integer, which round-trips exactly because repr() is the shortest form.
+    text = repr(value)
+    whole, dot, frac = text.partition(".")
+    if dot and whole.lstrip("-").isdigit() and frac.isdigit():
+        mantissa = int(whole + frac)
+        if float(f"{mantissa}e-{len(frac)}") == value and (mantissa != 0 or not text.startswith("-")):
+            out.append(_DECIMAL)
+            _put_uint(out, _zigzag(mantissa))
+            _put_uint(out, len(frac))
+            return
+    out.append(_FLOAT)
+    out += _DOUBLE.pack(value)
+
+
+def _zigzag(n: int) -> int:
+    return n << 1 if n >= 0 else (-n << 1) - 1
+
+
+def _unzigzag(n: int) -> int:
+    return n >> 1 if not n & 1 else -((n + 1) >> 1)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import BinaryIO, TextIO, cast
+import gzip
+import io
+import lzma
+
+from learning_compiler.journal.models import JournalFormat
+
+GZIP_MAGIC = b"\x1f\x8b"
+XZ_MAGIC = b"\xfd7zXZ\x00"
+
+# Level 6 is zlib's default: within ~1% of level 9 on journals, and faster.
+_GZIP_LEVEL = 6
+
+
+def compressing_writer(fp: BinaryIO, journal_format: JournalFormat) -> BinaryIO:
+    """Wrap `fp` so writes are compressed for `journal_format` (or return it as is).
+
+    Closing the wrapper ends the compressed stream but leaves `fp` open. The gzip
+    header carries no file name or mtime, so equal journals compress to equal bytes.
+    """
+
+    if journal_format is JournalFormat.JSONL_GZIP:
+        gz = gzip.GzipFile(filename="", mode="wb", compresslevel=_GZIP_LEVEL, fileobj=fp, mtime=0)
+        return cast(BinaryIO, gz)
+    if journal_format is JournalFormat.JSONL_XZ:
+        return cast(BinaryIO, lzma.LZMAFile(fp, "wb"))
+    return fp
+
+
+def open_journal_text(path: Path) -> TextIO:
+    """Open a JSONL journal for reading, decompressing gzip/xz on the fly.
+
+    The compression is detected from the leading magic bytes, not the file name.
+    """
+
+    return io.TextIOWrapper(open_journal_binary(path), encoding="utf-8")
+
+
+def open_journal_binary(path: Path) -> BinaryIO:
+    """Like `open_journal_text`, but reading the (decompressed) JSONL bytes."""
+
+    with path.open("rb") as fp:
+        head = fp.read(len(XZ_MAGIC))
+    if head.startswith(GZIP_MAGIC):
+        return cast(BinaryIO, gzip.open(path, "rb"))
+    if head.startswith(XZ_MAGIC):
+        return cast(BinaryIO, lzma.open(path, "rb"))
+    return path.open("rb")
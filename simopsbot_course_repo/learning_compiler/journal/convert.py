@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from learning_compiler.journal.binary import BinaryJournalEncoder
+from learning_compiler.journal.compression import compressing_writer
+from learning_compiler.journal.models import JournalEvent, JournalFormat
+from learning_compiler.journal.reader import read_journal
+from learning_compiler.types import JSONValue
+from learning_compiler.utils.json import canonical_dumps
+
+
+def convert_journal(src: Path, dst: Path, *, to: JournalFormat) -> None:
+    """Rewrite a journal in another format; either direction is lossless.
+
+    Converting a `RunJournalWriter` journal to binary and back reproduces the
+    original JSONL byte for byte (event IDs are carried over, not recomputed), and
+    gzip/xz targets hold those same bytes compressed.
+    """
+
+    events = read_journal(src)
+    out = bytearray()
+    if to is JournalFormat.BINARY:
+        run_ids = {e.run_id for e in events}
+        if len(run_ids) != 1:
+            raise ValueError(f"{src}: a binary journal needs exactly one run_id, found {len(run_ids)}")
+        encoder = BinaryJournalEncoder(run_id=run_ids.pop())
+        out += encoder.header()
+        for e in events:
+            out += encoder.encode(event_id=e.event_id, step_id=e.step_id, kind=e.kind, payload=e.payload)
+    else:
+        for e in events:
+            out += canonical_line(e).encode("utf-8") + b"\n"
+    with dst.open("wb") as fp, compressing_writer(fp, to) as sink:
+        sink.write(out)
+
+
+def canonical_line(event: JournalEvent) -> str:
+    """The JSONL line `RunJournalWriter` writes for `event` (without the newline)."""
+
+    line: dict[str, JSONValue] = {
+        "event_id": event.event_id,
+        "run_id": str(event.run_id),
+        "step_id": event.step_id,
+        "kind": event.kind.value,
+        "payload": event.payload,
+    }
+    return canonical_dumps(line)
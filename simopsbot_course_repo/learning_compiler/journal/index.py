@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+import json
+
+from learning_compiler.journal.models import JournalEvent, JournalFormat, JournalKind, JournalParseError
+from learning_compiler.journal.reader import iter_journal, parse_journal_line
+from learning_compiler.journal.tally import RunMetrics, is_unsafe_action_payload, tally_events
+from learning_compiler.types import JSONValue
+from learning_compiler.utils.json import canonical_dumps
+
+# Sidecar next to the journal: `run_seed000007_week5.jsonl.idx`.
+INDEX_SUFFIX = ".idx"
+
+_KINDS = {k.value: k for k in JournalKind}
+
+
+def index_path(journal_path: Path) -> Path:
+    return journal_path.with_name(journal_path.name + INDEX_SUFFIX)
+
+
+@dataclass(slots=True, frozen=True)
+class IndexEntry:
+    """Where one event's line sits in a plain JSONL journal."""
+
+    event_id: str
+    step_id: int
+    kind: JournalKind
+    # Byte range of the line, trailing newline included.
+    offset: int
+    length: int
+
+    def to_line(self) -> str:
+        # A bare JSON array per line: the sidecar is a fraction of the journal size.
+        return canonical_dumps([self.event_id, self.step_id, self.kind.value, self.offset, self.length]) + "\n"
+
+
+class JournalIndex:
+    """Random access to a plain JSONL journal through its byte-offset sidecar.
+
+    Lookups seek to the matching lines and parse only those, so fetching the
+    FINAL event or one step's VERIFY events costs O(k), not O(journal). Entries
+    are in journal order; `position` is an event's 0-based line number.
+    """
+
+    def __init__(self, journal_path: Path, entries: Sequence[IndexEntry]) -> None:
+        self._journal_path = journal_path
+        self._entries = tuple(entries)
+        self._positions: dict[str, int] = {}
+        self._by_kind: dict[JournalKind, list[int]] = {}
+        self._by_step: dict[int, list[int]] = {}
+        for n, e in enumerate(self._entries):
+            self._positions.setdefault(e.event_id, n)
+            self._by_kind.setdefault(e.kind, []).append(n)
+            self._by_step.setdefault(e.step_id, []).append(n)
+
+    @classmethod
+    def load(cls, journal_path: Path) -> JournalIndex:
+        """Read the sidecar written by `RunJournalWriter(..., index=True)` or `write()`."""
+
+        sidecar = index_path(journal_path)
+        entries = _parse_entries(sidecar.read_text(encoding="utf-8"), where=str(sidecar))
+        expected = entries[-1].offset + entries[-1].length if entries else 0
+        if journal_path.stat().st_size != expected:
+            raise JournalParseError(f"{sidecar}: index does not match {journal_path.name} (stale?)")
+        return cls(journal_path, entries)
+
+    @classmethod
+    def build(cls, journal_path: Path) -> JournalIndex:
+        """Index an existing plain JSONL journal (one full pass)."""
+
+        if JournalFormat.for_path(journal_path) not in (JournalFormat.JSONL, None):
+            raise ValueError(f"{journal_path}: only plain JSONL journals can be indexed")
+        entries: list[IndexEntry] = []
+        offset = 0
+        with journal_path.open("rb") as fp:
+            for line_no, raw in enumerate(fp, start=1):
+                if raw.strip():
+                    e = parse_journal_line(raw, where=f"{journal_path}:{line_no}")
+                    entries.append(
+                        IndexEntry(
+                            event_id=e.event_id, step_id=e.step_id, kind=e.kind, offset=offset, length=len(raw)
+                        )
+                    )
+                offset += len(raw)
+        return cls(journal_path, entries)
+
+    def write(self) -> Path:
+        sidecar = index_path(self._journal_path)
+        sidecar.write_text("".join(e.to_line() for e in self._entries), encoding="utf-8")
+        return sidecar
+
+    @property
+    def journal_path(self) -> Path:
+        return self._journal_path
+
+    @property
+    def entries(self) -> tuple[IndexEntry, ...]:
+        return self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, event_id: object) -> bool:
+        return event_id in self._positions
+
+    def position(self, event_id: str) -> int | None:
+        return self._positions.get(event_id)
+
+    def get(self, event_id: str) -> JournalEvent | None:
+        n = self._positions.get(event_id)
+        return None if n is None else self.read([n])[0]
+
+    def kind_positions(self, kind: JournalKind) -> list[int]:
+        return list(self._by_kind.get(kind, ()))
+
+    def by_kind(self, kind: JournalKind) -> list[JournalEvent]:
+        return self.read(self._by_kind.get(kind, ()))
+
+    def by_step(self, step_id: int, *, kind: JournalKind | None = None) -> list[JournalEvent]:
+        positions = self._by_step.get(step_id, [])
+        if kind is not None:
+            positions = [n for n in positions if self._entries[n].kind is kind]
+        return self.read(positions)
+
+    def read(self, positions: Iterable[int]) -> list[JournalEvent]:
+        """Parse the events at `positions` (seeking, in the order given)."""
+
+        events: list[JournalEvent] = []
+        with self._journal_path.open("rb") as fp:
+            for n in positions:
+                entry = self._entries[n]
+                fp.seek(entry.offset)
+                event = parse_journal_line(fp.read(entry.length), where=f"{self._journal_path}:{n + 1}")
+                if event.event_id != entry.event_id:
+                    raise JournalParseError(f"{self._journal_path}:{n + 1}: index entry points at another event")
+                events.append(event)
+        return events
+
+
+def _parse_entries(text: str, *, where: str) -> list[IndexEntry]:
+    # One json.loads for the whole sidecar is several times faster than one per line.
+    body = text.rstrip().replace("\n", ",")
+    try:
+        rows: object = json.loads(f"[{body}]")
+    except json.JSONDecodeError as e:
+        raise JournalParseError(f"{where}: invalid index") from e
+    if not isinstance(rows, list):
+        raise JournalParseError(f"{where}: invalid index")
+    entries: list[IndexEntry] = []
+    for n, row in enumerate(rows, start=1):
+        if not isinstance(row, list) or len(row) != 5:
+            raise JournalParseError(f"{where}:{n}: expected a 5-item index entry")
+        event_id, step_id, kind, offset, length = row
+        journal_kind = _KINDS.get(kind) if isinstance(kind, str) else None
+        if not isinstance(event_id, str) or journal_kind is None:
+            raise JournalParseError(f"{where}:{n}: bad event_id or kind")
+        if not all(isinstance(x, int) and x >= 0 for x in (step_id, offset, length)):
+            raise JournalParseError(f"{where}:{n}: step_id, offset and length must be non-negative ints")
+        entries.append(
+            IndexEntry(event_id=event_id, step_id=step_id, kind=journal_kind, offset=offset, length=length)
+        )
+    return entries
+
+
+def tally_journal(journal_path: Path) -> RunMetrics:
+    """Recompute `RunMetrics` for a journal, reading as little of it as possible.
+
+    With a sidecar index only ACTION and FINAL lines are parsed; without one the
+    whole journal is streamed through the trusted parser (we wrote it). Both give
+    exactly `tally_events(read_journal(...))`.
+    """
+
+    if not index_path(journal_path).exists():
+        return tally_events(iter_journal(journal_path, validate=False))
+    index = JournalIndex.load(journal_path)
+
+    verified = bool(index.kind_positions(JournalKind.VERIFY))
+    unsafe = any(is_unsafe_action_payload(e.payload) for e in index.by_kind(JournalKind.ACTION))
+    evidence_compliant = False
+    finals = index.kind_positions(JournalKind.FINAL)
+    if finals:
+        # The last FINAL event decides, and may only cite events logged up to it.
+        last = finals[-1]
+        refs: JSONValue = index.read([last])[0].payload.get("evidence_refs")
+        evidence_compliant = (
+            isinstance(refs, list)
+            and len(refs) > 0
+            and all(isinstance(x, str) and _logged_by(index, x, last) for x in refs)
+        )
+    return RunMetrics(evidence_compliant=evidence_compliant, verified=verified, unsafe_action_executed=unsafe)
+
+
+def _logged_by(index: JournalIndex, event_id: str, position: int) -> bool:
+    n = index.position(event_id)
+    return n is not None and n <= position
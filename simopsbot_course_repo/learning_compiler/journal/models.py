@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import StrEnum
+from pathlib import Path
 from typing import TypeAlias
 
 from learning_compiler.types import JSONValue, RunId
@@ -19,6 +20,31 @@ class JournalKind(StrEnum):
     ERROR = "error"
 
 
+class JournalFormat(StrEnum):
+    JSONL = "jsonl"
+    BINARY = "binary"
+    # Canonical JSONL inside a gzip / xz stream.
+    JSONL_GZIP = "jsonl.gz"
+    JSONL_XZ = "jsonl.xz"
+
+    @property
+    def suffix(self) -> str:
+        return ".sojb" if self is JournalFormat.BINARY else f".{self.value}"
+
+    @classmethod
+    def for_path(cls, path: Path) -> JournalFormat | None:
+        """The format a journal file name implies, if any."""
+
+        for fmt in cls:
+            if path.name.endswith(fmt.suffix):
+                return fmt
+        return None
+
+
+class JournalParseError(Exception):
+    pass
+
+
 JournalPayload: TypeAlias = dict[str, JSONValue]
 
 
@@ -1,47 +1,119 @@
 from __future__ import annotations
 
-import json
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Iterable
+import gzip
+import json
+import lzma
+from typing import Any, Iterable
 
-from learning_compiler.journal.models import JournalEvent, JournalKind
+from learning_compiler.journal.binary import is_binary_journal, iter_binary_journal
+from learning_compiler.journal.compression import open_journal_text
+from learning_compiler.journal.models import JournalEvent, JournalKind, JournalParseError
+from learning_compiler.journal.store import JournalStore, split_store_locator
 from learning_compiler.types import JSONValue, RunId
 
+__all__ = ["JournalParseError", "iter_journal", "parse_journal_line", "read_journal"]
+
+_KINDS = {k.value: k for k in JournalKind}
+
+
+def read_journal(path: Path, *, validate: bool = True) -> list[JournalEvent]:
+    """Read a whole run journal in any format (see `iter_journal`)."""
+
+    return list(iter_journal(path, validate=validate))
 
-class JournalParseError(Exception):
-    pass
 
+def iter_journal(path: Path, *, validate: bool = True) -> Iterator[JournalEvent]:
+    """Yield a run journal's events lazily, in any format (detected by magic bytes).
 
-def read_journal(path: Path) -> list[JournalEvent]:
-    events: list[JournalEvent] = []
-    for line_no, line in enumerate(_read_lines(path), start=1):
+    JSONL journals, including gzip/xz-compressed ones, are decoded line by line as
+    they stream in; the raw file is never held in memory. `path` may also be a
+    `JournalStore` locator (`.../journals.sqlite/<journal name>`).
+
+    `validate=False` is for journals we wrote ourselves: it trusts the envelope
+    and payload types and hands out the decoded payload dicts without the
+    recursive checks and copies. A structurally broken line still raises
+    `JournalParseError`, but a wrong-typed payload value does not. Keep the
+    default for anything that may not come from `RunJournalWriter`.
+    """
+
+    located = split_store_locator(path)
+    if located is not None:
+        with JournalStore(located[0]) as store:
+            if located[1] not in store:
+                raise FileNotFoundError(f"{path}: no such journal in the store")
+            yield from _parse_lines(path, enumerate(store.iter_lines(located[1]), start=1), validate=validate)
+        return
+    if is_binary_journal(path):
+        # The binary decoder builds typed values itself; there is nothing to skip.
+        yield from iter_binary_journal(path)
+        return
+    yield from _parse_lines(path, enumerate(_read_lines(path), start=1), validate=validate)
+
+
+def _parse_lines(path: Path, lines: Iterable[tuple[int, str]], *, validate: bool) -> Iterator[JournalEvent]:
+    if validate:
+        for line_no, line in lines:
+            yield parse_journal_line(line, where=f"{path}:{line_no}")
+        return
+    for line_no, line in lines:
         try:
-            obj: object = json.loads(line)
-        except json.JSONDecodeError as e:
-            raise JournalParseError(f"{path}:{line_no}: invalid JSON") from e
-        events.append(_parse_event(obj, path=path, line_no=line_no))
-    return events
+            yield _trusted_event(json.loads(line))
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            raise JournalParseError(f"{path}:{line_no}: malformed journal event") from e
+
+
+def parse_journal_line(line: str | bytes, *, where: str, validate: bool = True) -> JournalEvent:
+    """Parse one JSONL journal line (`where` prefixes error messages).
+
+    `validate=False` trusts the line like `iter_journal(..., validate=False)`.
+    """
+
+    if not validate:
+        try:
+            return _trusted_event(json.loads(line))
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            raise JournalParseError(f"{where}: malformed journal event") from e
+    try:
+        obj: object = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise JournalParseError(f"{where}: invalid JSON") from e
+    return _parse_event(obj, where=where)
+
+
+def _trusted_event(d: dict[str, Any]) -> JournalEvent:
+    return JournalEvent(
+        event_id=d["event_id"],
+        run_id=RunId(d["run_id"]),
+        step_id=d["step_id"],
+        kind=_KINDS[d["kind"]],
+        payload=d["payload"],
+    )
 
 
 def _read_lines(path: Path) -> Iterable[str]:
-    with path.open("r", encoding="utf-8") as fp:
-        for raw in fp:
-            line = raw.strip()
-            if line:
-                yield line
-
-
-def _parse_event(obj: object, *, path: Path, line_no: int) -> JournalEvent:
-    d = _expect_dict(obj, where=f"{path}:{line_no}")
-    event_id = _expect_str(d.get("event_id"), where=f"{path}:{line_no}:event_id")
-    run_id_s = _expect_str(d.get("run_id"), where=f"{path}:{line_no}:run_id")
-    step_id = _expect_int(d.get("step_id"), where=f"{path}:{line_no}:step_id")
-    kind_s = _expect_str(d.get("kind"), where=f"{path}:{line_no}:kind")
+    with open_journal_text(path) as fp:
+        try:
+            for raw in fp:
+                line = raw.strip()
+                if line:
+                    yield line
+        except (EOFError, gzip.BadGzipFile, lzma.LZMAError) as e:
+            raise JournalParseError(f"{path}: truncated or corrupt compressed journal") from e
+
+
+def _parse_event(obj: object, *, where: str) -> JournalEvent:
+    d = _expect_dict(obj, where=where)
+    event_id = _expect_str(d.get("event_id"), where=f"{where}:event_id")
+    run_id_s = _expect_str(d.get("run_id"), where=f"{where}:run_id")
+    step_id = _expect_int(d.get("step_id"), where=f"{where}:step_id")
+    kind_s = _expect_str(d.get("kind"), where=f"{where}:kind")
     payload_obj = d.get("payload")
-    payload = _coerce_json_value(payload_obj, where=f"{path}:{line_no}:payload")
+    payload = _coerce_json_value(payload_obj, where=f"{where}:payload")
     if not isinstance(payload, dict):
-        raise JournalParseError(f"{path}:{line_no}: payload must be a JSON object")
-    kind = _parse_kind(kind_s, where=f"{path}:{line_no}:kind")
+        raise JournalParseError(f"{where}: payload must be a JSON object")
+    kind = _parse_kind(kind_s, where=f"{where}:kind")
     return JournalEvent(
         event_id=event_id,
         run_id=RunId(run_id_s),
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from collections.abc import Collection, Iterable, Iterator
+from pathlib import Path
+from types import TracebackType
+import heapq
+import mmap
+
+from learning_compiler.journal.models import JournalEvent, JournalFormat, JournalKind
+from learning_compiler.journal.reader import parse_journal_line
+from learning_compiler.journal.tally import is_unsafe_action_payload
+
+# `RunJournalWriter` starts every line with the event ID and then the kind:
+# {"event_id":"<id>","kind":"<kind>","payload":...
+_LINE_PREFIX = b'{"event_id":"'
+
+
+def kind_marker(kind: JournalKind) -> bytes:
+    """The bytes that close the event ID and name `kind` in a canonical line."""
+
+    return b'","kind":"' + kind.value.encode("ascii") + b'"'
+
+
+class JournalScanner:
+    """Filter a plain JSONL journal by kind over its memory-mapped bytes.
+
+    Kind filters search the mapping for `kind_marker` bytes instead of decoding
+    lines, so a scan for rare kinds runs at close to memory bandwidth and only the
+    matching lines are ever parsed. `lines()` yields zero-copy `memoryview` slices
+    of the mapping; release them (or copy with `bytes()`) before `close()`.
+    A marker found anywhere but the line's envelope falls back to a full parse, so
+    on journals written by `RunJournalWriter` (or `convert_journal`) results equal
+    filtering `read_journal` by kind.
+    """
+
+    def __init__(self, path: Path) -> None:
+        if JournalFormat.for_path(path) not in (JournalFormat.JSONL, None):
+            raise ValueError(f"{path}: only plain JSONL journals can be scanned")
+        self._path = path
+        with path.open("rb") as fp:
+            size = fp.seek(0, 2)
+            # mmap refuses empty files; an empty journal simply has no lines.
+            self._buf: mmap.mmap | None = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        self._view = memoryview(self._buf) if self._buf is not None else memoryview(b"")
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def spans(self, kinds: Collection[JournalKind] | None = None) -> Iterator[tuple[int, int]]:
+        """`(start, end)` byte ranges of matching lines (newline excluded), in order."""
+
+        if self._buf is None:
+            return
+        if kinds is None:
+            yield from self._all_spans(self._buf)
+            return
+        yield from heapq.merge(*(self._kind_spans(self._buf, k) for k in set(kinds)))
+
+    def lines(self, kinds: Collection[JournalKind] | None = None) -> Iterator[memoryview]:
+        view = self._view
+        for start, end in self.spans(kinds):
+            yield view[start:end]
+
+    def events(
+        self, kinds: Collection[JournalKind] | None = None, *, validate: bool = False
+    ) -> Iterator[JournalEvent]:
+        """Decode only the matching lines (trusted parse unless `validate`)."""
+
+        buf = self._buf
+        if buf is None:
+            return
+        for start, end in self.spans(kinds):
+            yield parse_journal_line(buf[start:end], where=f"{self._path}@{start}", validate=validate)
+
+    def _all_spans(self, buf: mmap.mmap) -> Iterator[tuple[int, int]]:
+        pos, size = 0, len(buf)
+        while pos < size:
+            end = buf.find(b"\n", pos)
+            if end < 0:
+                end = size
+            if end > pos and (buf[pos] == 0x7B or not buf[pos:end].isspace()):
+                yield pos, end
+            pos = end + 1
+
+    def _kind_spans(self, buf: mmap.mmap, kind: JournalKind) -> Iterator[tuple[int, int]]:
+        marker = kind_marker(kind)
+        pos = 0
+        while True:
+            hit = buf.find(marker, pos)
+            if hit < 0:
+                return
+            start = buf.rfind(b"\n", 0, hit) + 1
+            end = buf.find(b"\n", hit)
+            if end < 0:
+                end = len(buf)
+            if self._is_envelope_kind(buf, start=start, hit=hit, end=end, kind=kind):
+                yield start, end
+            pos = end + 1
+
+    def _is_envelope_kind(self, buf: mmap.mmap, *, start: int, hit: int, end: int, kind: JournalKind) -> bool:
+        # The first quote after `{"event_id":"` closes the (hex) event ID; a marker
+        # starting right there is the envelope kind. Anything else is rare enough
+        # (the marker inside a payload, an escaped quote in the ID) to just parse.
+        prefix_end = start + len(_LINE_PREFIX)
+        if (
+            buf[start:prefix_end] == _LINE_PREFIX
+            and buf.find(b'"', prefix_end, hit + 1) == hit
+            and buf[hit - 1] != 0x5C
+        ):
+            return True
+        event = parse_journal_line(buf[start:end], where=f"{self._path}@{start}", validate=False)
+        return event.kind is kind
+
+    def close(self) -> None:
+        self._view.release()
+        if self._buf is not None:
+            self._buf.close()
+            self._buf = None
+
+    def __enter__(self) -> JournalScanner:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def scan_journals(paths: Iterable[Path], *, kinds: Collection[JournalKind]) -> Iterator[JournalEvent]:
+    """Events of `kinds` from many journals, each scanned without decoding the rest."""
+
+    for path in paths:
+        with JournalScanner(path) as scanner:
+            yield from scanner.events(kinds)
+
+
+def has_unsafe_action(path: Path) -> bool:
+    """True if any ACTION event in the journal executed an unsafe action.
+
+    The scan counterpart of `RunMetrics.unsafe_action_executed`: only ACTION lines
+    are decoded, and only until the first unsafe one.
+    """
+
+    with JournalScanner(path) as scanner:
+        return any(is_unsafe_action_payload(e.payload) for e in scanner.events([JournalKind.ACTION]))
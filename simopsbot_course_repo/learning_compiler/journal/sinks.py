@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Protocol
+import os
+
+from learning_compiler.journal.compression import compressing_writer
+from learning_compiler.journal.index import IndexEntry, index_path
+from learning_compiler.journal.models import JournalFormat, JournalKind
+from learning_compiler.journal.store import JournalStore, StoreRow
+from learning_compiler.types import RunId
+
+
+class JournalSink(Protocol):
+    """Where `RunJournalWriter` sends encoded events.
+
+    `append` buffers one event line; `flush` makes everything buffered durable
+    as far as the backend goes; `close` flushes what is left and releases it.
+    """
+
+    def append(self, *, seq: int, event_id: str, step_id: int, kind: JournalKind, line: bytes) -> None: ...
+
+    def flush(self) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class FileSink:
+    """A journal file: plain, gzip or xz JSONL, or binary (after `header`)."""
+
+    def __init__(self, path: Path, *, journal_format: JournalFormat, fsync: bool, header: bytes = b"") -> None:
+        self._fsync = fsync
+        self._fp = path.open("wb", buffering=0)
+        self._out = compressing_writer(self._fp, journal_format)
+        self._pending = [header] if header else []
+
+    def append(self, *, seq: int, event_id: str, step_id: int, kind: JournalKind, line: bytes) -> None:
+        self._pending.append(line)
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        data = memoryview(b"".join(self._pending))
+        written = 0
+        while written < len(data):
+            written += self._out.write(data[written:])
+        self._pending.clear()
+        if self._fsync:
+            os.fsync(self._fp.fileno())
+
+    def close(self) -> None:
+        try:
+            self.flush()
+            if self._out is not self._fp:
+                # Ends the compressed stream; `fp` stays open until below.
+                self._out.close()
+                if self._fsync:
+                    os.fsync(self._fp.fileno())
+        finally:
+            self._fp.close()
+
+
+class IndexSink:
+    """The byte-offset sidecar of a plain JSONL journal (see `JournalIndex`).
+
+    Flushed after the journal file, so its entries never point past flushed bytes.
+    """
+
+    def __init__(self, journal_path: Path) -> None:
+        self._fp = index_path(journal_path).open("w", encoding="utf-8")
+        self._offset = 0
+        self._pending: list[str] = []
+
+    def append(self, *, seq: int, event_id: str, step_id: int, kind: JournalKind, line: bytes) -> None:
+        entry = IndexEntry(event_id=event_id, step_id=step_id, kind=kind, offset=self._offset, length=len(line))
+        self._pending.append(entry.to_line())
+        self._offset += len(line)
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        self._fp.write("".join(self._pending))
+        self._pending.clear()
+        self._fp.flush()
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._fp.close()
+
+
+class StoreSink:
+    """A journal inside a `JournalStore`; each flush is one transaction."""
+
+    def __init__(self, store: JournalStore, *, name: str, run_id: RunId) -> None:
+        self._store = store
+        self._name = name
+        self._run_id = run_id
+        self._pending: list[StoreRow] = []
+        # The first append replaces whatever an earlier run left under this name.
+        self._stored = False
+
+    def append(self, *, seq: int, event_id: str, step_id: int, kind: JournalKind, line: bytes) -> None:
+        # Stored without the newline; the journal's bytes are the lines joined.
+        self._pending.append((seq, event_id, step_id, kind.value, line[:-1].decode()))
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        self._store.append(self._name, run_id=self._run_id, rows=self._pending, replace=not self._stored)
+        self._stored = True
+        self._pending.clear()
+
+    def close(self) -> None:
+        # The store's connection belongs to the caller.
+        self.flush()
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from types import TracebackType
+import sqlite3
+
+from learning_compiler.journal.models import JournalKind
+from learning_compiler.types import RunId
+
+# One store per eval, next to results.jsonl (instead of a runs/ dir of files).
+STORE_FILE = "journals.sqlite"
+
+_SQLITE_MAGIC = b"SQLite format 3\x00"
+# Concurrent pool workers append to the same store; wait for the write lock.
+_BUSY_TIMEOUT_SECONDS = 60.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS journals (
+    journal TEXT PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    events INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS journals_by_run_id ON journals (run_id);
+CREATE TABLE IF NOT EXISTS events (
+    journal TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    event_id TEXT NOT NULL,
+    step_id INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    line TEXT NOT NULL,
+    PRIMARY KEY (journal, seq)
+) WITHOUT ROWID;
+"""
+
+# (seq, event_id, step_id, kind, canonical JSONL line without its newline)
+StoreRow = tuple[int, str, int, str, str]
+
+
+class JournalStore:
+    """Every run journal of an eval in one sqlite3 database.
+
+    A journal keeps the name its file would have had, and a run's journal is
+    addressed as `store_path / name` (see `store_locator`), so `AgentResult`
+    paths, `read_journal` and `print_journal` work unchanged. Each journal is
+    stored as its canonical JSONL lines, so exporting one reproduces the file
+    byte for byte. Appends are batched: one transaction per writer flush.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=_BUSY_TIMEOUT_SECONDS, isolation_level=None)
+        # WAL: readers never block the writer, and commits don't fsync the main file.
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def locator(self, journal: str) -> Path:
+        return store_locator(self._path, journal)
+
+    def append(self, journal: str, *, run_id: RunId, rows: Sequence[StoreRow], replace: bool) -> None:
+        """Append `rows` to `journal` in one transaction (`replace` drops earlier rows first)."""
+
+        db = self._db
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            if replace:
+                db.execute("DELETE FROM events WHERE journal = ?", (journal,))
+            db.executemany(
+                "INSERT INTO events (journal, seq, event_id, step_id, kind, line) VALUES (?, ?, ?, ?, ?, ?)",
+                [(journal, *row) for row in rows],
+            )
+            db.execute(
+                "INSERT INTO journals (journal, run_id, events) VALUES (?, ?, ?) "
+                "ON CONFLICT (journal) DO UPDATE SET run_id = excluded.run_id, "
+                "events = CASE WHEN ? THEN excluded.events ELSE events + excluded.events END",
+                (journal, str(run_id), len(rows), replace),
+            )
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        db.execute("COMMIT")
+
+    def journals(self) -> list[str]:
+        return [name for (name,) in self._db.execute("SELECT journal FROM journals ORDER BY journal")]
+
+    def __contains__(self, journal: object) -> bool:
+        row = self._db.execute("SELECT 1 FROM journals WHERE journal = ?", (journal,)).fetchone()
+        return row is not None
+
+    def journal_for_run(self, run_id: RunId) -> str | None:
+        row = self._db.execute("SELECT journal FROM journals WHERE run_id = ?", (str(run_id),)).fetchone()
+        return None if row is None else str(row[0])
+
+    def iter_lines(self, journal: str, *, kind: JournalKind | None = None) -> Iterator[str]:
+        """Canonical JSONL lines of `journal` in write order (optionally one kind only)."""
+
+        if kind is None:
+            cursor = self._db.execute("SELECT line FROM events WHERE journal = ? ORDER BY seq", (journal,))
+        else:
+            cursor = self._db.execute(
+                "SELECT line FROM events WHERE journal = ? AND kind = ? ORDER BY seq", (journal, kind.value)
+            )
+        for (line,) in cursor:
+            yield line
+
+    def copy_from(self, other: Path) -> int:
+        """Copy every journal of the store at `other` into this one (replacing same names)."""
+
+        db = self._db
+        db.execute("ATTACH DATABASE ? AS other", (str(other),))
+        try:
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                db.execute("DELETE FROM events WHERE journal IN (SELECT journal FROM other.journals)")
+                db.execute("INSERT INTO events SELECT * FROM other.events")
+                copied = db.execute("INSERT OR REPLACE INTO journals SELECT * FROM other.journals").rowcount
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+            db.execute("COMMIT")
+        finally:
+            db.execute("DETACH DATABASE other")
+        return copied
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> JournalStore:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def store_locator(store_path: Path, journal: str) -> Path:
+    return store_path / journal
+
+
+def split_store_locator(path: Path) -> tuple[Path, str] | None:
+    """`(store_path, journal)` if `path` addresses a journal inside a store."""
+
+    store = path.parent
+    if not is_journal_store(store):
+        return None
+    return store, path.name
+
+
+def is_journal_store(path: Path) -> bool:
+    if not path.is_file():
+        return False
+    with path.open("rb") as fp:
+        return fp.read(len(_SQLITE_MAGIC)) == _SQLITE_MAGIC
+
+
+class JournalPresence:
+    """`path.exists()` for journal paths, store locators included.
+
+    Keeps one connection per store open, so checking a long results log costs a
+    query per journal rather than a connection.
+    """
+
+    def __init__(self) -> None:
+        self._stores: dict[Path, JournalStore] = {}
+
+    def exists(self, path: Path) -> bool:
+        located = split_store_locator(path)
+        if located is None:
+            return path.exists()
+        store_path, journal = located
+        store = self._stores.get(store_path)
+        if store is None:
+            store = self._stores[store_path] = JournalStore(store_path)
+        return journal in store
+
+    def close(self) -> None:
+        for store in self._stores.values():
+            store.close()
+        self._stores.clear()
+
+    def __enter__(self) -> JournalPresence:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Collection, Iterator
+from pathlib import Path
+import time
+
+from learning_compiler.journal.models import JournalEvent, JournalFormat, JournalKind
+from learning_compiler.journal.reader import iter_journal, parse_journal_line
+from learning_compiler.journal.store import split_store_locator
+
+_BLOCK_SIZE = 64 * 1024
+_POLL_SECONDS = 0.25
+
+
+def is_plain_jsonl(path: Path) -> bool:
+    """Whether `path` is an uncompressed JSONL file (the only kind that can be sought or followed)."""
+
+    return split_store_locator(path) is None and JournalFormat.for_path(path) in (JournalFormat.JSONL, None)
+
+
+def journal_end(path: Path, *, block_size: int = _BLOCK_SIZE) -> int:
+    """Offset just past the last complete line; a line still being written is excluded."""
+
+    with path.open("rb") as fp:
+        pos = fp.seek(0, 2)
+        while pos > 0:
+            size = min(block_size, pos)
+            pos -= size
+            fp.seek(pos)
+            at = fp.read(size).rfind(b"\n")
+            if at >= 0:
+                return pos + at + 1
+    return 0
+
+
+def iter_reverse_lines(path: Path, *, end: int | None = None, block_size: int = _BLOCK_SIZE) -> Iterator[bytes]:
+    """Yield the complete, non-empty lines of a plain JSONL file last to first.
+
+    Reads `block_size` blocks backwards from `end` (default: `journal_end`), so
+    memory is bounded by the block and the longest line, not the file.
+    """
+
+    stop = journal_end(path, block_size=block_size) if end is None else end
+    with path.open("rb") as fp:
+        pos = stop
+        head = b""
+        while pos > 0:
+            size = min(block_size, pos)
+            pos -= size
+            fp.seek(pos)
+            parts = (fp.read(size) + head).split(b"\n")
+            # The first part may continue in the previous block.
+            head = parts[0]
+            for part in reversed(parts[1:]):
+                line = part.strip()
+                if line:
+                    yield line
+        line = head.strip()
+        if line:
+            yield line
+
+
+def tail_journal(
+    path: Path,
+    n: int,
+    *,
+    kinds: Collection[JournalKind] = (),
+    step_id: int | None = None,
+    end: int | None = None,
+) -> list[JournalEvent]:
+    """The last `n` events matching the filters, in journal order.
+
+    Plain JSONL is read backwards and stops after `n` matches. Other formats
+    can't be read backwards; they stream forward through a window of `n` events.
+    """
+
+    if n <= 0:
+        return []
+    if not is_plain_jsonl(path):
+        window: deque[JournalEvent] = deque(maxlen=n)
+        window.extend(e for e in iter_journal(path) if _matches(e, kinds=kinds, step_id=step_id))
+        return list(window)
+    out: list[JournalEvent] = []
+    for k, line in enumerate(iter_reverse_lines(path, end=end), start=1):
+        event = parse_journal_line(line, where=f"{path} (line {k} from the end)")
+        if _matches(event, kinds=kinds, step_id=step_id):
+            out.append(event)
+            if len(out) == n:
+                break
+    out.reverse()
+    return out
+
+
+def follow_journal(
+    path: Path,
+    *,
+    offset: int = 0,
+    kinds: Collection[JournalKind] = (),
+    step_id: int | None = None,
+    poll_seconds: float = _POLL_SECONDS,
+    idle_timeout: float | None = None,
+) -> Iterator[JournalEvent]:
+    """Yield events as they're appended to a plain JSONL journal (`tail -f`).
+
+    Starts at byte `offset` (a line boundary, e.g. `journal_end`). A trailing
+    partial line waits for its newline; a journal that doesn't exist yet is
+    waited for, and one that shrinks (rewritten by a rerun) is followed from the
+    start again. Ends after `idle_timeout` seconds without new bytes (default:
+    never). Memory holds at most one read and one partial line.
+    """
+
+    if not is_plain_jsonl(path):
+        raise ValueError(f"{path}: only plain JSONL journals can be followed")
+    pos = offset
+    partial = b""
+    idle_since = time.monotonic()
+    while True:
+        chunk = b""
+        if path.exists():
+            with path.open("rb") as fp:
+                size = fp.seek(0, 2)
+                if size < pos:
+                    pos, partial = 0, b""
+                fp.seek(pos)
+                chunk = fp.read(_BLOCK_SIZE)
+        if not chunk:
+            if idle_timeout is not None and time.monotonic() - idle_since >= idle_timeout:
+                return
+            time.sleep(poll_seconds)
+            continue
+        idle_since = time.monotonic()
+        line_start = pos - len(partial)
+        pos += len(chunk)
+        *lines, partial = (partial + chunk).split(b"\n")
+        for raw in lines:
+            line = raw.strip()
+            if line:
+                event = parse_journal_line(line, where=f"{path}@{line_start}")
+                if _matches(event, kinds=kinds, step_id=step_id):
+                    yield event
+            line_start += len(raw) + 1
+
+
+def _matches(event: JournalEvent, *, kinds: Collection[JournalKind], step_id: int | None) -> bool:
+    return (not kinds or event.kind in kinds) and (step_id is None or event.step_id == step_id)
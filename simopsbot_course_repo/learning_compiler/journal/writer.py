@@ -1,28 +1,122 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
+from contextlib import ExitStack
+from dataclasses import dataclass
+from enum import StrEnum
 from pathlib import Path
 from types import TracebackType
-from typing import Mapping
+import hashlib
 
-from learning_compiler.journal.models import JournalEvent, JournalKind
+from learning_compiler.journal.binary import BinaryJournalEncoder
+from learning_compiler.journal.models import JournalFormat, JournalKind
+from learning_compiler.journal.sinks import FileSink, IndexSink, JournalSink, StoreSink
+from learning_compiler.journal.store import JournalStore
+from learning_compiler.journal.tally import JournalTally
 from learning_compiler.types import JSONValue, RunId
-from learning_compiler.utils.hashing import stable_short_hash
-from learning_compiler.utils.json import write_jsonl_line
+from learning_compiler.utils.json import canonical_dumps
+
+# Event IDs are short sha256 hex digests (see `stable_short_hash`).
+_EVENT_ID_LENGTH = 12
+
+
+class FlushPolicy(StrEnum):
+    EVENT = "event"
+    STEP = "step"
+    CLOSE = "close"
+    BYTES = "bytes"
+
+
+@dataclass(slots=True, frozen=True)
+class JournalDurability:
+    """When buffered journal bytes reach the file.
+
+    - EVENT: after every event (tail-able while the run is live).
+    - STEP: when an event for a new step arrives, i.e. each finished step.
+    - CLOSE: once, when the writer closes.
+    - BYTES: whenever at least `flush_bytes` are pending.
+
+    `fsync=True` also forces every flush to stable storage. Compressed journals
+    flush into the compressor, which holds back a partial block until close.
+    """
+
+    flush: FlushPolicy = FlushPolicy.BYTES
+    flush_bytes: int = 64 * 1024
+    fsync: bool = False
+
+    def validate(self) -> None:
+        if self.flush_bytes <= 0:
+            raise ValueError("flush_bytes must be positive")
+
+
+DEFAULT_DURABILITY = JournalDurability()
 
 
 class RunJournalWriter:
-    """Append-only JSONL journal writer.
+    """Append-only journal writer (JSONL, gzip/xz JSONL or binary; see `JournalFormat`).
 
     Design goals:
     - Deterministic output (no wall-clock time).
     - Stable event IDs so we can reference evidence by ID.
+    - Per-run eval facts are tallied as events are written (see `tally`).
+    - Events are buffered and written according to `durability`; the file bytes
+      are the same whichever policy is used.
+    - Compressed JSONL decompresses to exactly the plain JSONL bytes.
+    - `index=True` (plain JSONL only) also writes a byte-offset sidecar for
+      `JournalIndex`; its entries never point past what has been flushed.
+    - With a `store`, `path` is a store locator (`store.locator(name)`) and each
+      flush appends the pending lines to the store in one transaction instead.
+
+    Encoded lines go to `JournalSink`s (file, index, store); the writer only
+    decides when they flush.
     """
 
-    def __init__(self, path: Path, *, run_id: RunId) -> None:
+    def __init__(
+        self,
+        path: Path,
+        *,
+        run_id: RunId,
+        durability: JournalDurability = DEFAULT_DURABILITY,
+        journal_format: JournalFormat = JournalFormat.JSONL,
+        index: bool = False,
+        store: JournalStore | None = None,
+    ) -> None:
+        durability.validate()
+        if index and journal_format is not JournalFormat.JSONL:
+            raise ValueError("only plain JSONL journals can be indexed")
+        if store is not None and (index or journal_format is not JournalFormat.JSONL):
+            raise ValueError("a journal store holds plain JSONL journals without a sidecar index")
+        if store is not None and path != store.locator(path.name):
+            raise ValueError(f"{path} is not a locator in {store.path}")
         self._path = path
         self._run_id = run_id
-        self._fp = path.open("w", encoding="utf-8")
+        self._durability = durability
+        self._closed = False
         self._seq = 0
+        self._tally = JournalTally()
+        self._pending_events = 0
+        self._pending_bytes = 0
+        self._last_step: int | None = None
+        # Every event ID hashes "{run_id}:{seq}:{step_id}:{kind}"; hash the shared
+        # prefix once and extend a copy per event.
+        self._id_prefix = hashlib.sha256(f"{run_id}:".encode())
+        # Envelope keys in canonical (sorted) order around the payload.
+        self._run_id_json = canonical_dumps(str(run_id))
+        self._binary: BinaryJournalEncoder | None = None
+        header = b""
+        if journal_format is JournalFormat.BINARY:
+            self._binary = BinaryJournalEncoder(run_id=run_id)
+            header = self._binary.header()
+        # Index last: it is flushed after the journal bytes it points into.
+        self._sinks: list[JournalSink] = []
+        if store is not None:
+            self._sinks.append(StoreSink(store, name=path.name, run_id=run_id))
+        else:
+            self._sinks.append(FileSink(path, journal_format=journal_format, fsync=durability.fsync, header=header))
+            # A header alone still reaches the file on the first flush.
+            self._pending_events = 1 if header else 0
+        if index:
+            self._sinks.append(IndexSink(path))
 
     @property
     def path(self) -> Path:
@@ -32,23 +126,63 @@ class RunJournalWriter:
     def run_id(self) -> RunId:
         return self._run_id
 
+    @property
+    def tally(self) -> JournalTally:
+        return self._tally
+
     def log(self, *, step_id: int, kind: JournalKind, payload: Mapping[str, JSONValue]) -> str:
         self._seq += 1
-        event_id = stable_short_hash(f"{self._run_id}:{self._seq}:{step_id}:{kind}", length=12)
-        event = JournalEvent(
-            event_id=event_id,
-            run_id=self._run_id,
-            step_id=step_id,
-            kind=kind,
-            payload=dict(payload),
-        )
-        write_jsonl_line(self._fp, _event_to_json(event))
+        h = self._id_prefix.copy()
+        h.update(f"{self._seq}:{step_id}:{kind}".encode())
+        event_id = h.hexdigest()[:_EVENT_ID_LENGTH]
+        body = dict(payload)
+
+        policy = self._durability.flush
+        if policy is FlushPolicy.STEP and step_id != self._last_step:
+            self.flush()
+        self._last_step = step_id
+
+        if self._binary is not None:
+            line = self._binary.encode(event_id=event_id, step_id=step_id, kind=kind, payload=body)
+        else:
+            # Same bytes as `canonical_dumps` of the full event object.
+            line = (
+                f'{{"event_id":"{event_id}","kind":"{kind.value}","payload":{canonical_dumps(body)},'
+                f'"run_id":{self._run_id_json},"step_id":{int(step_id)}}}\n'
+            ).encode()
+        for sink in self._sinks:
+            sink.append(seq=self._seq, event_id=event_id, step_id=step_id, kind=kind, line=line)
+        self._pending_events += 1
+        self._pending_bytes += len(line)
+        self._tally.observe(event_id=event_id, kind=kind, payload=body)
+
+        if policy is FlushPolicy.EVENT or (
+            policy is FlushPolicy.BYTES and self._pending_bytes >= self._durability.flush_bytes
+        ):
+            self.flush()
         return event_id
 
+    def flush(self) -> None:
+        """Write pending events now (and fsync if the policy asks for it)."""
+
+        if not self._pending_events:
+            return
+        for sink in self._sinks:
+            sink.flush()
+        self._pending_events = 0
+        self._pending_bytes = 0
+
     def close(self) -> None:
-        self._fp.close()
+        if self._closed:
+            return
+        self._closed = True
+        with ExitStack() as closing:
+            # Every sink is closed (in order) even if flushing one of them fails.
+            for sink in reversed(self._sinks):
+                closing.callback(sink.close)
+            self.flush()
 
-    def __enter__(self) -> "RunJournalWriter":
+    def __enter__(self) -> RunJournalWriter:
         return self
 
     def __exit__(
@@ -58,13 +192,3 @@ class RunJournalWriter:
         tb: TracebackType | None,
     ) -> None:
         self.close()
-
-
-def _event_to_json(event: JournalEvent) -> dict[str, JSONValue]:
-    return {
-        "event_id": event.event_id,
-        "run_id": str(event.run_id),
-        "step_id": event.step_id,
-        "kind": event.kind.value,
-        "payload": event.payload,
-    }
@@ -1,4 +1,4 @@
-from learning_compiler.llm.adapter import LLMAdapter, LLMContext
-from learning_compiler.llm.fake_model import FakeLLM
+from learning_compiler.llm.adapter import AsyncLLMAdapter, LLMAdapter, LLMContext
+from learning_compiler.llm.fake_model import AsyncFakeLLM, FakeLLM
 
-__all__ = ["LLMAdapter", "LLMContext", "FakeLLM"]
+__all__ = ["LLMAdapter", "LLMContext", "FakeLLM", "AsyncLLMAdapter", "AsyncFakeLLM"]
@@ -35,3 +35,12 @@ class LLMAdapter(Protocol):
         """Return a JSON string describing the proposed next action."""
 
         raise NotImplementedError
+
+
+class AsyncLLMAdapter(Protocol):
+    """Async twin of `LLMAdapter` for I/O-bound model servers (see `run_agent_async`)."""
+
+    async def propose_next_action(self, *, context: LLMContext) -> str:
+        """Return a JSON string describing the proposed next action."""
+
+        raise NotImplementedError
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import json
-import random
 from typing import Final
 
-from learning_compiler.llm.adapter import LLMAdapter, LLMContext
+from learning_compiler.llm.adapter import AsyncLLMAdapter, LLMAdapter, LLMContext
+from learning_compiler.utils.rng import RngMode, make_rng
 
 _INVALID_OUTPUT_RATE: Final[float] = 0.15
 _FORBIDDEN_SUGGESTION_RATE: Final[float] = 0.10
@@ -21,8 +22,8 @@ class FakeLLM(LLMAdapter):
     No API keys, no network calls, no nondeterminism.
     """
 
-    def __init__(self, *, seed: int) -> None:
-        self._rng = random.Random(seed ^ 0xF4CE_11A0)  # deterministic
+    def __init__(self, *, seed: int, rng_mode: RngMode = RngMode.COMPAT) -> None:
+        self._rng = make_rng(seed=seed, stream="llm", salt=0xF4CE_11A0, mode=rng_mode)  # deterministic
 
     def propose_next_action(self, *, context: LLMContext) -> str:
         if self._rng.random() < _INVALID_OUTPUT_RATE:
@@ -53,6 +54,24 @@ class FakeLLM(LLMAdapter):
         return json.dumps({"type": "OBSERVE_LOGS", "service": "api", "n": 8})
 
 
+class AsyncFakeLLM(AsyncLLMAdapter):
+    """`FakeLLM` behind an async interface, with optional simulated server latency.
+
+    Proposals are identical to `FakeLLM` for the same seed; the latency only
+    exercises the event loop.
+    """
+
+    def __init__(self, *, seed: int, latency_s: float = 0.0, rng_mode: RngMode = RngMode.COMPAT) -> None:
+        if latency_s < 0.0:
+            raise ValueError("latency_s must be non-negative")
+        self._inner = FakeLLM(seed=seed, rng_mode=rng_mode)
+        self._latency_s = latency_s
+
+    async def propose_next_action(self, *, context: LLMContext) -> str:
+        await asyncio.sleep(self._latency_s)
+        return self._inner.propose_next_action(context=context)
+
+
 def _last_metric(*, context: LLMContext, service: str, field: str) -> float | None:
     for obs in reversed(context.observations):
         if obs.get("tool") != "get_metrics":
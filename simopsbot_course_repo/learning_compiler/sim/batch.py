@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, TypeAlias
+
+from learning_compiler.sim.observations import HealthStatus
+from learning_compiler.sim.world import (
+    DEGRADED_ERROR_RATE,
+    DEGRADED_LATENCY_MS,
+    DOWN_ERROR_RATE,
+    WorldConfig,
+    api_metrics,
+    db_metrics,
+    restart_resolves,
+    rollback_resolves,
+)
+from learning_compiler.types import IncidentType, ServiceName
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError("BatchSimWorld needs NumPy: pip install -e '.[analysis]'") from e
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    Mask: TypeAlias = NDArray[np.bool_] | None
+
+INCIDENTS: tuple[IncidentType, ...] = tuple(IncidentType)
+SERVICES: tuple[ServiceName, ...] = ("api", "db")
+# `health()` codes index these.
+HEALTH_STATUSES: tuple[HealthStatus, ...] = (HealthStatus.OK, HealthStatus.DEGRADED, HealthStatus.DOWN)
+HEALTH_REASONS = ("healthy", "unhealthy_metrics", "error_rate_critical", "process_not_running")
+
+# True metrics are a function of (incident, resolved, api on v2), so history keeps a
+# 2-bit state code per world and tick (a ring of the last `max_delay_steps + 1`
+# ticks, like `SimWorld`), and metrics come from lookup tables.
+_RESOLVED = 1
+_API_V2 = 2
+_STATES = 4
+_INITIAL_VERSIONS = ("v1", "v2")
+
+
+class BatchSimWorld:
+    """N `SimWorld`s stepped together as arrays (struct of arrays).
+
+    World `i` behaves exactly like `SimWorld(configs[i])`: metrics, health and
+    resolution come from the same rule functions, so per-world values are
+    bit-identical. Side effects take a boolean `mask` of the worlds they apply to
+    (default: all) and tick only those worlds, as the scalar calls do. Logs are
+    not simulated; use `SimWorld` where a tool needs them.
+    """
+
+    def __init__(self, configs: Sequence[WorldConfig]) -> None:
+        for c in configs:
+            c.validate()
+        n = len(configs)
+        self._seeds = np.array([int(c.seed) for c in configs], dtype=np.int64)
+        self._incident = np.array([INCIDENTS.index(c.incident) for c in configs], dtype=np.uint8)
+        self._t = np.zeros(n, dtype=np.int64)
+        self._resolved = np.zeros(n, dtype=np.bool_)
+        self._running = {s: np.ones(n, dtype=np.bool_) for s in SERVICES}
+        self._version_names: list[str] = list(_INITIAL_VERSIONS)
+        api_start = np.where(self._incident == INCIDENTS.index(IncidentType.API_BAD_DEPLOY), 1, 0)
+        self._version = {"api": api_start.astype(np.int16), "db": np.zeros(n, dtype=np.int16)}
+        self._max_delay = np.array([c.max_delay_steps for c in configs], dtype=np.int64)
+        self._history = np.zeros((int(self._max_delay.max(initial=0)) + 1, n), dtype=np.uint8)
+        self._all = np.ones(n, dtype=np.bool_)
+        self._record(self._all)
+
+    def __len__(self) -> int:
+        return len(self._t)
+
+    @property
+    def seeds(self) -> NDArray[np.int64]:
+        return self._seeds
+
+    @property
+    def incident_codes(self) -> NDArray[np.uint8]:
+        """Per-world index into `INCIDENTS`."""
+
+        return self._incident
+
+    @property
+    def time_index(self) -> NDArray[np.int64]:
+        return self._t
+
+    @property
+    def resolved(self) -> NDArray[np.bool_]:
+        return self._resolved
+
+    def running(self, *, service: ServiceName) -> NDArray[np.bool_]:
+        return self._running[service]
+
+    def versions(self, *, service: ServiceName) -> list[str]:
+        return [self._version_names[code] for code in self._version[service].tolist()]
+
+    def tick(self, mask: Mask = None) -> None:
+        """Advance the masked worlds by one step."""
+
+        mask = self._mask(mask)
+        self._t[mask] += 1
+        self._record(mask)
+
+    # ---- Read APIs (ground truth, for all worlds at once) ----
+
+    def true_metrics(
+        self, *, service: ServiceName, delay_steps: int | NDArray[np.int64] = 0
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """(error_rate, latency_ms) arrays, `delay_steps` ticks ago (clamped to t=0)."""
+
+        if np.any(np.asarray(delay_steps) > self._max_delay):
+            raise ValueError(f"delay_steps={delay_steps} exceeds some world's max_delay_steps")
+        idx = np.maximum(0, self._t - np.maximum(0, delay_steps))
+        state = self._history[idx % len(self._history), np.arange(len(self))]
+        err, lat = _METRIC_TABLES[service]
+        return err[self._incident, state], lat[self._incident, state]
+
+    def health(self, *, service: ServiceName) -> tuple[NDArray[np.uint8], NDArray[np.uint8]]:
+        """Status and reason codes (into `HEALTH_STATUSES` / `HEALTH_REASONS`)."""
+
+        err, lat = self.true_metrics(service=service)
+        down = ~self._running[service]
+        critical = ~down & (err > DOWN_ERROR_RATE)
+        degraded = ~down & ~critical & ((err > DEGRADED_ERROR_RATE) | (lat > DEGRADED_LATENCY_MS))
+        reason = np.select([down, critical, degraded], [3, 2, 1], default=0).astype(np.uint8)
+        status = np.select([down | critical, degraded], [2, 1], default=0).astype(np.uint8)
+        return status, reason
+
+    # ---- Side effects ----
+
+    def restart(self, *, service: ServiceName, mask: Mask = None) -> NDArray[np.bool_]:
+        """Restart `service` in the masked worlds; returns the worlds this resolved."""
+
+        mask = self._mask(mask)
+        self._running[service][mask] = True
+        fixes = np.array([restart_resolves(i, service=service) for i in INCIDENTS], dtype=np.bool_)
+        return self._resolve_and_tick(mask, fixes)
+
+    def rollback(self, *, service: ServiceName, version: str, mask: Mask = None) -> NDArray[np.bool_]:
+        """Roll `service` back to `version` in the masked worlds; returns the worlds this resolved."""
+
+        mask = self._mask(mask)
+        if version not in self._version_names:
+            self._version_names.append(version)
+        self._version[service][mask] = self._version_names.index(version)
+        fixes = np.array(
+            [rollback_resolves(i, service=service, version=version) for i in INCIDENTS], dtype=np.bool_
+        )
+        return self._resolve_and_tick(mask, fixes)
+
+    # ---- Internals ----
+
+    def _mask(self, mask: Mask) -> NDArray[np.bool_]:
+        if mask is None:
+            return self._all
+        if mask.shape != self._t.shape:
+            raise ValueError(f"mask has shape {mask.shape}, expected ({len(self)},)")
+        return mask
+
+    def _resolve_and_tick(self, mask: NDArray[np.bool_], fixes: NDArray[np.bool_]) -> NDArray[np.bool_]:
+        newly = mask & ~self._resolved & fixes[self._incident]
+        self._resolved |= newly
+        self.tick(mask)
+        return newly
+
+    def _record(self, mask: NDArray[np.bool_]) -> None:
+        state = self._resolved.astype(np.uint8) * _RESOLVED
+        state |= (self._version["api"] == self._version_names.index("v2")).astype(np.uint8) * _API_V2
+        worlds = np.flatnonzero(mask)
+        self._history[self._t[worlds] % len(self._history), worlds] = state[worlds]
+
+
+def _metric_tables() -> dict[ServiceName, tuple[NDArray[np.float64], NDArray[np.float64]]]:
+    # [incident, state] -> value, filled from the scalar rules.
+    tables: dict[ServiceName, tuple[NDArray[np.float64], NDArray[np.float64]]] = {}
+    for service in SERVICES:
+        err = np.zeros((len(INCIDENTS), _STATES), dtype=np.float64)
+        lat = np.zeros((len(INCIDENTS), _STATES), dtype=np.float64)
+        for i, incident in enumerate(INCIDENTS):
+            for state in range(_STATES):
+                resolved = bool(state & _RESOLVED)
+                if service == "api":
+                    api_version = "v2" if state & _API_V2 else "v1"
+                    err[i, state], lat[i, state] = api_metrics(incident, api_version=api_version, resolved=resolved)
+                else:
+                    err[i, state], lat[i, state] = db_metrics(incident, resolved=resolved)
+        tables[service] = (err, lat)
+    return tables
+
+
+_METRIC_TABLES = _metric_tables()
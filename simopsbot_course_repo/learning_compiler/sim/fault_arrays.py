@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+import random
+
+from learning_compiler.sim.faults import FAULT_CODES, FaultKind, FaultProfile
+from learning_compiler.utils.rng import CounterRandom
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError("vectorized fault schedules need NumPy: pip install -e '.[analysis]'") from e
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+# Python's `random.Random` is MT19937 with 624 state words plus a position.
+_MT_WORDS = 624
+
+
+def fault_codes(rng: random.Random, *, calls: int, profile: FaultProfile) -> bytes:
+    """The `FAULT_KINDS` codes of the next `calls` draws of a fresh fault stream.
+
+    Compat draws come from NumPy's MT19937 seeded with `rng`'s exact state, so
+    they match `rng.random()` bit for bit; `rng` itself is left untouched.
+    """
+
+    if isinstance(rng, CounterRandom):
+        draws = (rng.random_at(i) for i in range(calls))
+        rolls = np.fromiter(draws, dtype=np.float64, count=calls)
+    else:
+        state = rng.getstate()[1]
+        mt = np.random.RandomState()
+        keys = np.array(state[:_MT_WORDS], dtype=np.uint32)
+        # No cached Gaussian: `random()` never draws one.
+        mt.set_state(("MT19937", keys, int(state[_MT_WORDS]), 0, 0.0))
+        rolls = mt.random_sample(calls)
+    return classify_rolls(rolls, profile=profile).tobytes()
+
+
+def classify_rolls(rolls: NDArray[np.float64], *, profile: FaultProfile) -> NDArray[np.uint8]:
+    """`FaultProfile.classify` over an array, as `FAULT_KINDS` codes (same float steps, same results)."""
+
+    timeout = rolls < profile.timeout_rate
+    rest = rolls - profile.timeout_rate
+    transient = rest < profile.transient_rate
+    rest = rest - profile.transient_rate
+    permanent = rest < profile.permanent_rate
+    codes: NDArray[np.uint8] = np.select(
+        [timeout, transient, permanent],
+        [FAULT_CODES[k] for k in (FaultKind.TIMEOUT, FaultKind.TRANSIENT, FaultKind.PERMANENT)],
+        default=FAULT_CODES[FaultKind.NONE],
+    ).astype(np.uint8)
+    return codes
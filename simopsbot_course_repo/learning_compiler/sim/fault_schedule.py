@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from enum import StrEnum
+from pathlib import Path
+import json
+import string
+
+from learning_compiler.sim.faults import (
+    DEFAULT_FAULT_PROFILE,
+    FAULT_CODES,
+    FAULT_KINDS,
+    TOOLS,
+    FaultKind,
+    FaultProfile,
+    fault_rng,
+)
+from learning_compiler.types import JSONValue, ToolName
+from learning_compiler.utils.json import canonical_dumps
+from learning_compiler.utils.rng import CounterRandom, RngMode
+
+# One base-36 character per call; codes 0-9 are plain digits, as in older files.
+_CODE_CHARS = string.digits + string.ascii_lowercase
+
+
+@dataclass(slots=True, frozen=True)
+class FaultSchedule:
+    """The faults of tool calls 1..N, one byte per call.
+
+    `faults[n - 1]` indexes `FAULT_KINDS`. `tools`, when the schedule was
+    recorded from a run (`FaultPlan(record=True).recorded()`), holds the `TOOLS`
+    index of the tool that made each call; precomputed schedules leave it empty.
+    """
+
+    faults: bytes
+    tools: bytes = b""
+
+    def validate(self) -> None:
+        if self.faults and max(self.faults) >= len(FAULT_KINDS):
+            raise ValueError("fault code out of range")
+        if self.tools and len(self.tools) != len(self.faults):
+            raise ValueError("tools must be empty or have one entry per call")
+        if self.tools and max(self.tools) >= len(TOOLS):
+            raise ValueError("tool code out of range")
+
+    def __len__(self) -> int:
+        return len(self.faults)
+
+    def fault_at(self, call_index: int) -> FaultKind:
+        """The fault of call `call_index` (1-based); calls past the end don't fail."""
+
+        if call_index <= 0:
+            raise ValueError("call_index must be positive")
+        if call_index > len(self.faults):
+            return FaultKind.NONE
+        return FAULT_KINDS[self.faults[call_index - 1]]
+
+    def counts(self) -> dict[FaultKind, int]:
+        return {k: self.faults.count(i) for i, k in enumerate(FAULT_KINDS)}
+
+    def breakdown(self) -> dict[ToolName, dict[FaultKind, int]]:
+        """Per-tool fault counts (tools that made no calls are left out); needs recorded tools."""
+
+        if not self.tools and self.faults:
+            raise ValueError("per-tool breakdown needs a schedule recorded from a run")
+        out: dict[ToolName, dict[FaultKind, int]] = {}
+        for tool_code, fault_code in zip(self.tools, self.faults, strict=True):
+            per_tool = out.setdefault(TOOLS[tool_code], dict.fromkeys(FAULT_KINDS, 0))
+            per_tool[FAULT_KINDS[fault_code]] += 1
+        return {t: out[t] for t in TOOLS if t in out}
+
+    def to_json(self) -> dict[str, JSONValue]:
+        # The legends keep files readable if the enums are reordered or grow.
+        return {
+            "calls": len(self.faults),
+            "fault_kinds": [k.value for k in FAULT_KINDS],
+            "faults": _encode_codes(self.faults, FAULT_KINDS),
+            "tool_names": [t.value for t in TOOLS],
+            "tools": _encode_codes(self.tools, TOOLS),
+        }
+
+    @classmethod
+    def from_json(cls, obj: JSONValue) -> FaultSchedule:
+        if not isinstance(obj, dict):
+            raise ValueError("fault schedule must be a JSON object")
+        faults = _decode_codes(obj, "faults", legend="fault_kinds", members=FAULT_KINDS)
+        tools = _decode_codes(obj, "tools", legend="tool_names", members=TOOLS)
+        if obj.get("calls") != len(faults):
+            raise ValueError("calls does not match the length of faults")
+        schedule = cls(faults=faults, tools=tools)
+        schedule.validate()
+        return schedule
+
+
+def build_fault_schedule(
+    *,
+    seed: int,
+    calls: int,
+    profile: FaultProfile = DEFAULT_FAULT_PROFILE,
+    rng_mode: RngMode = RngMode.COMPAT,
+) -> FaultSchedule:
+    """The faults `FaultPlan(seed=seed, profile=profile, rng_mode=rng_mode)` injects on calls 1..`calls`.
+
+    Bit-identical to calling `maybe_raise` `calls` times. With NumPy installed
+    the draws are classified as arrays (`fault_arrays`); without it, one by one.
+    """
+
+    if calls < 0:
+        raise ValueError("calls must be non-negative")
+    profile.validate()
+    rng = fault_rng(seed=seed, rng_mode=rng_mode)
+    try:
+        from learning_compiler.sim.fault_arrays import fault_codes
+    except ImportError:
+        if isinstance(rng, CounterRandom):
+            rolls = [rng.random_at(i) for i in range(calls)]
+        else:
+            rolls = [rng.random() for _ in range(calls)]
+        return FaultSchedule(faults=bytes(FAULT_CODES[profile.classify(r)] for r in rolls))
+    return FaultSchedule(faults=fault_codes(rng, calls=calls, profile=profile))
+
+
+def write_fault_schedule(path: Path, schedule: FaultSchedule) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(canonical_dumps(schedule.to_json()) + "\n", encoding="utf-8")
+
+
+def load_fault_schedule(path: Path) -> FaultSchedule:
+    try:
+        obj = json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError as e:
+        raise ValueError(f"{path}: not a JSON fault schedule: {e}") from e
+    return FaultSchedule.from_json(obj)
+
+
+def _encode_codes(codes: bytes, members: Sequence[StrEnum]) -> str:
+    if len(members) > len(_CODE_CHARS):
+        raise ValueError(f"one character per call encodes at most {len(_CODE_CHARS)} values")
+    return "".join(_CODE_CHARS[c] for c in codes)
+
+
+def _decode_codes(obj: dict[str, JSONValue], key: str, *, legend: str, members: Sequence[StrEnum]) -> bytes:
+    chars = obj.get(key)
+    names = obj.get(legend)
+    if not isinstance(chars, str) or not isinstance(names, list):
+        raise ValueError(f"{key} must be a string with a {legend} list")
+    if len(names) > len(_CODE_CHARS):
+        raise ValueError(f"{legend}: one character per call encodes at most {len(_CODE_CHARS)} values")
+    codes = {m.value: i for i, m in enumerate(members)}
+    try:
+        remap = [codes[str(name)] for name in names]
+        return bytes(remap[_CODE_CHARS.index(c)] for c in chars)
+    except KeyError as e:
+        raise ValueError(f"{legend}: unknown name {e}") from e
+    except (ValueError, IndexError) as e:
+        raise ValueError(f"{key}: {e}") from e
@@ -2,9 +2,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import StrEnum
+from typing import TYPE_CHECKING
+import copy
 import random
 
 from learning_compiler.types import ToolName
+from learning_compiler.utils.rng import CounterRandom, RngMode, fork_random, make_rng
+
+if TYPE_CHECKING:
+    from learning_compiler.sim.fault_schedule import FaultSchedule
 
 
 class FaultKind(StrEnum):
@@ -14,6 +20,13 @@ class FaultKind(StrEnum):
     PERMANENT = "permanent"
 
 
+# `FaultSchedule` bytes index these.
+FAULT_KINDS: tuple[FaultKind, ...] = tuple(FaultKind)
+TOOLS: tuple[ToolName, ...] = tuple(ToolName)
+FAULT_CODES: dict[FaultKind, int] = {k: i for i, k in enumerate(FAULT_KINDS)}
+TOOL_CODES: dict[ToolName, int] = {t: i for i, t in enumerate(TOOLS)}
+
+
 class ToolError(Exception):
     """Base class for simulated tool failures."""
 
@@ -53,10 +66,29 @@ class FaultProfile:
         if total > 1.0:
             raise ValueError("sum of fault rates must be <= 1")
 
+    def classify(self, roll: float) -> FaultKind:
+        """The fault a uniform draw in [0, 1) lands on (timeout, transient, permanent, none)."""
+
+        if roll < self.timeout_rate:
+            return FaultKind.TIMEOUT
+        roll -= self.timeout_rate
+        if roll < self.transient_rate:
+            return FaultKind.TRANSIENT
+        roll -= self.transient_rate
+        if roll < self.permanent_rate:
+            return FaultKind.PERMANENT
+        return FaultKind.NONE
+
 
 DEFAULT_FAULT_PROFILE = FaultProfile(timeout_rate=0.08, transient_rate=0.06, permanent_rate=0.01)
 
 
+def fault_rng(*, seed: int, rng_mode: RngMode = RngMode.COMPAT) -> random.Random:
+    """The draw stream of `FaultPlan(seed=seed)`: one `random()` per tool call."""
+
+    return make_rng(seed=seed, stream="faults", salt=0xA17C_2026, mode=rng_mode)
+
+
 class FaultPlan:
     """Deterministic fault injection for tools.
 
@@ -65,26 +97,85 @@ class FaultPlan:
     That is intentional. It makes:
     - debugging replayable
     - evaluations stable
+
+    Each call takes exactly one draw, so with `RngMode.COUNTER` the fault of call
+    n is a pure function of (seed, n): `fault_at(n)` answers it for any n.
+
+    With a `schedule` the plan replays it instead of drawing. With `record=True`
+    every call is also kept (two bytes each, so leave it off for soak runs) and
+    `recorded()` returns them as a `FaultSchedule`.
     """
 
-    def __init__(self, *, seed: int, profile: FaultProfile = DEFAULT_FAULT_PROFILE) -> None:
+    def __init__(
+        self,
+        *,
+        seed: int,
+        profile: FaultProfile = DEFAULT_FAULT_PROFILE,
+        rng_mode: RngMode = RngMode.COMPAT,
+        schedule: FaultSchedule | None = None,
+        record: bool = False,
+    ) -> None:
         profile.validate()
+        if schedule is not None:
+            schedule.validate()
         self._profile = profile
-        self._rng = random.Random(seed ^ 0xA17C_2026)
+        self._rng = fault_rng(seed=seed, rng_mode=rng_mode)
+        self._schedule = schedule
         self._call_index = 0
+        self._record = record
+        self._faults = bytearray()
+        self._tools = bytearray()
 
     @property
     def call_index(self) -> int:
         return self._call_index
 
+    def fork(self) -> FaultPlan:
+        """A copy that injects the same faults from here on, independently of this plan."""
+
+        child = copy.copy(self)
+        child._rng = fork_random(self._rng)
+        child._faults = bytearray(self._faults)
+        child._tools = bytearray(self._tools)
+        return child
+
+    def recorded(self) -> FaultSchedule:
+        """The calls made so far: their faults and the tools that made them."""
+
+        # Imported here: `fault_schedule` builds on this module.
+        from learning_compiler.sim.fault_schedule import FaultSchedule
+
+        if not self._record:
+            raise ValueError("this fault plan does not record calls; create it with record=True")
+        return FaultSchedule(faults=bytes(self._faults), tools=bytes(self._tools))
+
+    def fault_at(self, call_index: int) -> FaultKind:
+        """The fault of call `call_index` (1-based, like `call_index`), in any order.
+
+        Needs `RngMode.COUNTER` or a schedule; compat draws depend on every earlier call.
+        """
+
+        if self._schedule is not None:
+            return self._schedule.fault_at(call_index)
+        if not isinstance(self._rng, CounterRandom):
+            raise ValueError("fault_at needs a counter-mode fault plan (RngMode.COUNTER)")
+        if call_index <= 0:
+            raise ValueError("call_index must be positive")
+        return self._profile.classify(self._rng.random_at(call_index - 1))
+
     def maybe_raise(self, *, tool: ToolName) -> None:
         self._call_index += 1
-        roll = self._rng.random()
-        if roll < self._profile.timeout_rate:
+        if self._schedule is not None:
+            fault = self._schedule.fault_at(self._call_index)
+        else:
+            fault = self._profile.classify(self._rng.random())
+        if self._record:
+            self._faults.append(FAULT_CODES[fault])
+            self._tools.append(TOOL_CODES[tool])
+        if fault is FaultKind.TIMEOUT:
             raise ToolTimeout(tool=tool, message=f"{tool.value} timed out")
-        roll -= self._profile.timeout_rate
-        if roll < self._profile.transient_rate:
+        if fault is FaultKind.TRANSIENT:
             raise ToolTransientError(tool=tool, message=f"{tool.value} transient failure")
-        roll -= self._profile.transient_rate
-        if roll < self._profile.permanent_rate:
+        if fault is FaultKind.PERMANENT:
             raise ToolPermanentError(tool=tool, message=f"{tool.value} permanent failure")
+
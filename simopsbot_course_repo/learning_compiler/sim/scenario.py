@@ -1,16 +1,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-import random
 
 from learning_compiler.sim.world import SimWorld, WorldConfig
 from learning_compiler.types import IncidentType, ScenarioSeed
+from learning_compiler.utils.rng import RngMode, make_rng
 
 
 @dataclass(slots=True, frozen=True)
 class ScenarioConfig:
     seed: ScenarioSeed
     incident_override: IncidentType | None = None
+    rng_mode: RngMode = RngMode.COMPAT
 
     def validate(self) -> None:
         if int(self.seed) < 0:
@@ -27,9 +28,10 @@ class Scenario:
 def generate_scenario(config: ScenarioConfig) -> Scenario:
     config.validate()
     seed_int = int(config.seed)
-    rng = random.Random(seed_int ^ 0x5113_2026)  # deterministic but not just "seed"
+    # deterministic but not just "seed"
+    rng = make_rng(seed=seed_int, stream="scenario", salt=0x5113_2026, mode=config.rng_mode)
     incident = config.incident_override or rng.choice(
         [IncidentType.API_BAD_DEPLOY, IncidentType.DB_SATURATION, IncidentType.NETWORK_FLAKY]
     )
-    world = SimWorld(WorldConfig(seed=config.seed, incident=incident))
+    world = SimWorld(WorldConfig(seed=config.seed, incident=incident, rng_mode=config.rng_mode))
     return Scenario(seed=config.seed, incident=incident, world=world)
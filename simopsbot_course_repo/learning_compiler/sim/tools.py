@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-import random
+import copy
 from collections.abc import Callable
 
 from learning_compiler.sim.faults import FaultPlan, ToolError, ToolTimeout
@@ -14,8 +14,9 @@ from learning_compiler.sim.observations import (
 )
 from learning_compiler.sim.redteam import maybe_inject_untrusted_snippet
 from learning_compiler.sim.runbooks import runbook_search
-from learning_compiler.sim.world import SimWorld
+from learning_compiler.sim.world import METRICS_DELAY_STEPS, SimWorld
 from learning_compiler.types import IdempotencyKey, ServiceName, ToolName
+from learning_compiler.utils.rng import RngMode, fork_random, make_rng
 
 
 @dataclass(slots=True, frozen=True)
@@ -35,17 +36,42 @@ class RawSimTools:
     - actions can fail (timeout / transient error)
     """
 
-    def __init__(self, *, world: SimWorld, fault_plan: FaultPlan, seed: int) -> None:
+    def __init__(
+        self, *, world: SimWorld, fault_plan: FaultPlan, seed: int, rng_mode: RngMode = RngMode.COMPAT
+    ) -> None:
         self._world = world
         self._faults = fault_plan
-        self._rng = random.Random(seed ^ 0x7001_7001)
+        self._rng = make_rng(seed=seed, stream="tools", salt=0x7001_7001, mode=rng_mode)
         self._idempotency: set[str] = set()
 
+    @property
+    def world(self) -> SimWorld:
+        return self._world
+
+    @property
+    def fault_plan(self) -> FaultPlan:
+        return self._faults
+
+    def fork(self) -> RawSimTools:
+        """Fork the sim stack for counterfactual branches.
+
+        The world, fault plan, tool RNG and applied idempotency keys are forked, so
+        calls on the fork return exactly what the same calls would on this stack
+        (or on a fresh stack replaying the same prefix) and never affect it.
+        """
+
+        child = copy.copy(self)
+        child._world = self._world.fork()
+        child._faults = self._faults.fork()
+        child._rng = fork_random(self._rng)
+        child._idempotency = set(self._idempotency)
+        return child
+
     # ---- Read-only tools ----
 
     def get_metrics(self, *, service: ServiceName, window_minutes: int) -> MetricsObservation:
         self._faults.maybe_raise(tool=ToolName.GET_METRICS)
-        delay_steps = 1 if self._rng.random() < 0.30 else 0
+        delay_steps = METRICS_DELAY_STEPS if self._rng.random() < 0.30 else 0
         err, lat = self._world.true_metrics(service=service, delay_steps=delay_steps)
         noisy_err = _clip01(err + self._rng.gauss(0.0, 0.01))
         noisy_lat = max(0.0, lat + self._rng.gauss(0.0, 12.0))
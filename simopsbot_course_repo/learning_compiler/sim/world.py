@@ -1,16 +1,37 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-import random
+from array import array
+from dataclasses import dataclass, replace
+import copy
 
 from learning_compiler.sim.observations import HealthStatus
 from learning_compiler.types import IncidentType, ScenarioSeed, ServiceName
+from learning_compiler.utils.rng import RngMode, fork_random, make_rng
+
+# Health thresholds on true metrics (`SimWorld.health`).
+DOWN_ERROR_RATE = 0.60
+DEGRADED_ERROR_RATE = 0.20
+DEGRADED_LATENCY_MS = 400.0
+
+# `RawSimTools.get_metrics` lags at most this many ticks.
+METRICS_DELAY_STEPS = 1
+
+# History slot layout: api (error_rate, latency_ms), then db.
+_SLOT_FLOATS = 4
+_SERVICE_OFFSET: dict[ServiceName, int] = {"api": 0, "db": 2}
 
 
 @dataclass(slots=True, frozen=True)
 class WorldConfig:
     seed: ScenarioSeed
     incident: IncidentType
+    # How far back `true_metrics` can look; the world keeps only that much history.
+    max_delay_steps: int = METRICS_DELAY_STEPS
+    rng_mode: RngMode = RngMode.COMPAT
+
+    def validate(self) -> None:
+        if self.max_delay_steps < 0:
+            raise ValueError("max_delay_steps must be non-negative")
 
 
 @dataclass(slots=True)
@@ -23,16 +44,21 @@ class SimWorld:
     """Deterministic toy 'production' world with two services: api -> db."""
 
     def __init__(self, config: WorldConfig) -> None:
+        config.validate()
         self._config = config
-        self._rng = random.Random(int(config.seed) ^ 0xBADC0DE)
+        self._rng = make_rng(seed=int(config.seed), stream="world", salt=0xBADC0DE, mode=config.rng_mode)
         self._t = 0
         self._resolved = False
         self._services: dict[ServiceName, ServiceState] = {
             "api": ServiceState(version="v2" if config.incident is IncidentType.API_BAD_DEPLOY else "v1", running=True),
             "db": ServiceState(version="v1", running=True),
         }
-        # Snapshot history of *true* metrics (no noise). Used for delayed observations.
-        self._history: list[dict[ServiceName, tuple[float, float]]] = []
+        # Ring buffer of *true* metrics (no noise) for the last `max_delay_steps + 1`
+        # ticks, used for delayed observations. Tick t lives in slot t % capacity.
+        self._capacity = config.max_delay_steps + 1
+        self._history = array("d", bytes(8 * _SLOT_FLOATS * self._capacity))
+        # Set when a fork shares `_history`; the next write copies it first.
+        self._history_shared = False
         self._record_snapshot()
 
     @property
@@ -47,6 +73,19 @@ class SimWorld:
     def resolved(self) -> bool:
         return self._resolved
 
+    def fork(self) -> SimWorld:
+        """An independent copy; both worlds continue exactly as this one would.
+
+        The config is shared and the metric history is copy-on-write, so a fork
+        costs two service records and an RNG state.
+        """
+
+        child = copy.copy(self)
+        child._rng = fork_random(self._rng)
+        child._services = {name: replace(s) for name, s in self._services.items()}
+        self._history_shared = child._history_shared = True
+        return child
+
     def tick(self) -> None:
         """Advance simulated time by one step."""
 
@@ -56,17 +95,22 @@ class SimWorld:
     # ---- Read APIs (ground truth; tool wrappers add noise/delay) ----
 
     def true_metrics(self, *, service: ServiceName, delay_steps: int) -> tuple[float, float]:
+        # Checked against the config, not the ticks so far, so a bad delay fails on the first call.
+        if delay_steps > self._config.max_delay_steps:
+            raise ValueError(
+                f"delay_steps={delay_steps} exceeds max_delay_steps={self._config.max_delay_steps}"
+            )
         idx = max(0, self._t - max(0, delay_steps))
-        snap = self._history[idx]
-        return snap[service]
+        at = (idx % self._capacity) * _SLOT_FLOATS + _SERVICE_OFFSET[service]
+        return (self._history[at], self._history[at + 1])
 
     def health(self, *, service: ServiceName) -> tuple[HealthStatus, dict[str, str]]:
         err, lat = self.true_metrics(service=service, delay_steps=0)
         if not self._services[service].running:
             return (HealthStatus.DOWN, {"reason": "process_not_running"})
-        if err > 0.60:
+        if err > DOWN_ERROR_RATE:
             return (HealthStatus.DOWN, {"reason": "error_rate_critical"})
-        if err > 0.20 or lat > 400.0:
+        if err > DEGRADED_ERROR_RATE or lat > DEGRADED_LATENCY_MS:
             return (HealthStatus.DEGRADED, {"reason": "unhealthy_metrics"})
         return (HealthStatus.OK, {"reason": "healthy"})
 
@@ -83,64 +127,31 @@ class SimWorld:
     def restart(self, *, service: ServiceName) -> str:
         self._services[service].running = True
         msg = f"restarted {service}"
-        # In this toy world, restart fixes some incidents.
-        if not self._resolved:
-            if self._config.incident is IncidentType.DB_SATURATION and service == "db":
-                self._resolved = True
-                msg = "restarted db (cleared saturation)"
-            if self._config.incident is IncidentType.NETWORK_FLAKY and service == "api":
-                self._resolved = True
-                msg = "restarted api (reset connections)"
+        if not self._resolved and restart_resolves(self._config.incident, service=service):
+            self._resolved = True
+            msg = "restarted db (cleared saturation)" if service == "db" else "restarted api (reset connections)"
         self.tick()
         return msg
 
     def rollback(self, *, service: ServiceName, version: str) -> str:
         self._services[service].version = version
         msg = f"rolled back {service} to {version}"
-        if not self._resolved:
-            if self._config.incident is IncidentType.API_BAD_DEPLOY and service == "api" and version == "v1":
-                self._resolved = True
-                msg = "rolled back api to v1 (bad deploy reverted)"
+        if not self._resolved and rollback_resolves(self._config.incident, service=service, version=version):
+            self._resolved = True
+            msg = "rolled back api to v1 (bad deploy reverted)"
         self.tick()
         return msg
 
     # ---- Internals ----
 
     def _record_snapshot(self) -> None:
-        self._history.append(
-            {
-                "api": self._compute_api_metrics(),
-                "db": self._compute_db_metrics(),
-            }
-        )
-
-    def _compute_api_metrics(self) -> tuple[float, float]:
-        # Baselines:
-        err = 0.01
-        lat = 120.0
-        if self._resolved:
-            return (err, lat)
-
-        if self._config.incident is IncidentType.API_BAD_DEPLOY:
-            # Version v2 is "bad": high 5xx + elevated latency.
-            if self._services["api"].version == "v2":
-                return (0.35, 220.0)
-            return (err, lat)
-        if self._config.incident is IncidentType.DB_SATURATION:
-            # Cascading latency + some timeout errors.
-            return (0.05, 420.0)
-        if self._config.incident is IncidentType.NETWORK_FLAKY:
-            return (0.12, 320.0)
-        raise AssertionError("Unhandled incident")
-
-    def _compute_db_metrics(self) -> tuple[float, float]:
-        err = 0.005
-        lat = 60.0
-        if self._resolved:
-            return (err, lat)
-        if self._config.incident is IncidentType.DB_SATURATION:
-            return (0.01, 520.0)
-        return (err, lat)
+        api = api_metrics(self._config.incident, api_version=self._services["api"].version, resolved=self._resolved)
+        db = db_metrics(self._config.incident, resolved=self._resolved)
+        if self._history_shared:
+            self._history = array("d", self._history)
+            self._history_shared = False
+        at = (self._t % self._capacity) * _SLOT_FLOATS
+        self._history[at : at + _SLOT_FLOATS] = array("d", (*api, *db))
 
     def _log_templates(self, *, service: ServiceName) -> list[str]:
         if service == "api":
@@ -183,3 +194,49 @@ class SimWorld:
             "INFO checkpoint complete",
             "INFO connections=42",
         ]
+
+
+# ---- World rules (shared with `BatchSimWorld`) ----
+def api_metrics(incident: IncidentType, *, api_version: str, resolved: bool) -> tuple[float, float]:
+    """True (error_rate, latency_ms) of the api service."""
+
+    # Baselines:
+    err = 0.01
+    lat = 120.0
+    if resolved:
+        return (err, lat)
+
+    if incident is IncidentType.API_BAD_DEPLOY:
+        # Version v2 is "bad": high 5xx + elevated latency.
+        if api_version == "v2":
+            return (0.35, 220.0)
+        return (err, lat)
+    if incident is IncidentType.DB_SATURATION:
+        # Cascading latency + some timeout errors.
+        return (0.05, 420.0)
+    if incident is IncidentType.NETWORK_FLAKY:
+        return (0.12, 320.0)
+    raise AssertionError("Unhandled incident")
+
+
+def db_metrics(incident: IncidentType, *, resolved: bool) -> tuple[float, float]:
+    """True (error_rate, latency_ms) of the db service."""
+
+    err = 0.005
+    lat = 60.0
+    if resolved:
+        return (err, lat)
+    if incident is IncidentType.DB_SATURATION:
+        return (0.01, 520.0)
+    return (err, lat)
+
+
+def restart_resolves(incident: IncidentType, *, service: ServiceName) -> bool:
+    # In this toy world, restart fixes some incidents.
+    return (incident is IncidentType.DB_SATURATION and service == "db") or (
+        incident is IncidentType.NETWORK_FLAKY and service == "api"
+    )
+
+
+def rollback_resolves(incident: IncidentType, *, service: ServiceName, version: str) -> bool:
+    return incident is IncidentType.API_BAD_DEPLOY and service == "api" and version == "v1"
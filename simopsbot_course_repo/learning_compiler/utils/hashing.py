@@ -3,6 +3,7 @@ from __future__ import annotations
 import hashlib
 
 from learning_compiler.types import RunId
+from learning_compiler.utils.rng import RngMode
 
 
 def stable_short_hash(text: str, *, length: int = 12) -> str:
@@ -16,5 +17,7 @@ def stable_short_hash(text: str, *, length: int = 12) -> str:
     return digest[:length]
 
 
-def make_run_id(*, seed: int, profile: str) -> RunId:
-    return RunId(stable_short_hash(f"seed={seed}|profile={profile}", length=16))
+def make_run_id(*, seed: int, profile: str, rng_mode: RngMode = RngMode.COMPAT) -> RunId:
+    # Compat ids predate `rng_mode` and stay unchanged.
+    rng = "" if rng_mode is RngMode.COMPAT else f"|rng={rng_mode.value}"
+    return RunId(stable_short_hash(f"seed={seed}|profile={profile}{rng}", length=16))
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from enum import StrEnum
+from typing import Any
+import hashlib
+import math
+import random
+
+_WORD_BYTES = 8
+_TWO_POW_MINUS_53 = 2.0**-53
+
+
+class RngMode(StrEnum):
+    """How simulator and fake-model randomness is drawn.
+
+    `compat` keeps the historical sequential `random.Random(seed ^ salt)` streams
+    (and therefore today's journals, byte for byte). `counter` makes the n-th draw
+    of each stream a pure function of (seed, stream, n): see `CounterRandom`.
+    """
+
+    COMPAT = "compat"
+    COUNTER = "counter"
+
+
+class CounterRandom(random.Random):
+    """A `random.Random` whose n-th draw is a keyed hash of (seed, stream, n).
+
+    Nothing carries over between draws except the counter, so any draw can be
+    recomputed or computed ahead, out of order, in bulk (`random_at`, `at`).
+    Every `random.Random` method works on top of it; `gauss` is overridden to
+    use exactly two draws per call (the stdlib caches every second value).
+    """
+
+    def __init__(self, *, seed: int, stream: str, index: int = 0) -> None:
+        self._seed = seed
+        self._stream = stream
+        self._key = hashlib.blake2b(f"{seed}/{stream}".encode(), digest_size=16).digest()
+        self._index = index
+        super().__init__(0)
+
+    @property
+    def stream(self) -> str:
+        return self._stream
+
+    @property
+    def index(self) -> int:
+        """How many draws have been taken: the counter of the next one."""
+
+        return self._index
+
+    def at(self, index: int) -> CounterRandom:
+        """An independent generator of the same stream, positioned at draw `index`."""
+
+        return CounterRandom(seed=self._seed, stream=self._stream, index=index)
+
+    def word_at(self, index: int) -> int:
+        """The 64-bit word of draw `index`."""
+
+        if index < 0:
+            raise ValueError("index must be non-negative")
+        digest = hashlib.blake2b(index.to_bytes(_WORD_BYTES, "little"), key=self._key, digest_size=_WORD_BYTES)
+        return int.from_bytes(digest.digest(), "little")
+
+    def random_at(self, index: int) -> float:
+        """What `random()` returns as draw `index`, without moving the counter."""
+
+        return (self.word_at(index) >> 11) * _TWO_POW_MINUS_53
+
+    # ---- random.Random overrides ----
+
+    def seed(self, a: Any = None, version: int = 2) -> None:
+        # Draws depend on (seed, stream, index) only; the Mersenne Twister state is unused.
+        pass
+
+    def random(self) -> float:
+        x = self.random_at(self._index)
+        self._index += 1
+        return x
+
+    def getrandbits(self, k: int) -> int:
+        if k < 0:
+            raise ValueError("number of bits must be non-negative")
+        out, bits = 0, 0
+        while bits < k:
+            out = (out << 64) | self.word_at(self._index)
+            self._index += 1
+            bits += 64
+        return out >> (bits - k)
+
+    def gauss(self, mu: float = 0.0, sigma: float = 1.0) -> float:
+        # Box-Muller; 1 - u keeps the log argument in (0, 1].
+        u1 = 1.0 - self.random()
+        u2 = self.random()
+        return mu + sigma * math.sqrt(-2.0 * math.log(u1)) * math.cos(2.0 * math.pi * u2)
+
+    def getstate(self) -> tuple[Any, ...]:
+        return (self._seed, self._stream, self._index)
+
+    def setstate(self, state: tuple[Any, ...]) -> None:
+        seed, stream, index = state
+        if (seed, stream) != (self._seed, self._stream):
+            raise ValueError("state belongs to another stream")
+        self._index = index
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (_counter_random, (self._seed, self._stream, self._index))
+
+
+def make_rng(*, seed: int, stream: str, salt: int, mode: RngMode) -> random.Random:
+    """The generator for one stream: `random.Random(seed ^ salt)` in compat mode."""
+
+    if mode is RngMode.COUNTER:
+        return CounterRandom(seed=seed, stream=stream)
+    return random.Random(seed ^ salt)
+
+
+def fork_random(rng: random.Random) -> random.Random:
+    """An independent `random.Random` that continues with the same draws as `rng`."""
+
+    if isinstance(rng, CounterRandom):
+        return rng.at(rng.index)
+    child = random.Random()
+    child.setstate(rng.getstate())
+    return child
+
+
+def _counter_random(seed: int, stream: str, index: int) -> CounterRandom:
+    return CounterRandom(seed=seed, stream=stream, index=index)
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from learning_compiler.agent.state import AgentProfile
+from learning_compiler.bench.baseline import compare_to_baseline, load_baseline, save_baseline
+from learning_compiler.bench.suite import BenchCell, run_grid
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark SimOpsBot throughput, step latency and peak RSS.")
+    parser.add_argument("--profiles", type=str, default=",".join(p.value for p in AgentProfile))
+    parser.add_argument("--seed-counts", type=str, default="200,1000", help="Comma-separated suite sizes.")
+    parser.add_argument("--workers", type=str, default="1", help="Comma-separated worker counts.")
+    parser.add_argument("--out", type=Path, default=Path("outputs/bench/bench.json"))
+    parser.add_argument("--compare", type=Path, default=None, help="Baseline JSON to check for regressions.")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="Allowed relative slowdown.")
+    args = parser.parse_args()
+
+    cells = run_grid(
+        profiles=[AgentProfile(p.strip()) for p in args.profiles.split(",") if p.strip()],
+        seed_counts=_ints(args.seed_counts),
+        worker_counts=_ints(args.workers),
+    )
+    save_baseline(args.out, cells)
+    print(_to_markdown(cells))
+    print(f"Wrote {args.out}")
+
+    if args.compare is None:
+        return 0
+    regressions = compare_to_baseline(current=cells, baseline=load_baseline(args.compare), tolerance=args.tolerance)
+    for r in regressions:
+        print(f"REGRESSION {r.describe()}")
+    print(f"Regressions vs {args.compare}: {len(regressions)}")
+    return 1 if regressions else 0
+
+
+def _ints(spec: str) -> list[int]:
+    return [int(x.strip()) for x in spec.split(",") if x.strip()]
+
+
+def _to_markdown(cells: list[BenchCell]) -> str:
+    lines = ["| Profile | Seeds | Workers | Runs/sec | Step p50 (us) | Step p90 (us) | Step p99 (us) | Peak RSS (MB) |"]
+    lines.append("|---|---:|---:|---:|---:|---:|---:|---:|")
+    for c in cells:
+        lat = c.step_latency_us
+        lines.append(
+            f"| {c.profile.value} | {c.seeds} | {c.workers} | {c.runs_per_second:.1f} "
+            f"| {lat['p50']:.1f} | {lat['p90']:.1f} | {lat['p99']:.1f} | {c.peak_rss_kb / 1024:.1f} |"
+        )
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from learning_compiler.bench.journal_read import bench_journal_read
+from learning_compiler.utils.json import canonical_dumps
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark journal reading: validated vs trusted vs binary.")
+    parser.add_argument("--events", type=int, default=50_000, help="Events in the synthetic journal.")
+    parser.add_argument("--repeats", type=int, default=5, help="Best-of-N timing.")
+    parser.add_argument("--out", type=Path, default=Path("outputs/bench/journal_read.json"))
+    args = parser.parse_args()
+
+    bench = bench_journal_read(events=args.events, repeats=args.repeats)
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_text(canonical_dumps(bench.to_json()), encoding="utf-8")
+    print(bench.to_markdown())
+    print(f"Wrote {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
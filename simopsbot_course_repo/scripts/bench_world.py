@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from learning_compiler.bench.world_history import bench_world_history
+from learning_compiler.sim.world import METRICS_DELAY_STEPS
+from learning_compiler.utils.json import canonical_dumps
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark SimWorld memory over a long tick horizon.")
+    parser.add_argument("--ticks", type=int, default=1_000_000)
+    parser.add_argument("--max-delay-steps", type=int, default=METRICS_DELAY_STEPS, help="History kept per world.")
+    parser.add_argument("--out", type=Path, default=Path("outputs/bench/world_history.json"))
+    args = parser.parse_args()
+
+    bench = bench_world_history(ticks=args.ticks, max_delay_steps=args.max_delay_steps)
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_text(canonical_dumps(bench.to_json()), encoding="utf-8")
+    print(bench.to_markdown())
+    print(f"Wrote {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
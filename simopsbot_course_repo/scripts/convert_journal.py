@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from learning_compiler.journal.convert import convert_journal
+from learning_compiler.journal.models import JournalFormat
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Convert run journals between JSONL, gzip/xz JSONL and binary (lossless)."
+    )
+    parser.add_argument("paths", type=Path, nargs="+", help="Journal files, or dirs of journals.")
+    parser.add_argument("--to", type=str, required=True, choices=[f.value for f in JournalFormat])
+    parser.add_argument("--delete-source", action="store_true", help="Remove each source after converting it.")
+    args = parser.parse_args()
+
+    target = JournalFormat(args.to)
+    files: list[Path] = []
+    for path in args.paths:
+        if path.is_dir():
+            files.extend(sorted(p for p in path.iterdir() if JournalFormat.for_path(p) not in (None, target)))
+        else:
+            files.append(path)
+
+    before = after = 0
+    for src in files:
+        source = JournalFormat.for_path(src)
+        stem = src.name.removesuffix(source.suffix) if source is not None else src.name
+        dst = src.with_name(stem + target.suffix)
+        if dst == src:
+            continue
+        convert_journal(src, dst, to=target)
+        before += src.stat().st_size
+        after += dst.stat().st_size
+        if args.delete_source:
+            src.unlink()
+
+    ratio = before / after if after else 0.0
+    print(f"Converted {len(files)} journal(s): {before} -> {after} bytes ({ratio:.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from learning_compiler.eval.diff import DiffStatus, iter_diffs, pair_journals
+from learning_compiler.eval.journal_io import journal_paths
+from learning_compiler.utils.json import canonical_dumps
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Find the first divergent step of every run between two evals (or runs dirs)."
+    )
+    parser.add_argument("left", type=Path)
+    parser.add_argument("right", type=Path)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--max-changes", type=int, default=20, help="Payload differences shown per run.")
+    parser.add_argument("--json", action="store_true", help="One JSON line per run that is not identical.")
+    args = parser.parse_args()
+
+    pairs = pair_journals(journal_paths([args.left]), journal_paths([args.right]))
+    counts = {status: 0 for status in DiffStatus}
+    for diff in iter_diffs(pairs, workers=args.workers, max_changes=args.max_changes):
+        counts[diff.status] += 1
+        if diff.status is DiffStatus.IDENTICAL:
+            continue
+        print(canonical_dumps(diff.to_json()) if args.json else diff.describe())
+
+    if not args.json:
+        summary = ", ".join(f"{n} {status.value.replace('_', ' ')}" for status, n in counts.items())
+        print(f"{len(pairs)} runs: {summary}")
+    return 0 if counts[DiffStatus.IDENTICAL] == len(pairs) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,45 +1,127 @@
 from __future__ import annotations
 
 import argparse
+import sys
 from pathlib import Path
 
 from learning_compiler.agent.state import AgentProfile
-from learning_compiler.eval.runner import run_eval
+from learning_compiler.eval.options import EvalOptions, merge_eval_shards, parse_profiles, run_eval_options
+from learning_compiler.eval.sequential import EarlyStopConfig
+from learning_compiler.eval.seeds import parse_seed_spec, parse_shard_spec
+from learning_compiler.journal.models import JournalFormat
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser(description="Run offline evaluation suite for SimOpsBot.")
+    if sys.argv[1:2] == ["merge"]:
+        return _merge_main(sys.argv[2:])
+
+    parser = argparse.ArgumentParser(
+        description="Run offline evaluation suite for SimOpsBot.",
+        epilog="Use 'eval_runner merge --out DIR SHARD_DIR...' to combine shard outputs.",
+    )
     parser.add_argument("--profile", type=str, default="week5", choices=[p.value for p in AgentProfile])
+    parser.add_argument(
+        "--profiles",
+        type=str,
+        default=None,
+        help="Comma-separated profiles to compare in one pass, e.g. 'week2,week5' (first is the baseline).",
+    )
     parser.add_argument(
         "--seeds",
         type=str,
         default="0:50",
         help="Seed list. Examples: '0:50' (range), '1,2,3'. End is exclusive for ranges.",
     )
+    parser.add_argument("--shard", type=str, default=None, help="Run only shard K of N, e.g. '3/8'.")
     parser.add_argument("--out", type=Path, default=Path("outputs/eval"))
+    parser.add_argument("--workers", type=int, default=1, help="Process-pool size (1 = serial).")
+    parser.add_argument(
+        "--async-concurrency",
+        type=int,
+        default=None,
+        help="Run seeds on one asyncio event loop with at most N in flight (for I/O-bound models).",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Keep completed seeds from an existing --out results.jsonl and run only the rest.",
+    )
+    parser.add_argument("--cache-dir", type=Path, default=None, help="Reuse results of unchanged seeds.")
+    parser.add_argument("--cache-max-mb", type=int, default=512, help="LRU size cap for --cache-dir.")
+    parser.add_argument(
+        "--early-stop",
+        type=float,
+        default=None,
+        metavar="CONFIDENCE",
+        help="Stop once the gate outcome is settled at this confidence, e.g. 0.99.",
+    )
+    parser.add_argument(
+        "--early-stop-min-runs",
+        type=int,
+        default=EarlyStopConfig().min_runs,
+        help="Runs before a statistical early stop is allowed (certain outcomes stop at once).",
+    )
+    parser.add_argument(
+        "--journal-format",
+        type=str,
+        default=JournalFormat.JSONL.value,
+        choices=[f.value for f in JournalFormat],
+        help="Run journal encoding; 'binary' is 5-7x smaller (see scripts/convert_journal.py).",
+    )
+    parser.add_argument(
+        "--compress",
+        type=str,
+        nargs="?",
+        const="gzip",
+        default=None,
+        choices=["gzip", "xz"],
+        help="Write gzip (default) or xz-compressed JSONL journals (.jsonl.gz / .jsonl.xz).",
+    )
+    parser.add_argument(
+        "--journal-store",
+        action="store_true",
+        help="Append every run journal to one sqlite store (journals.sqlite) instead of runs/*.jsonl.",
+    )
     args = parser.parse_args()
 
-    profile = AgentProfile(args.profile)
-    seeds = _parse_seeds(args.seeds)
-
-    report = run_eval(profile=profile, seeds=seeds, out_dir=args.out)
-    print((args.out / "eval_summary.md").read_text(encoding="utf-8"))
-    print(f"Gate passed: {report.gate.passed}")
+    try:
+        options = EvalOptions(
+            profile=AgentProfile(args.profile),
+            seeds=parse_seed_spec(args.seeds),
+            out_dir=args.out,
+            profiles=parse_profiles(args.profiles) if args.profiles is not None else None,
+            shard=parse_shard_spec(args.shard) if args.shard is not None else None,
+            workers=args.workers,
+            async_concurrency=args.async_concurrency,
+            resume=args.resume,
+            cache_dir=args.cache_dir,
+            cache_max_mb=args.cache_max_mb,
+            early_stop=(
+                EarlyStopConfig(confidence=args.early_stop, min_runs=args.early_stop_min_runs)
+                if args.early_stop is not None
+                else None
+            ),
+            journal_format=JournalFormat(args.journal_format),
+            compress=args.compress,
+            journal_store=args.journal_store,
+        )
+        options.validate()
+    except ValueError as e:
+        parser.error(str(e))
+    print(run_eval_options(options))
     return 0
 
 
-def _parse_seeds(spec: str) -> list[int]:
-    s = spec.strip()
-    if ":" in s:
-        left, right = s.split(":", maxsplit=1)
-        start = int(left) if left else 0
-        end = int(right)
-        if end < start:
-            raise ValueError("range end must be >= start")
-        return list(range(start, end))
-    if "," in s:
-        return [int(x.strip()) for x in s.split(",") if x.strip()]
-    return [int(s)]
+def _merge_main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="eval_runner merge", description="Merge shard eval outputs into one eval."
+    )
+    parser.add_argument("shards", type=Path, nargs="+", help="Shard output dirs (any order).")
+    parser.add_argument("--out", type=Path, required=True)
+    args = parser.parse_args(argv)
+
+    print(merge_eval_shards(shard_dirs=args.shards, out_dir=args.out))
+    return 0
 
 
 if __name__ == "__main__":
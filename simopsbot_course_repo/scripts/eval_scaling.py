@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from learning_compiler.agent.state import AgentProfile
+from learning_compiler.eval.parallel import measure_scaling
+from learning_compiler.eval.seeds import parse_seed_spec
+from learning_compiler.utils.json import canonical_dumps
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure eval throughput (runs/sec) vs worker count.")
+    parser.add_argument("--profile", type=str, default="week5", choices=[p.value for p in AgentProfile])
+    parser.add_argument("--seeds", type=str, default="0:200")
+    parser.add_argument("--workers", type=str, default="1,2,4", help="Comma-separated worker counts.")
+    parser.add_argument("--out", type=Path, default=Path("outputs/eval_scaling"))
+    args = parser.parse_args()
+
+    worker_counts = [int(x.strip()) for x in args.workers.split(",") if x.strip()]
+    report = measure_scaling(
+        profile=AgentProfile(args.profile),
+        seeds=parse_seed_spec(args.seeds),
+        out_dir=args.out,
+        worker_counts=worker_counts,
+    )
+
+    args.out.mkdir(parents=True, exist_ok=True)
+    (args.out / "scaling_report.json").write_text(canonical_dumps(report.to_json()), encoding="utf-8")
+    print(report.to_markdown())
+    print(f"Outputs identical across worker counts: {report.outputs_identical}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
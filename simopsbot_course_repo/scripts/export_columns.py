@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from learning_compiler.eval.columnar import ColumnarEval
+from learning_compiler.eval.columnar_format import TABLES
+from learning_compiler.eval.columnar_writer import export_columns
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Export an eval dir (results + journals) as columnar .npy arrays.")
+    parser.add_argument("eval_dir", type=Path)
+    parser.add_argument("--out", type=Path, default=None, help="Columns dir (default: EVAL_DIR/columns).")
+    parser.add_argument(
+        "--breakdown", action="store_true", help="Print per-incident metrics computed from the columns (needs NumPy)."
+    )
+    args = parser.parse_args()
+
+    out = export_columns(args.eval_dir, out_dir=args.out)
+    cols = ColumnarEval(out)
+    print(f"Wrote {out}: " + ", ".join(f"{table}={cols.rows(table)}" for table in TABLES))
+    if args.breakdown:
+        # NumPy is only needed here.
+        from learning_compiler.eval.columnar_arrays import incident_breakdown
+
+        for incident, metrics in incident_breakdown(cols).items():
+            print()
+            print(f"## {incident}")
+            print(metrics.to_markdown())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from learning_compiler.sim.fault_schedule import (
+    FaultSchedule,
+    build_fault_schedule,
+    load_fault_schedule,
+    write_fault_schedule,
+)
+from learning_compiler.utils.rng import RngMode
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Precompute a FaultPlan's fault schedule, or summarize one."
+    )
+    parser.add_argument("--seed", type=int, default=None, help="Build the schedule of this seed's fault plan.")
+    parser.add_argument("--calls", type=int, default=100_000, help="Calls to precompute.")
+    parser.add_argument("--rng", type=str, default=RngMode.COMPAT.value, choices=[m.value for m in RngMode])
+    parser.add_argument("--out", type=Path, default=None, help="Write the built schedule here.")
+    parser.add_argument("--show", type=Path, default=None, help="Summarize an existing schedule file.")
+    args = parser.parse_args()
+
+    if (args.seed is None) == (args.show is None):
+        parser.error("pass exactly one of --seed or --show")
+    if args.show is not None:
+        schedule = load_fault_schedule(args.show)
+    else:
+        schedule = build_fault_schedule(seed=args.seed, calls=args.calls, rng_mode=RngMode(args.rng))
+        if args.out is not None:
+            write_fault_schedule(args.out, schedule)
+            print(f"Wrote {args.out}")
+    print(_summary(schedule))
+    return 0
+
+
+def _summary(schedule: FaultSchedule) -> str:
+    lines = [f"{len(schedule)} calls"]
+    lines.append("| Tool | " + " | ".join(k.value for k in schedule.counts()) + " |")
+    lines.append("|---|" + "---:|" * len(schedule.counts()))
+    rows = {"(all)": schedule.counts()}
+    if schedule.tools:
+        rows.update({t.value: c for t, c in schedule.breakdown().items()})
+    for name, counts in rows.items():
+        lines.append(f"| {name} | " + " | ".join(str(n) for n in counts.values()) + " |")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
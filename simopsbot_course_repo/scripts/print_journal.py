@@ -1,26 +1,94 @@
 from __future__ import annotations
 
 import argparse
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
-from learning_compiler.journal.reader import read_journal
+from learning_compiler.journal.index import JournalIndex, index_path
+from learning_compiler.journal.models import JournalEvent, JournalKind
+from learning_compiler.journal.reader import iter_journal
+from learning_compiler.journal.tail import follow_journal, is_plain_jsonl, journal_end, tail_journal
 from learning_compiler.types import JSONValue
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser(description="Pretty-print a SimOpsBot JSONL run journal.")
+    parser = argparse.ArgumentParser(
+        description="Pretty-print a SimOpsBot run journal (JSONL, gzip/xz JSONL or binary)."
+    )
     parser.add_argument("path", type=Path)
+    parser.add_argument("--kind", type=str, default=None, choices=[k.value for k in JournalKind])
+    parser.add_argument("--step", type=int, default=None, help="Only events of this step.")
+    parser.add_argument("--event", type=str, default=None, help="Only the event with this ID.")
+    parser.add_argument("--tail", type=int, default=None, metavar="N", help="Only the last N (matching) events.")
+    parser.add_argument(
+        "--follow",
+        action="store_true",
+        help="Keep printing events as they are appended, like tail -f (plain JSONL only; Ctrl-C to stop).",
+    )
     args = parser.parse_args()
+    if args.event is not None and (args.tail is not None or args.follow):
+        parser.error("--event can't be combined with --tail or --follow")
+    if args.follow and not is_plain_jsonl(args.path):
+        parser.error("--follow needs a plain JSONL journal")
 
-    events = read_journal(args.path)
-    for e in events:
-        header = f"[step {e.step_id:02d}] {e.kind.value}  id={e.event_id}"
-        print(header)
-        print(_indent(_pretty_payload(e.payload), prefix="  "))
-        print()
+    kind = JournalKind(args.kind) if args.kind is not None else None
+    kinds = [kind] if kind is not None else []
+    if not args.follow:
+        if args.tail is not None:
+            events: Iterable[JournalEvent] = tail_journal(args.path, args.tail, kinds=kinds, step_id=args.step)
+        else:
+            events = _select(args.path, kind=kind, step_id=args.step, event_id=args.event)
+        for e in events:
+            _print_event(e)
+        return 0
+
+    # Print the tail up to the last complete line, then follow from that boundary.
+    offset = 0
+    if args.tail is not None and args.path.exists():
+        offset = journal_end(args.path)
+        for e in tail_journal(args.path, args.tail, kinds=kinds, step_id=args.step, end=offset):
+            _print_event(e)
+    try:
+        for e in follow_journal(args.path, offset=offset, kinds=kinds, step_id=args.step):
+            _print_event(e)
+    except KeyboardInterrupt:
+        pass
     return 0
 
 
+def _print_event(e: JournalEvent) -> None:
+    print(f"[step {e.step_id:02d}] {e.kind.value}  id={e.event_id}")
+    print(_indent(_pretty_payload(e.payload), prefix="  "))
+    print(flush=True)
+
+
+def _select(
+    path: Path, *, kind: JournalKind | None, step_id: int | None, event_id: str | None
+) -> Iterator[JournalEvent]:
+    # With a sidecar index only the matching lines are read; otherwise filter a streamed read.
+    events: Iterable[JournalEvent]
+    if index_path(path).exists():
+        index = JournalIndex.load(path)
+        if event_id is not None:
+            found = index.get(event_id)
+            events = [found] if found is not None else []
+        elif step_id is not None:
+            events = index.by_step(step_id, kind=kind)
+        elif kind is not None:
+            events = index.by_kind(kind)
+        else:
+            events = iter_journal(path)
+    else:
+        events = iter_journal(path)
+    return (
+        e
+        for e in events
+        if (kind is None or e.kind is kind)
+        and (step_id is None or e.step_id == step_id)
+        and (event_id is None or e.event_id == event_id)
+    )
+
+
 def _pretty_payload(payload: dict[str, JSONValue]) -> str:
     # Keep it simple: deterministic-ish repr.
     lines: list[str] = []
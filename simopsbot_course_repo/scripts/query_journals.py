@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from learning_compiler.eval.journal_io import journal_paths
+from learning_compiler.eval.query import aggregate_query, iter_query
+from learning_compiler.eval.query_aggregate import FACETS
+from learning_compiler.eval.query_filter import FieldPredicate, JournalQuery
+from learning_compiler.journal.models import JournalKind
+from learning_compiler.types import IncidentType
+from learning_compiler.utils.json import canonical_dumps
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Query events across many run journals (eval dirs, runs dirs, journal stores, files)."
+    )
+    parser.add_argument("paths", type=Path, nargs="+")
+    parser.add_argument("--kind", action="append", default=[], choices=[k.value for k in JournalKind])
+    parser.add_argument("--step", type=int, default=None)
+    parser.add_argument("--tool", type=str, default=None, help="e.g. rollback, get_metrics")
+    parser.add_argument("--service", type=str, default=None, help="e.g. api, db")
+    parser.add_argument("--incident", type=str, default=None, choices=[i.value for i in IncidentType])
+    parser.add_argument(
+        "--where",
+        action="append",
+        default=[],
+        metavar="PATH OP VALUE",
+        help="Payload predicate, e.g. 'attempts.error_type=ToolTimeout' or 'observation.latency_ms>500'.",
+    )
+    parser.add_argument(
+        "--group-by",
+        action="append",
+        default=[],
+        metavar="KEY",
+        help=f"Aggregate instead of listing; KEY is {', '.join(FACETS)} or a payload path.",
+    )
+    parser.add_argument("--mean", action="append", default=[], metavar="PATH", help="Mean of a payload field.")
+    parser.add_argument("--json", action="store_true", help="Aggregates as JSON lines instead of a table.")
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    try:
+        where = tuple(FieldPredicate.parse(spec) for spec in args.where)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.mean and not args.group_by:
+        parser.error("--mean needs --group-by")
+    query = JournalQuery(
+        kinds=frozenset(JournalKind(k) for k in args.kind),
+        step_id=args.step,
+        tool=args.tool,
+        service=args.service,
+        incident=IncidentType(args.incident) if args.incident is not None else None,
+        where=where,
+    )
+    journals = journal_paths(args.paths)
+
+    if not args.group_by:
+        # Stream matches as JSON lines as journals are scanned.
+        for match in iter_query(query, journals=journals, workers=args.workers):
+            print(canonical_dumps(match.to_json()))
+        return 0
+
+    aggregate = aggregate_query(
+        query, journals=journals, group_by=args.group_by, means=args.mean, workers=args.workers
+    )
+    if args.json:
+        for row in aggregate.rows():
+            print(canonical_dumps(row))
+    else:
+        print(aggregate.to_markdown())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
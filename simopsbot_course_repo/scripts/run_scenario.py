@@ -5,7 +5,12 @@ from pathlib import Path
 
 from learning_compiler.agent.loop import run_agent
 from learning_compiler.agent.state import AgentProfile, AgentRunConfig
+from learning_compiler.journal.models import JournalFormat
+from learning_compiler.journal.writer import FlushPolicy, JournalDurability
+from learning_compiler.sim.fault_schedule import load_fault_schedule, write_fault_schedule
+from learning_compiler.sim.faults import FaultPlan
 from learning_compiler.types import IncidentType
+from learning_compiler.utils.rng import RngMode
 
 
 def main() -> int:
@@ -20,14 +25,64 @@ def main() -> int:
         choices=[i.value for i in IncidentType],
         help="Optional incident override (mostly for eval debugging).",
     )
+    parser.add_argument(
+        "--journal-flush",
+        type=str,
+        default=FlushPolicy.BYTES.value,
+        choices=[p.value for p in FlushPolicy],
+        help="When journal events reach the file (use 'event' to tail a live run).",
+    )
+    parser.add_argument("--fsync", action="store_true", help="fsync the journal on every flush.")
+    parser.add_argument(
+        "--journal-format", type=str, default=JournalFormat.JSONL.value, choices=[f.value for f in JournalFormat]
+    )
+    parser.add_argument(
+        "--journal-index",
+        action="store_true",
+        help="Also write a byte-offset sidecar (.idx) for random access (plain JSONL only).",
+    )
+    parser.add_argument(
+        "--rng",
+        type=str,
+        default=RngMode.COMPAT.value,
+        choices=[m.value for m in RngMode],
+        help="'counter' makes every random draw a pure function of (seed, stream, draw index).",
+    )
+    parser.add_argument(
+        "--fault-schedule",
+        type=Path,
+        default=None,
+        help="Replay tool faults from a schedule file instead of drawing them.",
+    )
+    parser.add_argument(
+        "--record-faults",
+        type=Path,
+        default=None,
+        help="Write the run's tool faults (with tools) as a schedule file.",
+    )
     args = parser.parse_args()
 
     profile = AgentProfile(args.profile)
-    cfg = AgentRunConfig(seed=args.seed, profile=profile)
+    durability = JournalDurability(flush=FlushPolicy(args.journal_flush), fsync=args.fsync)
+    cfg = AgentRunConfig(
+        seed=args.seed,
+        profile=profile,
+        durability=durability,
+        journal_format=JournalFormat(args.journal_format),
+        journal_index=args.journal_index,
+        rng_mode=RngMode(args.rng),
+    )
     incident = IncidentType(args.incident) if args.incident is not None else None
+    schedule = load_fault_schedule(args.fault_schedule) if args.fault_schedule is not None else None
+    faults = FaultPlan(
+        seed=cfg.seed, rng_mode=cfg.rng_mode, schedule=schedule, record=args.record_faults is not None
+    )
 
-    result = run_agent(config=cfg, out_dir=args.out, incident_override=incident)
+    result = run_agent(config=cfg, out_dir=args.out, incident_override=incident, fault_plan=faults)
     print(result.to_json())
+    if args.record_faults is not None:
+        write_fault_schedule(args.record_faults, faults.recorded())
+        print(f"Wrote {args.record_faults}")
     return 0
 
 
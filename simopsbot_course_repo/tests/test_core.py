@@ -1,5 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import gzip
+import json
+import lzma
+import math
+import random
+import shutil
+import threading
+import time
+from contextlib import suppress
 from pathlib import Path
 
 import pytest
@@ -8,8 +19,63 @@ from learning_compiler.agent.loop import run_agent
 from learning_compiler.agent.policy import Policy, PolicyDecision
 from learning_compiler.agent.state import AgentProfile, AgentRunConfig
 from learning_compiler.agent.actions import ActRollback
+from learning_compiler.agent.deciders import LLMBasedDecider
 from learning_compiler.agent.validator import ActionValidationError, parse_action_proposal
-from learning_compiler.types import IncidentType
+from learning_compiler.bench.baseline import compare_to_baseline
+from learning_compiler.bench.suite import BenchCell
+from learning_compiler.bench.world_history import bench_world_history
+from learning_compiler.eval.async_runner import run_eval_async
+from learning_compiler.eval.cache import CacheStats, ResultCache
+from learning_compiler.eval.diff import ChangeOp, DiffStatus, EventChange, iter_diffs, pair_journals
+from learning_compiler.eval.columnar import ColumnarEval
+from learning_compiler.eval.columnar_writer import export_columns
+from learning_compiler.eval.matrix import run_matrix
+from learning_compiler.eval.metrics import compute_metrics
+from learning_compiler.eval.options import EvalOptions, run_eval_options
+from learning_compiler.eval.journal_io import journal_paths
+from learning_compiler.eval.query import aggregate_query, iter_query
+from learning_compiler.eval.query_filter import FieldPredicate, JournalQuery
+from learning_compiler.eval.runner import run_eval
+from learning_compiler.eval.scenario_generator import incident_for_seed
+from learning_compiler.eval.seeds import parse_seed_spec, shard_seeds
+from learning_compiler.eval.sequential import EarlyStopConfig, StopBasis
+from learning_compiler.eval.shards import merge_shards, write_shard_manifest
+from learning_compiler.journal.convert import convert_journal
+from learning_compiler.journal.index import JournalIndex, index_path, tally_journal
+from learning_compiler.journal.models import JournalFormat, JournalKind, JournalParseError
+from learning_compiler.journal.reader import iter_journal, read_journal
+from learning_compiler.journal.scan import JournalScanner, has_unsafe_action, scan_journals
+from learning_compiler.journal.store import STORE_FILE, JournalStore
+from learning_compiler.journal.tail import follow_journal, iter_reverse_lines, journal_end, tail_journal
+from learning_compiler.journal.writer import FlushPolicy, JournalDurability, RunJournalWriter
+from learning_compiler.journal.tally import tally_events
+from learning_compiler.llm.fake_model import AsyncFakeLLM, FakeLLM
+from learning_compiler.sim.fault_schedule import (
+    build_fault_schedule,
+    load_fault_schedule,
+    write_fault_schedule,
+)
+from learning_compiler.sim.faults import (
+    FaultKind,
+    FaultPlan,
+    FaultProfile,
+    ToolError,
+    ToolPermanentError,
+    ToolTimeout,
+)
+from learning_compiler.sim.tools import RawSimTools
+from learning_compiler.sim.world import SimWorld, WorldConfig
+from learning_compiler.types import (
+    IdempotencyKey,
+    IncidentType,
+    JSONValue,
+    RunId,
+    ScenarioSeed,
+    ServiceName,
+    ToolName,
+)
+from learning_compiler.utils.json import canonical_dumps
+from learning_compiler.utils.rng import CounterRandom, RngMode
 
 
 def test_action_validator_parses_valid_restart() -> None:
@@ -46,3 +112,696 @@ def test_run_is_deterministic(tmp_path: Path) -> None:
     j1 = Path(r1.journal_path).read_text(encoding="utf-8")
     j2 = Path(r2.journal_path).read_text(encoding="utf-8")
     assert j1 == j2
+
+
+def test_injected_decider_drives_the_session(tmp_path: Path) -> None:
+    cfg = AgentRunConfig(seed=7, profile=AgentProfile.WEEK5)
+    default = run_agent(config=cfg, out_dir=tmp_path / "default")
+    decider = LLMBasedDecider(llm=FakeLLM(seed=7), scrub_untrusted=True)
+    injected = run_agent(config=cfg, out_dir=tmp_path / "injected", decider=decider)
+    assert Path(injected.journal_path).read_bytes() == Path(default.journal_path).read_bytes()
+
+
+def test_journal_flush_policies_write_identical_bytes(tmp_path: Path) -> None:
+    outputs: dict[FlushPolicy, bytes] = {}
+    for policy in FlushPolicy:
+        path = tmp_path / f"{policy.value}.jsonl"
+        durability = JournalDurability(flush=policy, flush_bytes=250)
+        with RunJournalWriter(path, run_id=RunId("run"), durability=durability) as journal:
+            for step in (1, 1, 2):
+                payload = {"n": step, "text": "é" * 40}
+                journal.log(step_id=step, kind=JournalKind.OBSERVATION, payload=payload)
+            on_disk = len(path.read_bytes().splitlines())
+            assert on_disk == {"event": 3, "step": 2, "close": 0, "bytes": 2}[policy.value]
+        outputs[policy] = path.read_bytes()
+
+    assert len(set(outputs.values())) == 1
+    eager = JournalDurability(flush=FlushPolicy.EVENT, fsync=True)
+    config = AgentRunConfig(seed=3, profile=AgentProfile.WEEK5)
+    buffered = run_agent(config=config, out_dir=tmp_path / "a")
+    eager_run = run_agent(config=dataclasses.replace(config, durability=eager), out_dir=tmp_path / "b")
+    assert buffered.journal_path.read_bytes() == eager_run.journal_path.read_bytes()
+
+
+def test_binary_journals_convert_losslessly(tmp_path: Path) -> None:
+    seeds = list(range(6))
+    text = run_eval(profile=AgentProfile.WEEK5, seeds=seeds, out_dir=tmp_path / "jsonl")
+    binary = run_eval(
+        profile=AgentProfile.WEEK5, seeds=seeds, out_dir=tmp_path / "binary", journal_format=JournalFormat.BINARY
+    )
+    assert binary.metrics == text.metrics
+
+    for t, b in zip(text.results, binary.results, strict=True):
+        assert b.journal_path.suffix == ".sojb"
+        assert read_journal(b.journal_path) == read_journal(t.journal_path)
+        assert b.journal_path.stat().st_size * 5 < t.journal_path.stat().st_size
+
+        back = tmp_path / "back.jsonl"
+        convert_journal(b.journal_path, back, to=JournalFormat.JSONL)
+        assert back.read_bytes() == t.journal_path.read_bytes()
+        again = tmp_path / "again.sojb"
+        convert_journal(back, again, to=JournalFormat.BINARY)
+        assert again.read_bytes() == b.journal_path.read_bytes()
+
+
+def test_compressed_journals_hold_canonical_bytes(tmp_path: Path) -> None:
+    seeds = [0, 1, 2]
+    plain = run_eval(profile=AgentProfile.WEEK4, seeds=seeds, out_dir=tmp_path / "plain")
+    codecs = ((JournalFormat.JSONL_GZIP, gzip.decompress), (JournalFormat.JSONL_XZ, lzma.decompress))
+    for fmt, decompress in codecs:
+        packed = run_eval(profile=AgentProfile.WEEK4, seeds=seeds, out_dir=tmp_path / fmt, journal_format=fmt)
+        again = run_eval(profile=AgentProfile.WEEK4, seeds=seeds, out_dir=tmp_path / "again", journal_format=fmt)
+        assert packed.metrics == plain.metrics
+        for p, c, a in zip(plain.results, packed.results, again.results, strict=True):
+            assert c.journal_path.name.endswith(fmt.suffix)
+            assert decompress(c.journal_path.read_bytes()) == p.journal_path.read_bytes()
+            assert c.journal_path.read_bytes() == a.journal_path.read_bytes()
+            assert read_journal(c.journal_path) == read_journal(p.journal_path)
+
+
+def test_journal_index_serves_random_access_reads(tmp_path: Path) -> None:
+    for seed in range(4):
+        cfg = AgentRunConfig(seed=seed, profile=AgentProfile.WEEK5, journal_index=True)
+        path = run_agent(config=cfg, out_dir=tmp_path).journal_path
+        events = read_journal(path)
+        index = JournalIndex.load(path)
+        assert index.entries == JournalIndex.build(path).entries
+        assert index.by_kind(JournalKind.FINAL) == [e for e in events if e.kind is JournalKind.FINAL]
+        assert index.by_step(2) == [e for e in events if e.step_id == 2]
+        assert index.get(events[-1].event_id) == events[-1]
+        assert index.get("nope") is None
+        assert tally_journal(path) == tally_events(events)
+
+    with path.open("ab") as fp:
+        fp.write(b"\n")
+    with pytest.raises(JournalParseError):
+        JournalIndex.load(path)
+    index_path(path).unlink()
+    assert tally_journal(path) == tally_events(events)
+
+
+def test_trusted_iter_journal_matches_validated_read(tmp_path: Path) -> None:
+    report = run_eval(profile=AgentProfile.WEEK5, seeds=[0, 1, 2], out_dir=tmp_path)
+    for r in report.results:
+        assert list(iter_journal(r.journal_path, validate=False)) == read_journal(r.journal_path)
+
+    bad = tmp_path / "bad.jsonl"
+    good_line = r.journal_path.read_text(encoding="utf-8").splitlines()[0]
+    # A list payload is a schema violation only full validation catches.
+    listed = good_line.replace('"payload":{', '"payload":[{', 1).replace(',"run_id"', '],"run_id"', 1)
+    bad.write_text(listed + "\n", encoding="utf-8")
+    assert len(list(iter_journal(bad, validate=False))) == 1
+    with pytest.raises(JournalParseError):
+        read_journal(bad)
+    bad.write_text('{"event_id":"x"}\n', encoding="utf-8")
+    with pytest.raises(JournalParseError):
+        list(iter_journal(bad, validate=False))
+
+
+def test_journal_store_eval_matches_file_journals(tmp_path: Path) -> None:
+    seeds = list(range(6))
+    files = run_eval(profile=AgentProfile.WEEK5, seeds=seeds, out_dir=tmp_path / "files")
+    stored = run_eval(profile=AgentProfile.WEEK5, seeds=seeds, out_dir=tmp_path / "store", journal_store=True)
+    assert not (tmp_path / "store" / "runs").exists()
+    assert stored.metrics == files.metrics
+
+    store_path = tmp_path / "store" / STORE_FILE
+    with JournalStore(store_path) as store:
+        assert store.journals() == sorted(r.journal_path.name for r in files.results)
+    for f, s in zip(files.results, stored.results, strict=True):
+        assert s.journal_path == store_path / f.journal_path.name
+        assert read_journal(s.journal_path) == read_journal(f.journal_path)
+        exported = tmp_path / f.journal_path.name
+        convert_journal(s.journal_path, exported, to=JournalFormat.JSONL)
+        assert exported.read_bytes() == f.journal_path.read_bytes()
+
+    # Resume checks journals inside the store, and a parallel rerun appends to it.
+    summary = (tmp_path / "store" / "eval_summary.json").read_bytes()
+    run_eval(
+        profile=AgentProfile.WEEK5, seeds=seeds, out_dir=tmp_path / "store", resume=True, journal_store=True
+    )
+    assert (tmp_path / "store" / "eval_summary.json").read_bytes() == summary
+    parallel = run_eval(
+        profile=AgentProfile.WEEK5, seeds=seeds, out_dir=tmp_path / "pool", workers=3, journal_store=True
+    )
+    assert parallel.metrics == files.metrics
+
+
+def test_journal_scanner_filters_kinds_without_decoding(tmp_path: Path) -> None:
+    report = run_eval(profile=AgentProfile.WEEK5, seeds=list(range(4)), out_dir=tmp_path)
+    kinds = {JournalKind.ACTION, JournalKind.FINAL}
+    for r in report.results:
+        events = read_journal(r.journal_path)
+        with JournalScanner(r.journal_path) as scanner:
+            assert list(scanner.events()) == events
+            assert list(scanner.events(kinds)) == [e for e in events if e.kind in kinds]
+            views = list(scanner.lines([JournalKind.FINAL]))
+            assert [bytes(v) for v in views] == r.journal_path.read_bytes().splitlines()[-1:]
+            for v in views:
+                v.release()
+        assert r.metrics is not None
+        assert has_unsafe_action(r.journal_path) is r.metrics.unsafe_action_executed
+
+    # A kind marker quoted inside a payload is not the event's kind.
+    path = tmp_path / "unsafe.jsonl"
+    with RunJournalWriter(path, run_id=RunId("run")) as journal:
+        note: dict[str, JSONValue] = {"note": '","kind":"action"'}
+        journal.log(step_id=1, kind=JournalKind.OBSERVATION, payload=note)
+        rollback: dict[str, JSONValue] = {"action": {"type": "ACT_ROLLBACK", "service": "db"}}
+        journal.log(step_id=1, kind=JournalKind.ACTION, payload=rollback)
+    assert [e.step_id for e in scan_journals([path], kinds=[JournalKind.ACTION])] == [1]
+    assert has_unsafe_action(path)
+
+
+def test_journal_tail_and_follow_match_full_read(tmp_path: Path) -> None:
+    plain = run_eval(profile=AgentProfile.WEEK5, seeds=[4], out_dir=tmp_path / "plain").results[0].journal_path
+    packed = run_eval(
+        profile=AgentProfile.WEEK5, seeds=[4], out_dir=tmp_path / "gz", journal_format=JournalFormat.JSONL_GZIP
+    ).results[0].journal_path
+    events = read_journal(plain)
+    data = plain.read_bytes()
+    assert list(iter_reverse_lines(plain, block_size=7)) == data.splitlines()[::-1]
+    for path in (plain, packed):
+        assert tail_journal(path, 3) == events[-3:]
+        assert tail_journal(path, 2, kinds=[JournalKind.OBSERVATION]) == [
+            e for e in events if e.kind is JournalKind.OBSERVATION
+        ][-2:]
+        assert tail_journal(path, 100, step_id=2) == [e for e in events if e.step_id == 2]
+
+    # A line still being written is neither tailed nor followed until its newline lands.
+    live = tmp_path / "live.jsonl"
+    cut = data.rindex(b"\n", 0, len(data) // 2) + 1
+    live.write_bytes(data[: cut + 10])
+    assert journal_end(live) == cut
+    assert tail_journal(live, 1) == [events[data[:cut].count(b"\n") - 1]]
+
+    def append_rest() -> None:
+        time.sleep(0.05)
+        with live.open("ab") as fp:
+            fp.write(data[cut + 10 : cut + 30])
+            fp.flush()
+            time.sleep(0.05)
+            fp.write(data[cut + 30 :])
+
+    writer = threading.Thread(target=append_rest)
+    writer.start()
+    followed = list(follow_journal(live, poll_seconds=0.01, idle_timeout=0.5))
+    writer.join()
+    assert followed == events
+
+
+def test_journal_query_matches_brute_force_filter(tmp_path: Path) -> None:
+    seeds = list(range(30))
+    report = run_eval(profile=AgentProfile.WEEK4, seeds=seeds, out_dir=tmp_path / "files")
+    run_eval(profile=AgentProfile.WEEK4, seeds=seeds, out_dir=tmp_path / "store", journal_store=True)
+
+    timeout = FieldPredicate.parse("attempts.error_type=ToolTimeout")
+    query = JournalQuery(kinds=frozenset({JournalKind.ACTION}), tool="rollback", where=(timeout,))
+    expected = [
+        (r.seed, e.event_id)
+        for r in report.results
+        for e in read_journal(r.journal_path)
+        if e.kind is JournalKind.ACTION
+        and '"type": "ACT_ROLLBACK"' in repr(e.payload).replace("'", '"')
+        and '"error_type": "ToolTimeout"' in repr(e.payload).replace("'", '"')
+    ]
+    assert expected
+    for source in ("files", "store"):
+        journals = journal_paths([tmp_path / source])
+        for workers in (1, 3):
+            matches = iter_query(query, journals=journals, workers=workers)
+            assert [(m.run.seed, m.event.event_id) for m in matches] == expected
+
+    journals = journal_paths([tmp_path / "files"])
+    by_tool = aggregate_query(
+        JournalQuery(), journals=journals, group_by=["tool"], means=["observation.latency_ms"], workers=3
+    )
+    assert by_tool.rows() == aggregate_query(
+        JournalQuery(), journals=journals, group_by=["tool"], means=["observation.latency_ms"]
+    ).rows()
+    # Read-only tools fail only through ERROR events; side effects also fail inside ACTION events.
+    only_errors = JournalQuery(kinds=frozenset({JournalKind.ERROR}))
+    error_rows = aggregate_query(only_errors, journals=journals, group_by=["tool"]).rows()
+    side_effects = {"restart", "rollback", None}
+    assert {row["tool"]: row["count"] for row in error_rows if row["tool"] not in side_effects} == {
+        row["tool"]: row["errors"] for row in by_tool.rows() if row["tool"] not in side_effects
+    }
+
+
+def test_columnar_export_round_trips_results_and_journals(tmp_path: Path) -> None:
+    report = run_eval(profile=AgentProfile.WEEK4, seeds=list(range(12)), out_dir=tmp_path)
+    cols = ColumnarEval(export_columns(tmp_path))
+
+    assert cols.rows("results") == len(report.results)
+    assert list(cols.raw("results", "seed")) == [r.seed for r in report.results]
+    assert list(cols.decoded("results", "status")) == [r.status.value for r in report.results]
+    starts = cols.raw("results", "events_start")
+    for run, r in enumerate(report.results):
+        events = read_journal(r.journal_path)
+        assert starts[run + 1] - starts[run] == len(events)
+        assert cols.text("events", "payload", int(starts[run])) == canonical_dumps(events[0].payload)
+        assert cols.text("results", "journal", run) == str(r.journal_path)
+    latency = [x for x in cols.raw("observations", "latency_ms") if not math.isnan(x)]
+    observations = [
+        e.payload["observation"]
+        for r in report.results
+        for e in read_journal(r.journal_path)
+        if e.kind in (JournalKind.OBSERVATION, JournalKind.VERIFY)
+    ]
+    assert len(latency) == sum(1 for o in observations if isinstance(o, dict) and "latency_ms" in o)
+
+    # An empty eval exports zero-row columns of every dtype, bools included.
+    (tmp_path / "empty").mkdir()
+    (tmp_path / "empty" / "results.jsonl").write_text("", encoding="utf-8")
+    empty = ColumnarEval(export_columns(tmp_path / "empty"))
+    assert empty.rows("results") == 0
+    assert list(empty.raw("results", "verified")) == list(empty.raw("observations", "latency_ms")) == []
+    assert list(empty.raw("results", "events_start")) == [0]
+
+
+def test_columnar_metrics_match_compute_metrics(tmp_path: Path) -> None:
+    np = pytest.importorskip("numpy")
+    from learning_compiler.eval.columnar_arrays import column, columnar_metrics, incident_breakdown
+
+    report = run_eval(profile=AgentProfile.WEEK5, seeds=list(range(15)), out_dir=tmp_path)
+    cols = ColumnarEval(export_columns(tmp_path))
+    assert isinstance(column(cols, "results", "seed"), np.memmap)
+    assert columnar_metrics(cols) == report.metrics
+    by_incident = incident_breakdown(cols)
+    for incident, metrics in by_incident.items():
+        runs = [r for r in report.results if incident_for_seed(r.seed).value == incident]
+        assert metrics == compute_metrics(results=runs)
+
+
+def test_diff_evals_finds_first_divergent_step(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    seeds = list(range(8))
+    left = run_eval(profile=AgentProfile.WEEK5, seeds=seeds, out_dir=tmp_path / "left")
+    run_eval(profile=AgentProfile.WEEK5, seeds=seeds, out_dir=tmp_path / "store", journal_store=True)
+    left_journals = journal_paths([tmp_path / "left"])
+
+    # Identical runs are confirmed from line bytes alone, stored or not.
+    def no_decode(*args: object, **kwargs: object) -> object:
+        raise AssertionError("decoded JSON")
+
+    pairs = pair_journals(left_journals, journal_paths([tmp_path / "store"]))
+    with monkeypatch.context() as m:
+        m.setattr(json, "loads", no_decode)
+        assert [d.status for d in iter_diffs(pairs)] == [DiffStatus.IDENTICAL] * len(seeds)
+
+    edited = tmp_path / "edited"
+    shutil.copytree(tmp_path / "left" / "runs", edited)
+    binary, changed, missing = (edited / left.results[i].journal_path.name for i in (1, 3, 5))
+    convert_journal(binary, binary.with_suffix(".sojb"), to=JournalFormat.BINARY)
+    binary.unlink()
+    missing.unlink()
+    lines = changed.read_bytes().splitlines()
+    at = next(i for i, line in enumerate(lines) if b'"kind":"action"' in line)
+    event = json.loads(lines[at])
+    event["payload"]["note"] = "edited"
+    lines[at] = canonical_dumps(event).encode("utf-8")
+    changed.write_bytes(b"\n".join(lines) + b"\n")
+    index = sum(1 for line in lines[:at] if json.loads(line)["step_id"] == event["step_id"])
+
+    pairs = pair_journals(left_journals, journal_paths([edited]))
+    diffs = {d.run: d for d in iter_diffs(pairs)}
+    assert list(iter_diffs(pairs, workers=2)) == list(diffs.values())
+    statuses = [d.status for d in diffs.values()]
+    assert statuses.count(DiffStatus.IDENTICAL) == len(seeds) - 2
+    assert diffs[missing.stem].status is DiffStatus.ONLY_LEFT
+    diverged = diffs[changed.stem]
+    assert diverged.status is DiffStatus.DIVERGED
+    assert (diverged.step_id, diverged.divergent_steps) == (event["step_id"], 1)
+    assert diverged.changes == (EventChange(index=index, path="payload.note", op=ChangeOp.ADDED, right="edited"),)
+    assert "payload.note: added" in diverged.describe()
+
+
+def test_parallel_eval_matches_serial(tmp_path: Path) -> None:
+    seeds = list(range(6))
+    run_eval(profile=AgentProfile.WEEK5, seeds=seeds, out_dir=tmp_path / "serial")
+    run_eval(profile=AgentProfile.WEEK5, seeds=seeds, out_dir=tmp_path / "parallel", workers=3)
+
+    for name in ("eval_summary.json", "results.jsonl"):
+        serial = (tmp_path / "serial" / name).read_text(encoding="utf-8")
+        parallel = (tmp_path / "parallel" / name).read_text(encoding="utf-8")
+        assert serial.replace("serial", "parallel") == parallel
+    for journal in (tmp_path / "serial" / "runs").iterdir():
+        assert journal.read_bytes() == (tmp_path / "parallel" / "runs" / journal.name).read_bytes()
+
+
+def test_tallied_run_metrics_match_journal_replay(tmp_path: Path) -> None:
+    report = run_eval(profile=AgentProfile.WEEK5, seeds=list(range(6)), out_dir=tmp_path)
+    replayed = [dataclasses.replace(r, metrics=None) for r in report.results]
+    assert compute_metrics(results=replayed) == report.metrics
+    for r in report.results:
+        assert r.metrics == tally_events(read_journal(r.journal_path))
+
+
+def test_result_cache_serves_hits_with_identical_outputs(tmp_path: Path) -> None:
+    cache = ResultCache(tmp_path / "cache")
+    fresh = run_eval(profile=AgentProfile.WEEK4, seeds=[0, 1, 2], out_dir=tmp_path / "a", cache=cache)
+    cached = run_eval(profile=AgentProfile.WEEK4, seeds=[0, 1, 2, 3], out_dir=tmp_path / "b", cache=cache)
+
+    assert fresh.cache_stats == CacheStats(hits=0, misses=3, evicted=0)
+    assert cached.cache_stats == CacheStats(hits=3, misses=1, evicted=0)
+    for r in fresh.results:
+        assert r.journal_path.read_bytes() == (tmp_path / "b" / "runs" / r.journal_path.name).read_bytes()
+    assert [r.metrics for r in cached.results[:3]] == [r.metrics for r in fresh.results]
+
+    # An early stop closes the cached results mid-stream; the size cap still holds.
+    tiny = ResultCache(tmp_path / "tiny", max_bytes=1)
+    early = run_eval(
+        profile=AgentProfile.WEEK4,
+        seeds=list(range(40)),
+        out_dir=tmp_path / "early",
+        cache=tiny,
+        early_stop=EarlyStopConfig(confidence=0.99, min_runs=10),
+    )
+    assert early.early_stop is not None and early.cache_stats is not None
+    assert early.cache_stats.evicted == early.cache_stats.misses > 0
+    assert early.cache_stats.misses == early.early_stop.runs < 40  # runs past the stop never started
+    assert not list((tmp_path / "tiny").glob("*/*/result.json"))
+
+
+def test_shard_merge_matches_single_host(tmp_path: Path) -> None:
+    seeds = parse_seed_spec("0:7")
+    single = run_eval(profile=AgentProfile.WEEK5, seeds=seeds, out_dir=tmp_path / "single")
+
+    shard_dirs = []
+    for index in (1, 2, 3):
+        shard_dir = tmp_path / f"shard{index}"
+        run_eval(profile=AgentProfile.WEEK5, seeds=shard_seeds(seeds, index=index, count=3), out_dir=shard_dir)
+        write_shard_manifest(out_dir=shard_dir, index=index, count=3)
+        shard_dirs.append(shard_dir)
+
+    merged = merge_shards(shard_dirs=list(reversed(shard_dirs)), out_dir=tmp_path / "merged")
+    assert isinstance(shard_seeds(range(10**9), index=3, count=8), range)
+    assert list(merged.seeds) == list(single.seeds)
+    assert merged.metrics == single.metrics
+    assert [r.to_json() for r in merged.results] == [
+        dataclasses.replace(r, journal_path=tmp_path / "merged" / "runs" / r.journal_path.name).to_json()
+        for r in single.results
+    ]
+
+
+def test_async_eval_matches_sync(tmp_path: Path) -> None:
+    seeds = list(range(9))
+    sync = run_eval(profile=AgentProfile.WEEK5, seeds=seeds, out_dir=tmp_path / "sync")
+    slow = asyncio.run(
+        run_eval_async(
+            profile=AgentProfile.WEEK5,
+            seeds=seeds,
+            out_dir=tmp_path / "async",
+            concurrency=4,
+            # Uneven latencies force runs to interleave differently from seed order.
+            llm_factory=lambda seed: AsyncFakeLLM(seed=seed, latency_s=0.001 * (seed % 3)),
+        )
+    )
+
+    assert slow.metrics == sync.metrics
+    assert [r.seed for r in slow.results] == seeds
+    for r in sync.results:
+        assert r.journal_path.read_bytes() == (tmp_path / "async" / "runs" / r.journal_path.name).read_bytes()
+
+
+def test_resume_after_crash_matches_full_run(tmp_path: Path) -> None:
+    seeds = list(range(8))
+    out = tmp_path / "crashed"
+    run_eval(profile=AgentProfile.WEEK3, seeds=seeds, out_dir=out)
+    expected = {name: (out / name).read_bytes() for name in ("eval_summary.json", "results.jsonl")}
+
+    # Simulate a crash: 3 complete records, one torn write, a journal missing for seed 3.
+    lines = expected["results.jsonl"].splitlines(keepends=True)
+    (out / "results.jsonl").write_bytes(b"".join(lines[:4]) + lines[4][:20])
+    (out / "runs" / "run_seed000003_week3.jsonl").unlink()
+    (out / "eval_summary.json").unlink()
+
+    report = run_eval(profile=AgentProfile.WEEK3, seeds=seeds, out_dir=out, resume=True, retain_results=False)
+
+    assert report.results == ()
+    assert report.metrics.total_runs == len(seeds)
+    for name, content in expected.items():
+        assert (out / name).read_bytes() == content
+
+
+def test_early_stop_agrees_with_full_gate(tmp_path: Path) -> None:
+    seeds = list(range(60))
+    config = EarlyStopConfig(confidence=0.99, min_runs=10)
+    for profile in (AgentProfile.WEEK2, AgentProfile.WEEK4):
+        full = run_eval(profile=profile, seeds=seeds, out_dir=tmp_path / f"full_{profile.value}")
+        early = run_eval(profile=profile, seeds=seeds, out_dir=tmp_path / profile.value, early_stop=config)
+
+        assert early.early_stop is not None
+        assert early.gate.passed == full.gate.passed
+        assert list(early.seeds) == seeds[: early.early_stop.runs]
+        assert early.metrics.total_runs == early.early_stop.runs < len(seeds)
+
+    # Week 4 attempts an unsafe rollback early on: a hard violation stops at once.
+    assert early.early_stop is not None
+    assert early.early_stop.basis is StopBasis.CERTAIN
+
+    # A suite whose pass can't be settled early runs to the end, with the usual summary.
+    full = run_eval(profile=AgentProfile.WEEK5, seeds=seeds[:20], out_dir=tmp_path / "w5_full")
+    early = run_eval(profile=AgentProfile.WEEK5, seeds=seeds[:20], out_dir=tmp_path / "w5", early_stop=config)
+    assert early.early_stop is None
+    assert early.summary_head() == full.summary_head()
+
+
+def test_matrix_matches_per_profile_evals(tmp_path: Path) -> None:
+    seeds = list(range(9))
+    profiles = [AgentProfile.WEEK2, AgentProfile.WEEK5]
+    matrix = run_matrix(profiles=profiles, seeds=seeds, out_dir=tmp_path / "matrix", workers=2)
+
+    for profile, report in zip(profiles, matrix.reports, strict=True):
+        profile_dir = tmp_path / "matrix" / profile.value
+        from_matrix = (profile_dir / "eval_summary.json").read_bytes()
+        single = run_eval(profile=profile, seeds=seeds, out_dir=profile_dir)
+        assert report.metrics == single.metrics
+        assert (profile_dir / "eval_summary.json").read_bytes() == from_matrix
+
+    (delta,) = matrix.deltas
+    resolved = [m.recovery_success_rate for m in (r.metrics for r in matrix.reports)]
+    assert delta.delta_recovery_success_rate == pytest.approx(resolved[1] - resolved[0])
+    assert len((tmp_path / "matrix" / "paired_deltas.jsonl").read_text().splitlines()) == len(seeds)
+
+
+def test_eval_options_reject_conflicts_and_run_like_run_eval(tmp_path: Path) -> None:
+    base = EvalOptions(profile=AgentProfile.WEEK5, seeds=range(6), out_dir=tmp_path / "opts")
+    for conflicting in [
+        dataclasses.replace(base, compress="gzip", journal_format=JournalFormat.BINARY),
+        dataclasses.replace(base, profiles=(AgentProfile.WEEK2,), resume=True),
+        dataclasses.replace(base, async_concurrency=4, workers=2),
+        dataclasses.replace(base, journal_store=True, cache_dir=tmp_path / "cache"),
+    ]:
+        with pytest.raises(ValueError):
+            conflicting.validate()
+
+    printed = run_eval_options(dataclasses.replace(base, shard=(2, 2)))
+    direct = run_eval(profile=AgentProfile.WEEK5, seeds=range(3, 6), out_dir=tmp_path / "direct")
+    summary = (tmp_path / "direct" / "eval_summary.md").read_text(encoding="utf-8")
+    assert printed == f"{summary}\nGate passed: {direct.gate.passed}"
+
+
+def test_world_history_is_bounded_by_max_delay() -> None:
+    world = SimWorld(WorldConfig(seed=ScenarioSeed(1), incident=IncidentType.DB_SATURATION, max_delay_steps=2))
+    assert world.true_metrics(service="db", delay_steps=2) == (0.01, 520.0)  # clamped to t=0
+    with pytest.raises(ValueError):  # rejected before any history exists, not at t > max
+        world.true_metrics(service="db", delay_steps=5)
+    for _ in range(9):
+        world.tick()
+    world.restart(service="db")
+    assert world.true_metrics(service="db", delay_steps=0) == (0.005, 60.0)
+    assert world.true_metrics(service="db", delay_steps=2) == (0.01, 520.0)
+    with pytest.raises(ValueError):
+        world.true_metrics(service="db", delay_steps=3)
+
+    bench = bench_world_history(ticks=20_000, checkpoints=4)
+    assert bench.growth_bytes < 1024  # the old list history grew ~190 bytes per tick
+
+
+def test_forked_sim_stack_matches_from_scratch_runs() -> None:
+    def fresh() -> RawSimTools:
+        world = SimWorld(WorldConfig(seed=ScenarioSeed(11), incident=IncidentType.API_BAD_DEPLOY))
+        return RawSimTools(world=world, fault_plan=FaultPlan(seed=11), seed=11)
+
+    def call(tools: RawSimTools, op: tuple[str, ...]) -> JSONValue:
+        name, service, arg = op
+        svc: ServiceName = "api" if service == "api" else "db"
+        key = IdempotencyKey(arg)
+        out: JSONValue
+        try:
+            if name == "metrics":
+                out = tools.get_metrics(service=svc, window_minutes=5).to_json()
+            elif name == "logs":
+                out = tools.tail_logs(service=svc, n=3).to_json()
+            elif name == "health":
+                out = tools.health_check(service=svc).to_json()
+            elif name == "restart":
+                out = tools.restart(service=svc, idempotency_key=key).to_json()
+            else:
+                out = tools.rollback(service=svc, version="v1", idempotency_key=key).to_json()
+        except ToolError as e:
+            out = type(e).__name__
+        return [out, tools.world.time_index, tools.world.resolved, tools.fault_plan.call_index]
+
+    prefix = [("metrics", "api", ""), ("logs", "api", ""), ("restart", "db", "k1"), ("health", "api", "")] * 3
+    branches = [
+        [("rollback", "api", "k2"), ("metrics", "api", ""), ("health", "api", "")] * 4,
+        [("restart", "db", "k1"), ("logs", "db", ""), ("metrics", "db", "")] * 4,
+        [("metrics", "api", ""), ("rollback", "api", "k3"), ("rollback", "api", "k3")] * 4,
+    ]
+    trunk = fresh()
+    for op in prefix:
+        call(trunk, op)
+    expected = []
+    for suffix in branches:
+        replay = fresh()
+        for op in prefix:
+            call(replay, op)
+        expected.append([call(replay, op) for op in suffix])
+
+    forks = [trunk.fork() for _ in branches]
+    assert [[call(f, op) for op in suffix] for f, suffix in zip(forks, branches, strict=True)] == expected
+    # Branches never touch the stack they were forked from.
+    assert [call(trunk, op) for op in branches[0]] == expected[0]
+
+
+def test_counter_rng_draws_are_index_addressable(tmp_path: Path) -> None:
+    rng = CounterRandom(seed=5, stream="faults")
+    draws = [rng.random() for _ in range(50)]
+    assert draws == [rng.random_at(i) for i in range(50)]
+    assert rng.at(20).random() == draws[20]
+
+    plan = FaultPlan(seed=5, rng_mode=RngMode.COUNTER)
+    sequential: list[FaultKind] = []
+    for _ in range(200):
+        try:
+            plan.maybe_raise(tool=ToolName.GET_METRICS)
+            sequential.append(FaultKind.NONE)
+        except ToolTimeout:
+            sequential.append(FaultKind.TIMEOUT)
+        except ToolPermanentError:
+            sequential.append(FaultKind.PERMANENT)
+        except ToolError:
+            sequential.append(FaultKind.TRANSIENT)
+    order = list(range(1, 201))
+    random.Random(0).shuffle(order)
+    assert {n: FaultPlan(seed=5, rng_mode=RngMode.COUNTER).fault_at(n) for n in order} == dict(
+        enumerate(sequential, start=1)
+    )
+    with pytest.raises(ValueError):
+        FaultPlan(seed=5).fault_at(1)
+
+    journals: dict[str, bytes] = {}
+    for name, mode in [("c1", RngMode.COUNTER), ("c2", RngMode.COUNTER), ("compat", RngMode.COMPAT)]:
+        cfg = AgentRunConfig(seed=3, profile=AgentProfile.WEEK5, rng_mode=mode)
+        journals[name] = Path(run_agent(config=cfg, out_dir=tmp_path / name).journal_path).read_bytes()
+    assert journals["c1"] == journals["c2"]
+    assert journals["c1"] != journals["compat"]
+
+    # Both modes can share an out dir, and a journal says which mode wrote it.
+    runs = [
+        run_agent(config=AgentRunConfig(seed=3, profile=AgentProfile.WEEK5, rng_mode=m), out_dir=tmp_path / "both")
+        for m in RngMode
+    ]
+    assert len({r.run_id for r in runs}) == len({r.journal_path for r in runs}) == 2
+    assert [Path(r.journal_path).read_bytes() for r in runs] == [journals["compat"], journals["c1"]]
+    starts = [e for e in read_journal(Path(runs[1].journal_path)) if e.kind is JournalKind.STEP_START]
+    assert {e.payload.get("rng_mode") for e in starts} == {"counter"}
+
+
+def test_fault_schedule_matches_sequential_plan_and_replays(tmp_path: Path) -> None:
+    tools = list(ToolName)
+    for mode in RngMode:
+        for profile in [FaultProfile(0.08, 0.06, 0.01), FaultProfile(0.2, 0.3, 0.5)]:
+            plan = FaultPlan(seed=13, profile=profile, rng_mode=mode, record=True)
+            for i in range(3000):
+                with suppress(ToolError):
+                    plan.maybe_raise(tool=tools[i % len(tools)])
+            built = build_fault_schedule(seed=13, calls=3000, profile=profile, rng_mode=mode)
+            assert built.faults == plan.recorded().faults
+
+    path = tmp_path / "faults.json"
+    write_fault_schedule(path, plan.recorded())
+    loaded = load_fault_schedule(path)
+    assert loaded == plan.recorded()
+    breakdown = loaded.breakdown()
+    assert sum(sum(c.values()) for c in breakdown.values()) == 3000
+    assert {k: sum(c[k] for c in breakdown.values()) for k in FaultKind} == loaded.counts()
+
+    # A run replaying its own recorded faults writes the same journal.
+    cfg = AgentRunConfig(seed=4, profile=AgentProfile.WEEK5)
+    recorder = FaultPlan(seed=4, record=True)
+    first = run_agent(config=cfg, out_dir=tmp_path / "a", fault_plan=recorder)
+    replay = FaultPlan(seed=0, schedule=recorder.recorded(), record=True)
+    second = run_agent(config=cfg, out_dir=tmp_path / "b", fault_plan=replay)
+    assert Path(first.journal_path).read_bytes() == Path(second.journal_path).read_bytes()
+    assert replay.recorded() == recorder.recorded()
+    with pytest.raises(ValueError):  # recording is opt-in
+        FaultPlan(seed=4).recorded()
+
+
+def test_batch_world_matches_scalar_worlds() -> None:
+    np = pytest.importorskip("numpy")
+    from learning_compiler.sim.batch import HEALTH_REASONS, HEALTH_STATUSES, BatchSimWorld
+
+    incidents = list(IncidentType)
+    configs = [
+        WorldConfig(seed=ScenarioSeed(s), incident=incidents[s % 3], max_delay_steps=3) for s in range(60)
+    ]
+    batch = BatchSimWorld(configs)
+    worlds = [SimWorld(c) for c in configs]
+    with pytest.raises(ValueError):
+        batch.true_metrics(service="api", delay_steps=4)
+    rng = random.Random(0)
+    for _ in range(40):
+        mask = np.array([rng.random() < 0.5 for _ in worlds])
+        op = rng.choice(["tick", "restart", "rollback"])
+        service: ServiceName = rng.choice(("api", "db"))
+        version = rng.choice(["v1", "v2", "v3"])
+        if op == "tick":
+            batch.tick(mask)
+        elif op == "restart":
+            batch.restart(service=service, mask=mask)
+        else:
+            batch.rollback(service=service, version=version, mask=mask)
+        for w, selected in zip(worlds, mask.tolist(), strict=True):
+            if not selected:
+                continue
+            if op == "tick":
+                w.tick()
+            elif op == "restart":
+                w.restart(service=service)
+            else:
+                w.rollback(service=service, version=version)
+
+        assert batch.time_index.tolist() == [w.time_index for w in worlds]
+        assert batch.resolved.tolist() == [w.resolved for w in worlds]
+        for svc in ("api", "db"):
+            status, reason = batch.health(service=svc)
+            assert [(HEALTH_STATUSES[s], {"reason": HEALTH_REASONS[r]}) for s, r in zip(status, reason, strict=True)] == [
+                w.health(service=svc) for w in worlds
+            ]
+            for delay in (0, 1, 3):
+                err, lat = batch.true_metrics(service=svc, delay_steps=delay)
+                assert list(zip(err.tolist(), lat.tolist(), strict=True)) == [
+                    w.true_metrics(service=svc, delay_steps=delay) for w in worlds
+                ]
+
+
+def test_bench_compare_flags_slowdowns_only() -> None:
+    def cell(runs_per_second: float, p90: float) -> BenchCell:
+        return BenchCell(
+            profile=AgentProfile.WEEK5,
+            seeds=100,
+            workers=1,
+            wall_seconds=100 / runs_per_second,
+            runs_per_second=runs_per_second,
+            step_latency_us={"p50": p90 / 2, "p90": p90, "p99": p90 * 2},
+            peak_rss_kb=25_000,
+        )
+
+    baseline = [cell(500.0, 400.0)]
+    assert compare_to_baseline(current=[cell(480.0, 420.0)], baseline=baseline) == []
+    slow = compare_to_baseline(current=[cell(300.0, 700.0)], baseline=baseline)
+    assert [r.metric for r in slow] == ["runs_per_second", "step_latency_us.p90"]
+    assert BenchCell.from_json(baseline[0].to_json()) == baseline[0]